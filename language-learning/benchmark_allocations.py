@@ -0,0 +1,53 @@
+'''
+"benchmark_allocations.py" measures the memory that is allocated while generating cards, using `tracemalloc`.
+It loads the decks of a language script without writing them,
+then reports the peak memory that is traced while each card is generated,
+which is dominated by the tags that are stored for each node of the card's syntax trees.
+
+Usage:
+    python3 benchmark_allocations.py                 # measure 200 cards from each deck of gaulish
+    python3 benchmark_allocations.py spanish 50
+'''
+
+import sys
+import time
+import runpy
+import itertools
+import tracemalloc
+
+def measure(cards, count):
+    '''
+    Returns a list of (peak bytes, seconds) tuples, one for each of the first `count` cards within `cards`.
+    '''
+    cards = iter(cards)
+    measurements = []
+    for i in range(count):
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        start_time = time.perf_counter()
+        if next(cards, None) is None:
+            break
+        duration = time.perf_counter()-start_time
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        measurements.append((peak_bytes-start_bytes, duration))
+    return measurements
+
+if __name__ == '__main__':
+    language = sys.argv[1] if len(sys.argv) > 1 else 'gaulish'
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    script = runpy.run_path(f'inflections_for_{language}.py', run_name='benchmark')
+    tracemalloc.start()
+    total = []
+    for (filename, cards) in script['deck_scheduling'].jobs:
+        measurements = measure(cards, count)
+        total += measurements
+        if measurements:
+            print(f'{filename:60} {len(measurements):5} cards '
+                  f'{sum(peak for (peak, _) in measurements)/len(measurements)/1024:9.1f} KiB/card mean peak '
+                  f'{max(peak for (peak, _) in measurements)/1024:9.1f} KiB/card max peak '
+                  f'{1000*sum(duration for (_, duration) in measurements)/len(measurements):7.2f} ms/card')
+    tracemalloc.stop()
+    print(f'{"total":60} {len(total):5} cards '
+          f'{sum(peak for (peak, _) in total)/len(total)/1024:9.1f} KiB/card mean peak '
+          f'{max(peak for (peak, _) in total)/1024:9.1f} KiB/card max peak '
+          f'{1000*sum(duration for (_, duration) in total)/len(total):7.2f} ms/card')
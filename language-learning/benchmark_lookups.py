@@ -0,0 +1,81 @@
+'''
+"benchmark_lookups.py" measures how many dictkeys per second can be resolved by a `DictLookup`,
+comparing the general resolution of dictkeys by `DictTupleIndexing.tuplekeys()`
+against the fast path that is used when every key maps to a single value.
+
+Usage:
+    python3 benchmark_lookups.py
+    python3 benchmark_lookups.py data/inflection/indo-european/romance/latin/classical/finite-conjugations.tsv
+'''
+
+import sys
+import time
+import itertools
+
+from tools.inflections import (
+    tsv_parsing, AnnotatedFiles, finite_annotation, conjugation_population, tag_defaults,
+)
+
+def lookups_per_second(lookup, dictkeys, repetitions=5):
+    start_time = time.perf_counter()
+    for i in range(repetitions):
+        lookup(dictkeys)
+    return repetitions*len(dictkeys) / (time.perf_counter()-start_time)
+
+def general_getitem(lookup):
+    '''
+    Resolves dictkeys in the way that `DictLookup.__getitem__` did before the fast path existed.
+    '''
+    def _lookup(dictkeys):
+        for dictkey in dictkeys:
+            tuplekeys = [tuplekey
+                for tuplekey in lookup.indexing.tuplekeys(dictkey)
+                if tuplekey in lookup.content]
+            lookup.content[tuplekeys[0]]
+    return _lookup
+
+def general_contains(lookup):
+    '''
+    Resolves dictkeys in the way that `DictLookup.__contains__` did before the fast path existed.
+    '''
+    def _lookup(dictkeys):
+        for dictkey in dictkeys:
+            tuplekeys = list(lookup.indexing.tuplekeys(dictkey))
+            len(tuplekeys) == 1 and tuplekeys[0] in lookup.content
+    return _lookup
+
+def fast_getitem(lookup):
+    def _lookup(dictkeys):
+        for dictkey in dictkeys:
+            lookup[dictkey]
+    return _lookup
+
+def fast_contains(lookup):
+    def _lookup(dictkeys):
+        for dictkey in dictkeys:
+            dictkey in lookup
+    return _lookup
+
+def get_many(lookup):
+    def _lookup(dictkeys):
+        lookup.get_many(dictkeys)
+    return _lookup
+
+if __name__ == '__main__':
+    filename = (sys.argv[1] if len(sys.argv) > 1
+        else 'data/inflection/indo-european/celtic/gaulish/finite-conjugations.tsv')
+    lookup = conjugation_population.index(
+        AnnotatedFiles(tsv_parsing, [
+            (finite_annotation, filename)]))['finite']
+    # dictkeys are given the many unrelated tags that are typically found while generating cards
+    dictkeys = [{**tag_defaults, **lookup.indexing.dictkey(tuplekey)} 
+        for tuplekey in itertools.islice(lookup, 0, None, max(1, len(lookup)//20000))]
+    print(f'{filename}: {len(lookup)} entries, {len(dictkeys)} sampled dictkeys')
+    for (name, before, after) in [
+            ('__getitem__',  general_getitem(lookup),  fast_getitem(lookup)),
+            ('__contains__', general_contains(lookup), fast_contains(lookup)),
+            ('get_many',     general_getitem(lookup),  get_many(lookup)),
+        ]:
+        before_rate = lookups_per_second(before, dictkeys)
+        after_rate = lookups_per_second(after, dictkeys)
+        print(f'{name:13} before: {before_rate:12,.0f}/s  after: {after_rate:12,.0f}/s  speedup: {after_rate/before_rate:5.1f}x')
@@ -1,12 +1,25 @@
+import gc
+import os
+import mmap
+import pickle
+import hashlib
+import operator
+import tempfile
 import collections
 
+# yields rows one at a time from a memory map, so that large files are never read into memory as a whole
+def iter_tuples_from_csv(filename, delimeter='\t', padding=' \t\r\n'):
+	with open(filename, 'rb') as file:
+		if os.fstat(file.fileno()).st_size < 1:
+			return
+		with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+			for line in iter(buffer.readline, b''):
+				line = line.decode('utf-8')
+				if not line.strip().startswith('#') and not len(line.strip()) < 1:
+					yield [column.strip(padding) for column in line.split(delimeter) ]
+
 def tuples_from_csv(filename, delimeter='\t', padding=' \t\r\n'):
-	result = []
-	with open(filename) as file:
-		for line in file.readlines():
-			if not line.strip().startswith('#') and not len(line.strip()) < 1:
-				result.append([column.strip(padding) for column in line.split(delimeter) ])
-	return result
+	return list(iter_tuples_from_csv(filename, delimeter, padding))
 
 def lines_from_file(filename):
 	result = []
@@ -16,41 +29,98 @@ def lines_from_file(filename):
 				result.append(line.strip())
 	return result
 
-def dict_from_tuples(tuples, columns, keys, values=None):
-	result = {}
+# returns a function that reads the (key, value) of a row by position, resolving `columns` only once,
+# or None if rows must be read by column name, as when a key is missing from `columns` or no column remains for the value
+def _row_reader(columns, keys, values=None):
+	positions = {column:i for i, column in enumerate(columns)}
+	value_columns = values if values else [column for column in positions if column not in keys]
+	if len(keys) < 1 or len(value_columns) < 1 or any(column not in positions for column in [*keys, *value_columns]):
+		return None
+	key_reader = operator.itemgetter(*[positions[key] for key in keys])
+	value_reader = operator.itemgetter(*[positions[column] for column in value_columns])
+	if len(value_columns) > 1:
+		return lambda cells: (key_reader(cells), dict(zip(value_columns, value_reader(cells))))
+	return lambda cells: (key_reader(cells), value_reader(cells))
+
+# reads the (key, value) of a row by column name, for rows that are shorter than `columns`
+def _row_by_name(cells, columns, keys, values=None):
+	row = {columns[i]:cells[i] for i, cell in enumerate(cells) if i < len(columns)}
+	value_columns = values if values else [column for column in row if column not in keys]
+	value = {column:row[column] for column in value_columns}
+	value = value if len(value) > 1 else list(value.values())[0]
+	keys_tuple = tuple(row[key] for key in keys) if len(keys)>1 else row[keys[0]]
+	return keys_tuple, value
+
+# yields the (key, value) of each row in `tuples`, skipping rows that are shorter than `columns` if `complete_only`
+def _rows(tuples, columns, keys, values=None, complete_only=False):
+	reader = _row_reader(columns, keys, values)
+	width = len(columns)
 	for cells in tuples:
-		row = {columns[i]:cells[i] for i, cell in enumerate(cells) if i < len(columns)}
-		value_columns = values if values else [column for column in row if column not in keys]
-		value = {column:row[column] for column in value_columns}
-		value = value if len(value) > 1 else list(value.values())[0]
-		key = row[keys[0]]
-		keys_tuple = tuple(row[key] for key in keys) if len(keys)>1 else row[keys[0]]
+		if len(cells) >= width and reader:
+			yield reader(cells)
+		elif not complete_only or len(cells) >= width:
+			yield _row_by_name(cells, columns, keys, values)
+
+def dict_from_tuples(tuples, columns, keys, values=None, complete_only=False):
+	result = {}
+	for keys_tuple, value in _rows(tuples, columns, keys, values, complete_only):
 		if keys_tuple not in result:
 			result[keys_tuple] = value
 	return result
 
-def setdict_from_tuples(tuples, columns, keys, values=None):
+def setdict_from_tuples(tuples, columns, keys, values=None, complete_only=False):
 	result = collections.defaultdict(set)
-	for cells in tuples:
-		row = {columns[i]:cells[i] for i, cell in enumerate(cells) if i < len(columns)}
-		value_columns = values if values else [column for column in row if column not in keys]
-		value = {column:row[column] for column in value_columns}
-		value = value if len(value) > 1 else list(value.values())[0]
-		keys_tuple = tuple(row[key] for key in keys) if len(keys)>1 else row[keys[0]]
+	for keys_tuple, value in _rows(tuples, columns, keys, values, complete_only):
 		result[keys_tuple].add(value)
 	return result
 
-def listdict_from_tuples(tuples, columns, keys, values=None):
+def listdict_from_tuples(tuples, columns, keys, values=None, complete_only=False):
 	result = collections.defaultdict(list)
-	for cells in tuples:
-		row = {columns[i]:cells[i] for i, cell in enumerate(cells) if i < len(columns)}
-		value_columns = values if values else [column for column in row if column not in keys]
-		value = {column:row[column] for column in value_columns}
-		value = value if len(value) > 1 else list(value.values())[0]
-		keys_tuple = tuple(row[key] for key in keys) if len(keys)>1 else row[keys[0]]
+	for keys_tuple, value in _rows(tuples, columns, keys, values, complete_only):
 		result[keys_tuple].append(value)
 	return result
 
+# returns a hash of this file, so that compiled indices are rebuilt whenever the functions that build them change
+def _source_hash(hashes={}):
+	if __file__ not in hashes:
+		with open(__file__, 'rb') as file:
+			hashes[__file__] = hashlib.sha256(file.read()).hexdigest()
+	return hashes[__file__]
+
+# returns `index(iter_tuples_from_csv(filename), columns, keys, values)`, where `index` is one of the `*_from_tuples` functions above,
+# storing the result as a compiled file within `cache_directory`, next to `filename`, 
+# that is loaded in place of `filename` until either `filename` or this file are modified.
+# no file is read or written if `cache_directory` is None
+def index_from_csv(index, filename, columns, keys, values=None, delimeter='\t', padding=' \t\r\n', cache_directory='.cache', **options):
+	calculate = lambda: index(iter_tuples_from_csv(filename, delimeter, padding), columns, keys, values, **options)
+	if cache_directory is None:
+		return calculate()
+	status = os.stat(filename)
+	stamp = repr((index.__name__, os.path.abspath(filename), status.st_size, status.st_mtime_ns, 
+		columns, keys, values, delimeter, padding, sorted(options.items()), _source_hash()))
+	directory = os.path.join(os.path.dirname(filename), cache_directory)
+	cache_filename = os.path.join(directory, hashlib.sha256(stamp.encode()).hexdigest()+'.pickle')
+	# the collector is paused while loading, since it would otherwise repeatedly traverse the many containers being created
+	enabled = gc.isenabled()
+	gc.disable()
+	try:
+		with open(cache_filename, 'rb') as file:
+			return pickle.load(file)
+	except (OSError, EOFError, pickle.UnpicklingError):
+		pass
+	finally:
+		if enabled:
+			gc.enable()
+	result = calculate()
+	try:
+		os.makedirs(directory, exist_ok=True)
+		with tempfile.NamedTemporaryFile('wb', dir=directory, suffix='.tmp', delete=False) as file:
+			pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+		os.replace(file.name, cache_filename)
+	except OSError:
+		pass
+	return result
+
 # deprecated, use dict_from_tuples(lists_from_csv) instead
 def csv_dict(filename, columns, keys):
 	return dict_from_tuples(tuples_from_csv(filename), columns, keys)
@@ -16,12 +16,11 @@ word_to_frequency = csv_functions.function_from_dict(
 	{columns[0]:int(columns[1]) for columns in word_frequency if len(columns) == 2},
 	sentinel=0)
 
-standardize_tuples = csv_functions.tuples_from_csv(foreign_language['standardize'])
+standardize_tuples = csv_functions.iter_tuples_from_csv(foreign_language['standardize'])
 standardize_lookup = csv_functions.setdict_from_tuples(standardize_tuples, ['variant','part-of-speech','standardized'], ['variant','part-of-speech'])
 standardize = csv_functions.function_from_dict(standardize_lookup)
 
-parts_of_speech_tuples = csv_functions.tuples_from_csv(foreign_language['part_of_speech'])
-parts_of_speech_lookup = csv_functions.setdict_from_tuples(parts_of_speech_tuples, ['word','part-of-speech'], ['word'])
+parts_of_speech_lookup = csv_functions.index_from_csv(csv_functions.setdict_from_tuples, foreign_language['part_of_speech'], ['word','part-of-speech'], ['word'])
 parts_of_speech = csv_functions.function_from_dict(parts_of_speech_lookup)
 
 uncommon_conjugations = (
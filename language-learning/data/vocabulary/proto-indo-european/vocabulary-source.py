@@ -73,9 +73,8 @@ for word, layer, text in chain_compose(
         before_pattern('Usage notes|derived +terms|descend[ea]nts|inflection|related +terms|reconstruction +notes|extensions|alternative reconstructions'),
         bulleted_list_items, 
         replace_regex('{{[^}]+?}}', ''),
-        replace_regex('</?[^>]+?>', ''),
+        replace_regex('<.*', ''),
         replace_regex('#', ''),
-        replace_regex('&lt;.*', ''),
         replace_regex('\(\'\'[^\)]+?\)', ''),
         replace_regex('\[[^\]+?]\]', ''),
         replace_regex('^[ ,]+', ''),
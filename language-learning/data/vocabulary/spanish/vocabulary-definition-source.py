@@ -33,9 +33,8 @@ for (word, part_of_speech), layer, text in chain_compose(
         replace_regex('{{gloss\|[^}]+}}', ''),
         replace_regex('{{([^}|=]+\|)*', '('),
         replace_regex('}}', ')'),
-        replace_regex('</?[^>]+?>', ''),
+        replace_regex('<.*', ''),
         replace_regex('#', ''),
-        replace_regex('&lt;.*', ''),
         replace_regex('\([^\)]+?\)', ''),
         replace_regex('\[[^\]+?]\]', ''),
         replace_regex('^[ ,]+', ''),
@@ -4,12 +4,11 @@ import csv_functions
 foreign_language_code, foreign_language_name = csv_functions.lines_from_file('language_ids.txt')
 
 def translations(language_code):
-    def translations_(translation_tags):
-        for (word, part_of_speech), layer, tag in translation_tags:
-            split = tag.split('|')
-            if len(split) >= 3:
-                type_, language, translation, *args = split
-                if type_ in {'t','t+','tt','tt+'} and language == language_code:
+    def translations_(translation_templates):
+        for (word, part_of_speech), layer, template in translation_templates:
+            if len(template.positional) >= 2:
+                language, translation, *args = template.positional
+                if language == language_code:
                     yield (word.replace('/translations',''), part_of_speech), layer, translation.replace('[','').replace(']','')
     return translations_
 
@@ -68,7 +67,7 @@ for (word, part_of_speech), layer, text in chain_compose(
         # must_not_include_any_of_annotations(*ignored_annotations),
         # bulleted_list_items, 
         # must_include_text(foreign_language_name), 
-        tags,
+        templates_with_names('t','t+','tt','tt+'),
         translations(foreign_language_code)
     )(1e9):
     print(f'{word.lower()}\t{part_of_speech.lower()}\t{text}')
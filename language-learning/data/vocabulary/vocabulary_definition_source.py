@@ -3,9 +3,6 @@ import yaml
 
 from parse_wiktionary import *
 
-foreign_language_config_filename = sys.argv[1]
-foreign_language = yaml.load(open(foreign_language_config_filename, 'r'))
-
 def before_pattern(regex):
     matcher = re.compile(regex, re.IGNORECASE)
     def before_pattern_(items):
@@ -28,34 +25,42 @@ html_escape_markup = re.compile("&\S+;", re.VERBOSE)
 replacements = [
     ('&quot;', '"'),
 ]
-for (word, part_of_speech), layer, text in chain_compose( 
-        lambda max_line_count: raw(max_line_count, filename=foreign_language['wiktionary']), 
-        pages, 
-        header2(foreign_language['name'], allow_if_no_headers_exist=False),
-        part_of_speech_header('Adjective|Adverb|Noun|Verb|Interjection|Numeral|Conjunction|Determiner|Presposition|Particle|Pronoun|Phrase'),
-        before_pattern('=(Usage notes|derived +terms|descend[ea]nts|inflection|related +terms|reconstruction +notes|extensions|alternative reconstructions|Translations)='),
-        bulleted_list_items, 
-        replace_regex('{{lb\|[^}]+}}', ''),
-        replace_regex('{{gloss\|[^}]+}}', ''),
-        replace_regex('{{([^}|=]+\|)*', '('),
-        replace_regex('}}', ')'),
-        replace_regex('</?[^>]+?>', ''),
-        replace_regex('#', ''),
-        replace_regex('&lt;.*', ''),
-        replace_regex('\([^\)]+?\)', ''),
-        replace_regex('\[[^\]+?]\]', ''),
-        replace_regex('^[ ,]+', ''),
-    )(1e9):
-    # print('=====================================================================')
-    # print(word)
-    # print(text)
-    lemmata = set([hyperlink.group(1).split('|')[0] for hyperlink in hyperlink_matcher.finditer(text)])
-    for lemma in lemmata:
-        user_text = text
-        user_text = hyperlink_markup.sub('', user_text)
-        user_text = outside_hyperlink_markup.sub('', user_text)
-        user_text = bold_italics_markup.sub('', user_text)
-        user_text = user_text.strip(';:,. \t\r\n')
-        for replaced, replacement in replacements:
-            user_text = user_text.replace(replaced, replacement)
-        print(word.lower(), '\t', part_of_speech.lower(), '\t', lemma, '\t', user_text)
\ No newline at end of file
+def lines(entries, foreign_language):
+    for (word, part_of_speech), layer, text in chain_compose(
+            header2(foreign_language['name'], allow_if_no_headers_exist=False),
+            part_of_speech_header('Adjective|Adverb|Noun|Verb|Interjection|Numeral|Conjunction|Determiner|Presposition|Particle|Pronoun|Phrase'),
+            before_pattern('=(Usage notes|derived +terms|descend[ea]nts|inflection|related +terms|reconstruction +notes|extensions|alternative reconstructions|Translations)='),
+            bulleted_list_items, 
+            replace_regex('{{lb\|[^}]+}}', ''),
+            replace_regex('{{gloss\|[^}]+}}', ''),
+            replace_regex('{{([^}|=]+\|)*', '('),
+            replace_regex('}}', ')'),
+            replace_regex('<.*', ''),
+            replace_regex('#', ''),
+            replace_regex('\([^\)]+?\)', ''),
+            replace_regex('\[[^\]+?]\]', ''),
+            replace_regex('^[ ,]+', ''),
+        )(entries):
+        # print('=====================================================================')
+        # print(word)
+        # print(text)
+        lemmata = set([hyperlink.group(1).split('|')[0] for hyperlink in hyperlink_matcher.finditer(text)])
+        for lemma in lemmata:
+            user_text = text
+            user_text = hyperlink_markup.sub('', user_text)
+            user_text = outside_hyperlink_markup.sub('', user_text)
+            user_text = bold_italics_markup.sub('', user_text)
+            user_text = user_text.strip(';:,. \t\r\n')
+            for replaced, replacement in replacements:
+                user_text = user_text.replace(replaced, replacement)
+            yield ' '.join([word.lower(), '\t', part_of_speech.lower(), '\t', lemma, '\t', user_text])
+
+if __name__ == '__main__':
+    foreign_language_config_filename = sys.argv[1]
+    foreign_language = yaml.load(open(foreign_language_config_filename, 'r'))
+    for line in chain_compose(
+            lambda max_line_count: raw(max_line_count, filename=foreign_language['wiktionary']), 
+            pages, 
+            lambda entries: lines(entries, foreign_language),
+        )(1e9):
+        print(line)
@@ -27,7 +27,7 @@ english_to_frequency = csv_functions.function_from_dict(
 	{english:int(frequency) for (english, frequency) in english_frequency},
 	sentinel=0)
 
-frequency_tally_tuples = csv_functions.tuples_from_csv(foreign_language['frequency_tallies'])
+frequency_tally_tuples = csv_functions.iter_tuples_from_csv(foreign_language['frequency_tallies'])
 word_to_frequency_lookup = collections.defaultdict(lambda: 0)
 for part_of_speech, word, frequency in frequency_tally_tuples:
 	word_to_frequency_lookup[part_of_speech, word] += int(frequency)
@@ -43,12 +43,12 @@ exceptional_vocabulary_set = {
 	*[row[1] for row in  exceptional_vocabulary_tuples], 
 }
 
-foreign_english = csv_functions.tuples_from_csv(foreign_language['definition'])
+foreign_english = csv_functions.iter_tuples_from_csv(foreign_language['definition'])
 foreign_to_english_by_definition_lookup = csv_functions.dict_from_tuples(foreign_english, 
 	['foreign','part-of-speech','lemma','text'], ['foreign','part-of-speech'], ['text'])
 foreign_to_english_by_definition = csv_functions.function_from_dict(foreign_to_english_by_definition_lookup)
 
-english_foreign = csv_functions.tuples_from_csv(foreign_language['translation'])
+english_foreign = csv_functions.iter_tuples_from_csv(foreign_language['translation'])
 foreign_to_english_by_translation_lookup = csv_functions.setdict_from_tuples(english_foreign, [
 	'english','part-of-speech','foreign'], ['foreign','part-of-speech'])
 foreign_to_english_by_translation = csv_functions.function_from_dict(foreign_to_english_by_translation_lookup)
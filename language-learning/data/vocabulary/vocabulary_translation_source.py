@@ -3,16 +3,12 @@ import yaml
 
 from parse_wiktionary import *
 
-foreign_language_config_filename = sys.argv[1]
-foreign_language = yaml.load(open(foreign_language_config_filename, 'r'))
-
 def translations(language_code):
-    def translations_(translation_tags):
-        for (word, part_of_speech), layer, tag in translation_tags:
-            split = tag.split('|')
-            if len(split) >= 3:
-                type_, language, translation, *args = split
-                if type_ in {'t','t+','tt','tt+'} and language == language_code:
+    def translations_(translation_templates):
+        for (word, part_of_speech), layer, template in translation_templates:
+            if len(template.positional) >= 2:
+                language, translation, *args = template.positional
+                if language == language_code:
                     yield (word.replace('/translations',''), part_of_speech), layer, translation.replace('[','').replace(']','')
     return translations_
 
@@ -51,30 +47,41 @@ def debug(word):
                 yield word, layer, text
     return debug_
 
-for (word, part_of_speech), layer, text in chain_compose( 
-        lambda max_line_count: raw(max_line_count, filename=foreign_language['wiktionary']), 
-        pages, 
-        try_both(
-            chain_compose( 
-                try_fallbacks(
+def lines(entries, foreign_language):
+    for (word, part_of_speech), layer, text in chain_compose(
+            try_both(
+                chain_compose( 
+                    try_fallbacks(
+                        header2('English'),
+                        preheader,
+                    ),
+                    part_of_speech_header('Adjective|Adverb|Noun|Verb|Interjection|Numeral|Conjunction|Determiner|Preposition|Particle|Pronoun|Phrase'),
+                ),
+                chain_compose( 
+                    page_title('([^/]*)/translations'),
                     header2('English'),
-                    preheader,
+                    part_of_speech_header('Adjective|Adverb|Noun|Verb|Interjection|Numeral|Conjunction|Determiner|Preposition|Particle|Pronoun|Phrase'),
                 ),
-                part_of_speech_header('Adjective|Adverb|Noun|Verb|Interjection|Numeral|Conjunction|Determiner|Preposition|Particle|Pronoun|Phrase'),
-            ),
-            chain_compose( 
-                page_title('([^/]*)/translations'),
-                header2('English'),
-                part_of_speech_header('Adjective|Adverb|Noun|Verb|Interjection|Numeral|Conjunction|Determiner|Preposition|Particle|Pronoun|Phrase'),
             ),
-        ),
-        # must_not_include_any_of_annotations(*ignored_annotations),
-        # bulleted_list_items, 
-        tags,
-        translations(foreign_language['code'])
-    )(1e9):
-    print(f'{word.lower()}\t{part_of_speech.lower()}\t{text}')
-    # print(f'{word.lower()}')
-    # print(f'{text}')
-    # print(f'{word.upper():<15} {text}')
+            # must_not_include_any_of_annotations(*ignored_annotations),
+            # bulleted_list_items, 
+            templates_with_names('t','t+','tt','tt+'),
+            translations(foreign_language['code'])
+        )(entries):
+        yield f'{word.lower()}\t{part_of_speech.lower()}\t{text}'
+        # yield f'{word.lower()}'
+        # yield f'{text}'
+        # yield f'{word.upper():<15} {text}'
 
+if __name__ == '__main__':
+    foreign_language_config_filename = sys.argv[1]
+    foreign_language = yaml.load(open(foreign_language_config_filename, 'r'))
+    # any titles that follow the config are read directly from the dump using its page index, e.g. "three three/translations"
+    titles = sys.argv[2:]
+    for line in chain_compose(
+            (lambda max_line_count: pages_for(titles, filename=foreign_language['wiktionary'])) if titles else
+            (lambda max_line_count: raw(max_line_count, filename=foreign_language['wiktionary'])), 
+            pages, 
+            lambda entries: lines(entries, foreign_language),
+        )(1e9):
+        print(line)
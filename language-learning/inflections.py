@@ -0,0 +1,120 @@
+'''
+"inflections.py" builds the flashcard decks of every language
+by running each `inflections_for_*.py` script within a pool of worker processes.
+
+Lookups that are shared by all languages (such as those in `tools.inflections` and `languages.english`)
+are built once within the parent process before the pool is created.
+Workers are forked from the parent, so they inherit those lookups copy-on-write
+instead of reparsing the same tables for every language.
+
+Usage:
+    python3 inflections.py                       # build all languages
+    python3 inflections.py spanish latin         # build only languages whose names contain the given text
+    python3 inflections.py --processes 4
+'''
+
+import argparse
+import glob
+import importlib
+import multiprocessing
+import os
+import runpy
+import time
+import traceback
+
+script_prefix = 'inflections_for_'
+script_suffix = '.py'
+
+def format_duration(duration):
+    return f'{int(duration//60)}:{int(duration%60):02}'
+
+def language_of(script):
+    return os.path.basename(script)[len(script_prefix):-len(script_suffix)]
+
+def discover(directory='.'):
+    '''
+    Returns the filenames of all language scripts within `directory`, in alphabetical order.
+    '''
+    return sorted(glob.glob(os.path.join(directory, f'{script_prefix}*{script_suffix}')))
+
+def select(scripts, languages):
+    '''
+    Returns the subset of `scripts` whose language names contain any of the given `languages`,
+    or all `scripts` if no `languages` are given.
+    '''
+    if not languages:
+        return scripts
+    selected = [script
+        for script in scripts
+        if any(language in language_of(script) for language in languages)]
+    unknown = [language
+        for language in languages
+        if not any(language in language_of(script) for script in scripts)]
+    if unknown:
+        raise ValueError('No script exists for the following languages: ' + ', '.join(unknown))
+    return selected
+
+def preload(modules):
+    '''
+    Imports `modules` within the current process, so that any processes that are forked from it
+    will inherit whatever lookups are built by the modules at import time.
+    '''
+    for module in modules:
+        importlib.import_module(module)
+
+def build(script):
+    '''
+    Runs a single language script and returns a tuple of (script, duration, error),
+    where `error` is a formatted traceback if the script failed, or None otherwise.
+    '''
+    start_time = time.time()
+    try:
+        runpy.run_path(script, run_name='__main__')
+        error = None
+    except BaseException:
+        error = traceback.format_exc()
+    return (script, time.time()-start_time, error)
+
+def build_all(scripts, processes=None, modules=[]):
+    '''
+    Runs `scripts` within a pool of `processes` worker processes
+    and returns a list of (script, duration, error) tuples in the order that they were completed.
+    Each worker is forked from the current process after `modules` are imported,
+    and each worker handles only a single script so that memory is returned once the script completes.
+    '''
+    preload(modules)
+    context = multiprocessing.get_context('fork')
+    with context.Pool(processes, maxtasksperchild=1) as pool:
+        return list(pool.imap_unordered(build, scripts))
+
+def report(results, duration):
+    cell_width = max([len(language_of(script)) for (script, _, _) in results], default=0)
+    lines = [
+        *[f'{language_of(script).ljust(cell_width)} {format_duration(language_duration)} {"failed" if error else ""}'.rstrip()
+          for (script, language_duration, error) in sorted(results, key=lambda result: -result[1])],
+        f'{"total".ljust(cell_width)} {format_duration(duration)}',
+    ]
+    return '\n'.join(lines)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Builds flashcard decks for every language in parallel.')
+    parser.add_argument('languages', nargs='*',
+        help='build only languages whose names contain the given text')
+    parser.add_argument('--processes', type=int, default=None,
+        help='number of worker processes (default: number of cores)')
+    parser.add_argument('--preload', nargs='*', default=['tools.inflections', 'languages.english'],
+        help='modules to import before forking, so that their lookups are shared by all workers')
+    args = parser.parse_args()
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    start_time = time.time()
+    results = build_all(select(discover(), args.languages), args.processes, args.preload)
+    duration = time.time()-start_time
+
+    for (script, _, error) in results:
+        if error:
+            print(f'{script} failed:')
+            print(error)
+    print(report(results, duration))
+    if any(error for (_, _, error) in results):
+        raise SystemExit(1)
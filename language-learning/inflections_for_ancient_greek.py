@@ -12,12 +12,12 @@ from tools.nodemaps import (
     ListTools, ListGrammar, ListSemantics,
     RuleTools, RuleFormatting, RuleSyntax
 )
-from tools.cards import DeckGeneration
+from tools.cards import DeckGeneration, DeckScheduling
 from tools.inflections import (
     dict_bundle_to_map,
     LanguageSpecificTextDemonstration, LanguageSpecificEmojiDemonstration,
     card_formatting,
-    tsv_parsing,
+    tsv_parsing, AnnotatedFiles,
     finite_annotation, 
     pronoun_annotation, common_noun_annotation, possessive_pronoun_annotation, 
     conjugation_population, declension_population, 
@@ -37,6 +37,7 @@ from languages.english import native_english_demonstration
 
 label_editing = TermLabelEditing()
 deck_generation = DeckGeneration()
+deck_scheduling = DeckScheduling(write)
 list_tools = ListTools()
 rule_tools = RuleTools()
 
@@ -53,37 +54,31 @@ def definiteness(machine, tree, memory):
 foreign_language = Language(
     ListSemantics(
         case_usage_population.index(
-            case_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/greek/attic/case-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (case_usage_annotation, 'data/inflection/indo-european/greek/attic/case-usage.tsv')])),
         mood_usage_population.index(
-            mood_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/greek/attic/mood-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (mood_usage_annotation, 'data/inflection/indo-european/greek/attic/mood-usage.tsv')])),
         aspect_usage_population.index(
-            aspect_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/aspect-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (aspect_usage_annotation, 'data/inflection/indo-european/aspect-usage.tsv')])),
     ),
     ListGrammar(
         NestedDictLookup(
-            conjugation_population.index([
-                *finite_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/greek/attic/finite-conjugations.tsv')),
-                # *nonfinite_annotation.annotate(
-                #     tsv_parsing.rows('data/inflection/indo-european/greek/attic/nonfinite-conjugations.tsv')),
-            ])),
+            conjugation_population.index(AnnotatedFiles(tsv_parsing, [
+                (finite_annotation, 'data/inflection/indo-european/greek/attic/finite-conjugations.tsv'),
+                # (nonfinite_annotation, 'data/inflection/indo-european/greek/attic/nonfinite-conjugations.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/greek/attic/common-noun-declensions.tsv')),
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/greek/attic/adjective-agreements.tsv')),
-                *pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/greek/attic/pronoun-declensions.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (common_noun_annotation, 'data/inflection/indo-european/greek/attic/common-noun-declensions.tsv'),
+                (common_noun_annotation, 'data/inflection/indo-european/greek/attic/adjective-agreements.tsv'),
+                (pronoun_annotation, 'data/inflection/indo-european/greek/attic/pronoun-declensions.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *possessive_pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/greek/attic/pronoun-possessives.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (possessive_pronoun_annotation, 'data/inflection/indo-european/greek/attic/pronoun-possessives.tsv'),
+            ]))),
     ),
     RuleSyntax(
         parse_any.tokens('adposition det adj n np clause'),
@@ -635,7 +630,7 @@ declension_noun_traversal = (
         & template_verb_whitelist)
 )
 
-write('flashcards/ancient-greek/finite-conjugation.html', 
+deck_scheduling.schedule('flashcards/ancient-greek/finite-conjugation.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -652,7 +647,7 @@ write('flashcards/ancient-greek/finite-conjugation.html',
     ))
 
 """
-write('flashcards/ancient-greek/participle-declension.html', 
+deck_scheduling.schedule('flashcards/ancient-greek/participle-declension.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -674,7 +669,7 @@ write('flashcards/ancient-greek/participle-declension.html',
     ))
 """
 
-write('flashcards/ancient-greek/adpositions.html', 
+deck_scheduling.schedule('flashcards/ancient-greek/adpositions.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -694,7 +689,7 @@ write('flashcards/ancient-greek/adpositions.html',
         },
     ))
 
-write('flashcards/ancient-greek/common-noun-declension.html',
+deck_scheduling.schedule('flashcards/ancient-greek/common-noun-declension.html',
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -713,7 +708,7 @@ write('flashcards/ancient-greek/common-noun-declension.html',
     ))
 
 
-write('flashcards/ancient-greek/pronoun-declension.html', 
+deck_scheduling.schedule('flashcards/ancient-greek/pronoun-declension.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -729,7 +724,7 @@ write('flashcards/ancient-greek/pronoun-declension.html',
         },
     ))
 
-# write('flashcards/ancient-greek/adjective-agreement.html', 
+# deck_scheduling.schedule('flashcards/ancient-greek/adjective-agreement.html', 
 #     deck_generation.generate(
 #         [demonstration.generator(
 #             tree_lookup = template_tree_lookup,
@@ -748,7 +743,7 @@ write('flashcards/ancient-greek/pronoun-declension.html',
 #         },
 #     ))
 
-write('flashcards/ancient-greek/pronoun-possessives.html', 
+deck_scheduling.schedule('flashcards/ancient-greek/pronoun-possessives.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -771,6 +766,9 @@ write('flashcards/ancient-greek/pronoun-possessives.html',
         },
     ))
 
+if __name__ == '__main__':
+    deck_scheduling.run()
+
 end_time = time.time()
 duration = end_time-start_time
 print(f'runtime: {int(duration//60)}:{int(duration%60):02}')
@@ -12,12 +12,12 @@ from tools.nodemaps import (
     ListTools, ListGrammar, ListSemantics,
     RuleTools, RuleFormatting, RuleSyntax, 
 )
-from tools.cards import DeckGeneration
+from tools.cards import DeckGeneration, DeckScheduling
 from tools.inflections import (
     dict_bundle_to_map,
     LanguageSpecificTextDemonstration, LanguageSpecificEmojiDemonstration, 
     card_formatting,
-    tsv_parsing,
+    tsv_parsing, AnnotatedFiles,
     finite_annotation, nonfinite_annotation,
     pronoun_annotation, common_noun_annotation, possessive_pronoun_annotation, 
     conjugation_population, declension_population, 
@@ -37,44 +37,40 @@ from languages.english import native_english_demonstration
 
 label_editing = TermLabelEditing()
 deck_generation = DeckGeneration()
+sharded_deck_generation = DeckGeneration(shard_size=256)
+deck_scheduling = DeckScheduling(write)
 list_tools = ListTools()
 rule_tools = RuleTools()
 
 foreign_language = Language(
     ListSemantics(
         case_usage_population.index(
-            case_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/romance/latin/classic/case-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (case_usage_annotation, 'data/inflection/indo-european/romance/latin/classic/case-usage.tsv')])),
         mood_usage_population.index(
-            mood_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/romance/latin/classic/mood-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (mood_usage_annotation, 'data/inflection/indo-european/romance/latin/classic/mood-usage.tsv')])),
         aspect_usage_population.index(
-            aspect_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/aspect-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (aspect_usage_annotation, 'data/inflection/indo-european/aspect-usage.tsv')])),
         debug=True,
     ),
     ListGrammar(
         NestedDictLookup(
-            conjugation_population.index([
-                *finite_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/latin/classic/finite-conjugations.tsv')),
-                *nonfinite_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/latin/classic/nonfinite-conjugations.tsv')),
-            ])),
+            conjugation_population.index(AnnotatedFiles(tsv_parsing, [
+                (finite_annotation, 'data/inflection/indo-european/romance/latin/classic/finite-conjugations.tsv'),
+                (nonfinite_annotation, 'data/inflection/indo-european/romance/latin/classic/nonfinite-conjugations.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/latin/classic/common-noun-declensions.tsv')),
-                *pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/latin/classic/pronoun-declensions.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (common_noun_annotation, 'data/inflection/indo-european/romance/latin/classic/common-noun-declensions.tsv'),
+                (pronoun_annotation, 'data/inflection/indo-european/romance/latin/classic/pronoun-declensions.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *possessive_pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/latin/classic/pronoun-possessives.tsv')),
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/latin/classic/adjective-agreements.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (possessive_pronoun_annotation, 'data/inflection/indo-european/romance/latin/classic/pronoun-possessives.tsv'),
+                (common_noun_annotation, 'data/inflection/indo-european/romance/latin/classic/adjective-agreements.tsv'),
+            ]))),
         debug=True,
     ),
     RuleSyntax(
@@ -488,7 +484,7 @@ declension_noun_traversal = (
         & template_verb_whitelist)
 )
 
-write('flashcards/romance/latin/nonfinite-conjugation.html', 
+deck_scheduling.schedule('flashcards/romance/latin/nonfinite-conjugation.html', 
     deck_generation.generate(
         [
             emoji_demonstration.generator(),
@@ -513,7 +509,7 @@ write('flashcards/romance/latin/nonfinite-conjugation.html',
         },
     ))
 
-write('flashcards/romance/latin/finite-conjugation.html', 
+deck_scheduling.schedule('flashcards/romance/latin/finite-conjugation.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -529,7 +525,7 @@ write('flashcards/romance/latin/finite-conjugation.html',
         },
     ))
 
-write('flashcards/romance/latin/participle-declension.html', 
+deck_scheduling.schedule('flashcards/romance/latin/participle-declension.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -551,7 +547,7 @@ write('flashcards/romance/latin/participle-declension.html',
         },
     ))
 
-write('flashcards/romance/latin/adpositions.html', 
+deck_scheduling.schedule('flashcards/romance/latin/adpositions.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -571,7 +567,7 @@ write('flashcards/romance/latin/adpositions.html',
         },
     ))
 
-write('flashcards/romance/latin/common-noun-declension.html',
+deck_scheduling.schedule('flashcards/romance/latin/common-noun-declension.html',
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -590,7 +586,7 @@ write('flashcards/romance/latin/common-noun-declension.html',
     ))
 
 
-write('flashcards/romance/latin/pronoun-declension.html', 
+deck_scheduling.schedule('flashcards/romance/latin/pronoun-declension.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -607,7 +603,7 @@ write('flashcards/romance/latin/pronoun-declension.html',
         },
     ))
 
-write('flashcards/romance/latin/correlative-declension.html', 
+deck_scheduling.schedule('flashcards/romance/latin/correlative-declension.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -624,8 +620,8 @@ write('flashcards/romance/latin/correlative-declension.html',
         },
     ))
 
-write('flashcards/romance/latin/adjective-agreement.html', 
-    deck_generation.generate(
+deck_scheduling.schedule('flashcards/romance/latin/adjective-agreement.html', 
+    sharded_deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
             substitutions = [{'declined': list_tools.replace([['cloze','adj','adjective'], ['n']])}],
@@ -644,7 +640,7 @@ write('flashcards/romance/latin/adjective-agreement.html',
         },
     ))
 
-write('flashcards/romance/latin/pronoun-possessives.html', 
+deck_scheduling.schedule('flashcards/romance/latin/pronoun-possessives.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -667,6 +663,9 @@ write('flashcards/romance/latin/pronoun-possessives.html',
         },
     ))
 
+if __name__ == '__main__':
+    deck_scheduling.run()
+
 end_time = time.time()
 duration = end_time-start_time
 print(f'runtime: {int(duration//60)}:{int(duration%60):02}')
@@ -12,12 +12,12 @@ from tools.nodemaps import (
     ListTools, ListGrammar, ListSemantics,
     RuleTools, RuleFormatting, 
 )
-from tools.cards import DeckGeneration
+from tools.cards import DeckGeneration, DeckScheduling
 from tools.inflections import (
     dict_bundle_to_map,
     LanguageSpecificTextDemonstration, LanguageSpecificEmojiDemonstration, 
     card_formatting,
-    tsv_parsing,
+    tsv_parsing, AnnotatedFiles,
     finite_annotation,
     pronoun_annotation, common_noun_annotation, possessive_pronoun_annotation, 
     conjugation_population, declension_population, 
@@ -38,43 +38,38 @@ from languages.english import native_english_demonstration
 
 label_editing = TermLabelEditing()
 deck_generation = DeckGeneration()
+deck_scheduling = DeckScheduling(write)
 list_tools = ListTools()
 rule_tools = RuleTools()
 
 foreign_language = Language(
     ListSemantics(
         case_usage_population.index(
-            case_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/romance/french/modern/case-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (case_usage_annotation, 'data/inflection/indo-european/romance/french/modern/case-usage.tsv')])),
         mood_usage_population.index(
-            mood_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/romance/french/modern/mood-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (mood_usage_annotation, 'data/inflection/indo-european/romance/french/modern/mood-usage.tsv')])),
         aspect_usage_population.index(
-            aspect_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/aspect-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (aspect_usage_annotation, 'data/inflection/indo-european/aspect-usage.tsv')])),
     ),
     ListGrammar(
         NestedDictLookup(
-            conjugation_population.index([
-                *finite_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/french/modern/finite-conjugations.tsv')),
-                # *nonfinite_annotation.annotate(
-                #     tsv_parsing.rows('data/inflection/indo-european/romance/french/modern/nonfinite-conjugations.tsv')),
-            ])),
+            conjugation_population.index(AnnotatedFiles(tsv_parsing, [
+                (finite_annotation, 'data/inflection/indo-european/romance/french/modern/finite-conjugations.tsv'),
+                # (nonfinite_annotation, 'data/inflection/indo-european/romance/french/modern/nonfinite-conjugations.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/french/modern/common-noun-declensions.tsv')),
-                *pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/french/modern/pronoun-declensions.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (common_noun_annotation, 'data/inflection/indo-european/romance/french/modern/common-noun-declensions.tsv'),
+                (pronoun_annotation, 'data/inflection/indo-european/romance/french/modern/pronoun-declensions.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *possessive_pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/french/modern/pronoun-possessives.tsv')),
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/french/modern/adjective-agreements.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (possessive_pronoun_annotation, 'data/inflection/indo-european/romance/french/modern/pronoun-possessives.tsv'),
+                (common_noun_annotation, 'data/inflection/indo-european/romance/french/modern/adjective-agreements.tsv'),
+            ]))),
     ),
     ModernRomanceRuleSyntax(
         parse_any.tokens('adposition det adj n np clause'),
@@ -395,7 +390,7 @@ declension_noun_traversal = (
 deck_path = 'flashcards/romance/french'
 deck_format = 'tsv'
 
-write(f'{deck_path}/finite-conjugation.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/finite-conjugation.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -411,7 +406,7 @@ write(f'{deck_path}/finite-conjugation.{deck_format}',
         },
     ))
 
-write(f'{deck_path}/adpositions.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/adpositions.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -431,7 +426,7 @@ write(f'{deck_path}/adpositions.{deck_format}',
         },
     ))
 
-write(f'{deck_path}/pronoun-declension.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/pronoun-declension.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -448,7 +443,7 @@ write(f'{deck_path}/pronoun-declension.{deck_format}',
         },
     ))
 
-write(f'{deck_path}/adjective-agreement.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/adjective-agreement.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -469,7 +464,7 @@ write(f'{deck_path}/adjective-agreement.{deck_format}',
         },
     ))
 
-write(f'{deck_path}/pronoun-possessives.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/pronoun-possessives.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -492,6 +487,9 @@ write(f'{deck_path}/pronoun-possessives.{deck_format}',
         },
     ))
 
+if __name__ == '__main__':
+    deck_scheduling.run()
+
 end_time = time.time()
 duration = end_time-start_time
 print(f'runtime: {int(duration//60)}:{int(duration%60):02}')
@@ -12,12 +12,12 @@ from tools.nodemaps import (
     ListTools, ListGrammar, ListSemantics,
     RuleTools, RuleFormatting, RuleSyntax, 
 )
-from tools.cards import DeckGeneration
+from tools.cards import DeckGeneration, DeckScheduling
 from tools.inflections import (
     dict_bundle_to_map,
     LanguageSpecificTextDemonstration, LanguageSpecificEmojiDemonstration, 
     card_formatting,
-    tsv_parsing,
+    tsv_parsing, AnnotatedFiles,
     finite_annotation,
     pronoun_annotation, common_noun_annotation, possessive_pronoun_annotation, 
     conjugation_population, declension_population, 
@@ -37,43 +37,38 @@ from languages.english import native_english_demonstration
 
 label_editing = TermLabelEditing()
 deck_generation = DeckGeneration()
+deck_scheduling = DeckScheduling(write)
 list_tools = ListTools()
 rule_tools = RuleTools()
 
 foreign_language = Language(
     ListSemantics(
         case_usage_population.index(
-            case_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/celtic/gaulish/case-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (case_usage_annotation, 'data/inflection/indo-european/celtic/gaulish/case-usage.tsv')])),
         mood_usage_population.index(
-            mood_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/celtic/gaulish/mood-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (mood_usage_annotation, 'data/inflection/indo-european/celtic/gaulish/mood-usage.tsv')])),
         aspect_usage_population.index(
-            aspect_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/aspect-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (aspect_usage_annotation, 'data/inflection/indo-european/aspect-usage.tsv')])),
     ),
     ListGrammar(
         NestedDictLookup(
-            conjugation_population.index([
-                *finite_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/celtic/gaulish/finite-conjugations.tsv')),
-                # *nonfinite_annotation.annotate(
-                #     tsv_parsing.rows('data/inflection/indo-european/celtic/gaulish/nonfinite-conjugations.tsv')),
-            ])),
+            conjugation_population.index(AnnotatedFiles(tsv_parsing, [
+                (finite_annotation, 'data/inflection/indo-european/celtic/gaulish/finite-conjugations.tsv'),
+                # (nonfinite_annotation, 'data/inflection/indo-european/celtic/gaulish/nonfinite-conjugations.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/celtic/gaulish/common-noun-declensions.tsv')),
-                *pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/celtic/gaulish/pronoun-declensions.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (common_noun_annotation, 'data/inflection/indo-european/celtic/gaulish/common-noun-declensions.tsv'),
+                (pronoun_annotation, 'data/inflection/indo-european/celtic/gaulish/pronoun-declensions.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *possessive_pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/celtic/gaulish/pronoun-possessives.tsv')),
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/celtic/gaulish/adjective-agreements.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (possessive_pronoun_annotation, 'data/inflection/indo-european/celtic/gaulish/pronoun-possessives.tsv'),
+                (common_noun_annotation, 'data/inflection/indo-european/celtic/gaulish/adjective-agreements.tsv'),
+            ]))),
     ),
     RuleSyntax(
         parse_any.tokens('adposition det adj n np clause'),
@@ -394,7 +389,7 @@ declension_noun_traversal = (
 )
 
 
-write('flashcards/gaulish/finite-conjugation.html', 
+deck_scheduling.schedule('flashcards/gaulish/finite-conjugation.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -411,7 +406,7 @@ write('flashcards/gaulish/finite-conjugation.html',
     ))
 
 """
-write('flashcards/gaulish/participle-declension.html', 
+deck_scheduling.schedule('flashcards/gaulish/participle-declension.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -433,7 +428,7 @@ write('flashcards/gaulish/participle-declension.html',
     ))
 """
 
-write('flashcards/gaulish/adpositions.html', 
+deck_scheduling.schedule('flashcards/gaulish/adpositions.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -453,7 +448,7 @@ write('flashcards/gaulish/adpositions.html',
         },
     ))
 
-write('flashcards/gaulish/common-noun-declension.html',
+deck_scheduling.schedule('flashcards/gaulish/common-noun-declension.html',
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -472,7 +467,7 @@ write('flashcards/gaulish/common-noun-declension.html',
     ))
 
 
-write('flashcards/gaulish/pronoun-declension.html', 
+deck_scheduling.schedule('flashcards/gaulish/pronoun-declension.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -489,7 +484,7 @@ write('flashcards/gaulish/pronoun-declension.html',
         },
     ))
 
-write('flashcards/gaulish/adjective-agreement.html', 
+deck_scheduling.schedule('flashcards/gaulish/adjective-agreement.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -509,7 +504,7 @@ write('flashcards/gaulish/adjective-agreement.html',
         },
     ))
 
-write('flashcards/gaulish/pronoun-possessives.html', 
+deck_scheduling.schedule('flashcards/gaulish/pronoun-possessives.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -532,6 +527,9 @@ write('flashcards/gaulish/pronoun-possessives.html',
         },
     ))
 
+if __name__ == '__main__':
+    deck_scheduling.run()
+
 end_time = time.time()
 duration = end_time-start_time
 print(f'runtime: {int(duration//60)}:{int(duration%60):02}')
@@ -12,12 +12,12 @@ from tools.nodemaps import (
     ListTools, ListGrammar, ListSemantics,
     RuleTools, RuleFormatting, 
 )
-from tools.cards import DeckGeneration
+from tools.cards import DeckGeneration, DeckScheduling
 from tools.inflections import (
     dict_bundle_to_map,
     LanguageSpecificTextDemonstration, LanguageSpecificEmojiDemonstration, 
     card_formatting,
-    tsv_parsing,
+    tsv_parsing, AnnotatedFiles,
     finite_annotation,
     pronoun_annotation, common_noun_annotation, possessive_pronoun_annotation, 
     conjugation_population, declension_population, 
@@ -38,43 +38,38 @@ from languages.english import native_english_demonstration
 
 label_editing = TermLabelEditing()
 deck_generation = DeckGeneration()
+deck_scheduling = DeckScheduling(write)
 list_tools = ListTools()
 rule_tools = RuleTools()
 
 foreign_language = Language(
     ListSemantics(
         case_usage_population.index(
-            case_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/romance/italian/modern/case-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (case_usage_annotation, 'data/inflection/indo-european/romance/italian/modern/case-usage.tsv')])),
         mood_usage_population.index(
-            mood_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/romance/italian/modern/mood-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (mood_usage_annotation, 'data/inflection/indo-european/romance/italian/modern/mood-usage.tsv')])),
         aspect_usage_population.index(
-            aspect_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/aspect-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (aspect_usage_annotation, 'data/inflection/indo-european/aspect-usage.tsv')])),
     ),
     ListGrammar(
         NestedDictLookup(
-            conjugation_population.index([
-                *finite_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/italian/modern/finite-conjugations.tsv')),
-                # *nonfinite_annotation.annotate(
-                #     tsv_parsing.rows('data/inflection/indo-european/romance/italian/modern/nonfinite-conjugations.tsv')),
-            ])),
+            conjugation_population.index(AnnotatedFiles(tsv_parsing, [
+                (finite_annotation, 'data/inflection/indo-european/romance/italian/modern/finite-conjugations.tsv'),
+                # (nonfinite_annotation, 'data/inflection/indo-european/romance/italian/modern/nonfinite-conjugations.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/italian/modern/common-noun-declensions.tsv')),
-                *pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/italian/modern/pronoun-declensions.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (common_noun_annotation, 'data/inflection/indo-european/romance/italian/modern/common-noun-declensions.tsv'),
+                (pronoun_annotation, 'data/inflection/indo-european/romance/italian/modern/pronoun-declensions.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *possessive_pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/italian/modern/pronoun-possessives.tsv')),
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/italian/modern/adjective-agreements.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (possessive_pronoun_annotation, 'data/inflection/indo-european/romance/italian/modern/pronoun-possessives.tsv'),
+                (common_noun_annotation, 'data/inflection/indo-european/romance/italian/modern/adjective-agreements.tsv'),
+            ]))),
     ),
     ModernRomanceRuleSyntax(
         parse_any.tokens('adposition det adj n np clause'),
@@ -390,7 +385,7 @@ declension_noun_traversal = (
         & template_verb_whitelist)
 )
 
-write('flashcards/romance/italian/finite-conjugation.html', 
+deck_scheduling.schedule('flashcards/romance/italian/finite-conjugation.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -406,7 +401,7 @@ write('flashcards/romance/italian/finite-conjugation.html',
         },
     ))
 
-write('flashcards/romance/italian/adpositions.html', 
+deck_scheduling.schedule('flashcards/romance/italian/adpositions.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -426,7 +421,7 @@ write('flashcards/romance/italian/adpositions.html',
         },
     ))
 
-write('flashcards/romance/italian/pronoun-declension.html', 
+deck_scheduling.schedule('flashcards/romance/italian/pronoun-declension.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -443,7 +438,7 @@ write('flashcards/romance/italian/pronoun-declension.html',
         },
     ))
 
-write('flashcards/romance/italian/adjective-agreement.html', 
+deck_scheduling.schedule('flashcards/romance/italian/adjective-agreement.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -464,7 +459,7 @@ write('flashcards/romance/italian/adjective-agreement.html',
         },
     ))
 
-write('flashcards/romance/italian/pronoun-possessives.html', 
+deck_scheduling.schedule('flashcards/romance/italian/pronoun-possessives.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -487,6 +482,9 @@ write('flashcards/romance/italian/pronoun-possessives.html',
         },
     ))
 
+if __name__ == '__main__':
+    deck_scheduling.run()
+
 end_time = time.time()
 duration = end_time-start_time
 print(f'runtime: {int(duration//60)}:{int(duration%60):02}')
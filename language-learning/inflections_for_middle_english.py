@@ -12,12 +12,12 @@ from tools.nodemaps import (
     ListTools, ListGrammar, ListSemantics,
     RuleTools, RuleFormatting, 
 )
-from tools.cards import DeckGeneration
+from tools.cards import DeckGeneration, DeckScheduling
 from tools.inflections import (
     dict_bundle_to_map,
     LanguageSpecificTextDemonstration, LanguageSpecificEmojiDemonstration, 
     card_formatting,
-    tsv_parsing,
+    tsv_parsing, AnnotatedFiles,
     finite_annotation,
     pronoun_annotation, common_noun_annotation, 
     conjugation_population, declension_population, 
@@ -37,6 +37,7 @@ from languages.english import native_english_demonstration, EnglishRuleSyntax
 
 label_editing = TermLabelEditing()
 deck_generation = DeckGeneration()
+deck_scheduling = DeckScheduling(write)
 list_tools = ListTools()
 rule_tools = RuleTools()
 
@@ -55,35 +56,30 @@ def definiteness(machine, tree, memory):
 foreign_language = Language(
     ListSemantics(
         case_usage_population.index(
-            case_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/germanic/english/middle/case-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (case_usage_annotation, 'data/inflection/indo-european/germanic/english/middle/case-usage.tsv')])),
         mood_usage_population.index(
-            mood_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/germanic/english/middle/mood-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (mood_usage_annotation, 'data/inflection/indo-european/germanic/english/middle/mood-usage.tsv')])),
         aspect_usage_population.index(
-            aspect_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/aspect-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (aspect_usage_annotation, 'data/inflection/indo-european/aspect-usage.tsv')])),
     ),
     ListGrammar(
         NestedDictLookup(
-            conjugation_population.index([
-                *finite_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/germanic/english/middle/conjugations.tsv')),
-            ])),
+            conjugation_population.index(AnnotatedFiles(tsv_parsing, [
+                (finite_annotation, 'data/inflection/indo-european/germanic/english/middle/conjugations.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/germanic/english/middle/common-noun-declensions.tsv')),
-                *pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/germanic/english/middle/pronoun-declensions.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (common_noun_annotation, 'data/inflection/indo-european/germanic/english/middle/common-noun-declensions.tsv'),
+                (pronoun_annotation, 'data/inflection/indo-european/germanic/english/middle/pronoun-declensions.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                # *possessive_pronoun_annotation.annotate(
-                #     tsv_parsing.rows('data/inflection/indo-european/germanic/english/middle/pronoun-possessives.tsv')),
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/germanic/english/middle/adjective-agreements.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                # (possessive_pronoun_annotation, 'data/inflection/indo-european/germanic/english/middle/pronoun-possessives.tsv'),
+                (common_noun_annotation, 'data/inflection/indo-european/germanic/english/middle/adjective-agreements.tsv'),
+            ]))),
     ),
     EnglishRuleSyntax(
         parse_any.tokens('adposition det adj n np clause'),
@@ -403,7 +399,7 @@ declension_noun_traversal = (
 deck_format = 'html'
 deck_path = 'flashcards/germanic/middle-english'
 
-write(f'{deck_path}/finite-conjugation.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/finite-conjugation.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -420,7 +416,7 @@ write(f'{deck_path}/finite-conjugation.{deck_format}',
     ))
 
 """
-write(f'{deck_path}/participle-declension.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/participle-declension.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -442,7 +438,7 @@ write(f'{deck_path}/participle-declension.{deck_format}',
     ))
 """
 
-write(f'{deck_path}/adpositions.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/adpositions.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -462,7 +458,7 @@ write(f'{deck_path}/adpositions.{deck_format}',
         },
     ))
 
-write(f'{deck_path}/common-noun-declension.{deck_format}',
+deck_scheduling.schedule(f'{deck_path}/common-noun-declension.{deck_format}',
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -478,7 +474,7 @@ write(f'{deck_path}/common-noun-declension.{deck_format}',
         },
     ))
 
-write(f'{deck_path}/pronoun-declension.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/pronoun-declension.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -494,7 +490,7 @@ write(f'{deck_path}/pronoun-declension.{deck_format}',
         },
     ))
 
-write(f'{deck_path}/adjective-agreement.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/adjective-agreement.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -513,7 +509,7 @@ write(f'{deck_path}/adjective-agreement.{deck_format}',
         },
     ))
 
-write(f'{deck_path}/pronoun-possessives.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/pronoun-possessives.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -536,6 +532,9 @@ write(f'{deck_path}/pronoun-possessives.{deck_format}',
         },
     ))
 
+if __name__ == '__main__':
+    deck_scheduling.run()
+
 end_time = time.time()
 duration = end_time-start_time
 print(f'runtime: {int(duration//60)}:{int(duration%60):02}')
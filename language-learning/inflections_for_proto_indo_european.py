@@ -12,12 +12,12 @@ from tools.nodemaps import (
     ListTools, ListGrammar, ListSemantics,
     RuleTools, RuleFormatting, RuleSyntax, 
 )
-from tools.cards import DeckGeneration
+from tools.cards import DeckGeneration, DeckScheduling
 from tools.inflections import (
     dict_bundle_to_map,
     LanguageSpecificTextDemonstration, LanguageSpecificEmojiDemonstration, 
     card_formatting,
-    tsv_parsing,
+    tsv_parsing, AnnotatedFiles,
     finite_annotation, nonfinite_annotation,
     pronoun_annotation, common_noun_annotation, possessive_pronoun_annotation, 
     conjugation_population, declension_population, 
@@ -37,47 +37,40 @@ from languages.english import native_english_demonstration
 
 label_editing = TermLabelEditing()
 deck_generation = DeckGeneration()
+deck_scheduling = DeckScheduling(write)
 list_tools = ListTools()
 rule_tools = RuleTools()
 
 foreign_language = Language(
     ListSemantics(
         case_usage_population.index(
-            case_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/proto-indo-european/sihler/case-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (case_usage_annotation, 'data/inflection/indo-european/proto-indo-european/sihler/case-usage.tsv')])),
         mood_usage_population.index(
-            mood_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/proto-indo-european/sihler/mood-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (mood_usage_annotation, 'data/inflection/indo-european/proto-indo-european/sihler/mood-usage.tsv')])),
         aspect_usage_population.index(
-            aspect_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/aspect-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (aspect_usage_annotation, 'data/inflection/indo-european/aspect-usage.tsv')])),
     ),
     ListGrammar(
         NestedDictLookup(
-            conjugation_population.index([
-                *finite_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/proto-indo-european/sihler/finite-conjugations.tsv')),
-                *finite_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/proto-indo-european/sihler/finite-conjugations-scraped.tsv')),
-                *nonfinite_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/proto-indo-european/sihler/nonfinite-conjugations.tsv')),
-            ])),
+            conjugation_population.index(AnnotatedFiles(tsv_parsing, [
+                (finite_annotation, 'data/inflection/indo-european/proto-indo-european/sihler/finite-conjugations.tsv'),
+                (finite_annotation, 'data/inflection/indo-european/proto-indo-european/sihler/finite-conjugations-scraped.tsv'),
+                (nonfinite_annotation, 'data/inflection/indo-european/proto-indo-european/sihler/nonfinite-conjugations.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/proto-indo-european/sihler/pronoun-declensions.tsv')),
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/proto-indo-european/sihler/common-noun-declensions.tsv')),
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/proto-indo-european/sihler/common-noun-declensions-scraped.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (pronoun_annotation, 'data/inflection/indo-european/proto-indo-european/sihler/pronoun-declensions.tsv'),
+                (common_noun_annotation, 'data/inflection/indo-european/proto-indo-european/sihler/common-noun-declensions.tsv'),
+                (common_noun_annotation, 'data/inflection/indo-european/proto-indo-european/sihler/common-noun-declensions-scraped.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *possessive_pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/proto-indo-european/sihler/pronoun-possessives.tsv')),
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/proto-indo-european/sihler/adjective-agreements.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (possessive_pronoun_annotation, 'data/inflection/indo-european/proto-indo-european/sihler/pronoun-possessives.tsv'),
+                (common_noun_annotation, 'data/inflection/indo-european/proto-indo-european/sihler/adjective-agreements.tsv'),
+            ]))),
     ),
     RuleSyntax(
         parse_any.tokens('adposition det adj n np clause'),
@@ -368,7 +361,7 @@ declension_noun_traversal = (
         & template_verb_whitelist)
 )
 
-write('flashcards/proto-indo-european/finite-conjugation.html', 
+deck_scheduling.schedule('flashcards/proto-indo-european/finite-conjugation.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -385,7 +378,7 @@ write('flashcards/proto-indo-european/finite-conjugation.html',
     ))
 
 """
-write('flashcards/proto-indo-european/participle-declension.html', 
+deck_scheduling.schedule('flashcards/proto-indo-european/participle-declension.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -407,7 +400,7 @@ write('flashcards/proto-indo-european/participle-declension.html',
     ))
 """
 
-write('flashcards/proto-indo-european/adpositions.html', 
+deck_scheduling.schedule('flashcards/proto-indo-european/adpositions.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -427,7 +420,7 @@ write('flashcards/proto-indo-european/adpositions.html',
         },
     ))
 
-write('flashcards/proto-indo-european/common-noun-declension.html',
+deck_scheduling.schedule('flashcards/proto-indo-european/common-noun-declension.html',
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -443,7 +436,7 @@ write('flashcards/proto-indo-european/common-noun-declension.html',
         },
     ))
 
-write('flashcards/proto-indo-european/pronoun-declension.html', 
+deck_scheduling.schedule('flashcards/proto-indo-european/pronoun-declension.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -459,7 +452,7 @@ write('flashcards/proto-indo-european/pronoun-declension.html',
         },
     ))
 
-write('flashcards/proto-indo-european/adjective-agreement.html', 
+deck_scheduling.schedule('flashcards/proto-indo-european/adjective-agreement.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -479,7 +472,7 @@ write('flashcards/proto-indo-european/adjective-agreement.html',
         },
     ))
 
-write('flashcards/proto-indo-european/pronoun-possessives.html', 
+deck_scheduling.schedule('flashcards/proto-indo-european/pronoun-possessives.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -502,6 +495,9 @@ write('flashcards/proto-indo-european/pronoun-possessives.html',
         },
     ))
 
+if __name__ == '__main__':
+    deck_scheduling.run()
+
 end_time = time.time()
 duration = end_time-start_time
 print(f'runtime: {int(duration//60)}:{int(duration%60):02}')
@@ -12,12 +12,12 @@ from tools.nodemaps import (
     ListTools, ListGrammar, ListSemantics,
     RuleTools, RuleFormatting, 
 )
-from tools.cards import DeckGeneration
+from tools.cards import DeckGeneration, DeckScheduling
 from tools.inflections import (
     dict_bundle_to_map,
     LanguageSpecificTextDemonstration, LanguageSpecificEmojiDemonstration, 
     card_formatting,
-    tsv_parsing,
+    tsv_parsing, AnnotatedFiles,
     finite_annotation,
     pronoun_annotation, common_noun_annotation, possessive_pronoun_annotation, 
     conjugation_population, declension_population, 
@@ -38,43 +38,38 @@ from languages.english import native_english_demonstration
 
 label_editing = TermLabelEditing()
 deck_generation = DeckGeneration()
+deck_scheduling = DeckScheduling(write)
 list_tools = ListTools()
 rule_tools = RuleTools()
 
 foreign_language = Language(
     ListSemantics(
         case_usage_population.index(
-            case_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/romance/romanian/modern/case-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (case_usage_annotation, 'data/inflection/indo-european/romance/romanian/modern/case-usage.tsv')])),
         mood_usage_population.index(
-            mood_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/romance/romanian/modern/mood-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (mood_usage_annotation, 'data/inflection/indo-european/romance/romanian/modern/mood-usage.tsv')])),
         aspect_usage_population.index(
-            aspect_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/aspect-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (aspect_usage_annotation, 'data/inflection/indo-european/aspect-usage.tsv')])),
     ),
     ListGrammar(
         NestedDictLookup(
-            conjugation_population.index([
-                *finite_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/romanian/modern/finite-conjugations.tsv')),
-                # *nonfinite_annotation.annotate(
-                #     tsv_parsing.rows('data/inflection/indo-european/romance/romanian/modern/nonfinite-conjugations.tsv')),
-            ])),
+            conjugation_population.index(AnnotatedFiles(tsv_parsing, [
+                (finite_annotation, 'data/inflection/indo-european/romance/romanian/modern/finite-conjugations.tsv'),
+                # (nonfinite_annotation, 'data/inflection/indo-european/romance/romanian/modern/nonfinite-conjugations.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/romanian/modern/common-noun-declensions.tsv')),
-                *pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/romanian/modern/pronoun-declensions.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (common_noun_annotation, 'data/inflection/indo-european/romance/romanian/modern/common-noun-declensions.tsv'),
+                (pronoun_annotation, 'data/inflection/indo-european/romance/romanian/modern/pronoun-declensions.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *possessive_pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/romanian/modern/pronoun-possessives.tsv')),
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/romance/romanian/modern/adjective-agreements.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (possessive_pronoun_annotation, 'data/inflection/indo-european/romance/romanian/modern/pronoun-possessives.tsv'),
+                (common_noun_annotation, 'data/inflection/indo-european/romance/romanian/modern/adjective-agreements.tsv'),
+            ]))),
     ),
     ModernRomanceRuleSyntax(
         parse_any.tokens('adposition det adj n np clause'),
@@ -388,7 +383,7 @@ declension_noun_traversal = (
         & template_verb_whitelist)
 )
 
-write('flashcards/romance/romanian/finite-conjugation.html', 
+deck_scheduling.schedule('flashcards/romance/romanian/finite-conjugation.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -404,7 +399,7 @@ write('flashcards/romance/romanian/finite-conjugation.html',
         },
     ))
 
-write('flashcards/romance/romanian/adpositions.html', 
+deck_scheduling.schedule('flashcards/romance/romanian/adpositions.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -424,7 +419,7 @@ write('flashcards/romance/romanian/adpositions.html',
         },
     ))
 
-write('flashcards/romance/romanian/common-noun-declension.html',
+deck_scheduling.schedule('flashcards/romance/romanian/common-noun-declension.html',
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -442,7 +437,7 @@ write('flashcards/romance/romanian/common-noun-declension.html',
         },
     ))
 
-write('flashcards/romance/romanian/pronoun-declension.html', 
+deck_scheduling.schedule('flashcards/romance/romanian/pronoun-declension.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -459,7 +454,7 @@ write('flashcards/romance/romanian/pronoun-declension.html',
         },
     ))
 
-write('flashcards/romance/romanian/adjective-agreement.html', 
+deck_scheduling.schedule('flashcards/romance/romanian/adjective-agreement.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -480,7 +475,7 @@ write('flashcards/romance/romanian/adjective-agreement.html',
         },
     ))
 
-write('flashcards/romance/romanian/pronoun-possessives.html', 
+deck_scheduling.schedule('flashcards/romance/romanian/pronoun-possessives.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -503,6 +498,9 @@ write('flashcards/romance/romanian/pronoun-possessives.html',
         },
     ))
 
+if __name__ == '__main__':
+    deck_scheduling.run()
+
 end_time = time.time()
 duration = end_time-start_time
 print(f'runtime: {int(duration//60)}:{int(duration%60):02}')
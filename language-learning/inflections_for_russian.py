@@ -12,12 +12,12 @@ from tools.nodemaps import (
     ListTools, ListGrammar, ListSemantics,
     RuleTools, RuleFormatting, RuleSyntax, 
 )
-from tools.cards import DeckGeneration
+from tools.cards import DeckGeneration, DeckScheduling
 from tools.inflections import (
     dict_bundle_to_map,
     LanguageSpecificTextDemonstration, LanguageSpecificEmojiDemonstration, 
     card_formatting,
-    tsv_parsing,
+    tsv_parsing, AnnotatedFiles,
     finite_annotation,
     pronoun_annotation, common_noun_annotation, possessive_pronoun_annotation, 
     conjugation_population, declension_population, 
@@ -37,41 +37,37 @@ from languages.english import native_english_demonstration
 
 label_editing = TermLabelEditing()
 deck_generation = DeckGeneration()
+deck_scheduling = DeckScheduling(write)
 list_tools = ListTools()
 rule_tools = RuleTools()
 
 foreign_language = Language(
     ListSemantics(
         case_usage_population.index(
-            case_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/slavic/russian/case-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (case_usage_annotation, 'data/inflection/indo-european/slavic/russian/case-usage.tsv')])),
         mood_usage_population.index(
-            mood_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/slavic/russian/mood-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (mood_usage_annotation, 'data/inflection/indo-european/slavic/russian/mood-usage.tsv')])),
         aspect_usage_population.index(
-            aspect_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/aspect-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (aspect_usage_annotation, 'data/inflection/indo-european/aspect-usage.tsv')])),
     ),
     ListGrammar(
         NestedDictLookup(
-            conjugation_population.index([
-                *finite_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/slavic/russian/conjugations.tsv')),
-            ])),
+            conjugation_population.index(AnnotatedFiles(tsv_parsing, [
+                (finite_annotation, 'data/inflection/indo-european/slavic/russian/conjugations.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/slavic/russian/common-noun-declensions.tsv')),
-                *pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/slavic/russian/pronoun-declensions.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (common_noun_annotation, 'data/inflection/indo-european/slavic/russian/common-noun-declensions.tsv'),
+                (pronoun_annotation, 'data/inflection/indo-european/slavic/russian/pronoun-declensions.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *possessive_pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/slavic/russian/pronoun-possessives.tsv')),
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/slavic/russian/adjective-agreements.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (possessive_pronoun_annotation, 'data/inflection/indo-european/slavic/russian/pronoun-possessives.tsv'),
+                (common_noun_annotation, 'data/inflection/indo-european/slavic/russian/adjective-agreements.tsv'),
+            ]))),
     ),
     RuleSyntax(
         parse_any.tokens('adposition det adj n np clause'),
@@ -513,7 +509,7 @@ declension_noun_traversal = (
         & template_verb_whitelist)
 )
 
-write('flashcards/slavic/russian/finite-conjugation.html', 
+deck_scheduling.schedule('flashcards/slavic/russian/finite-conjugation.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -531,7 +527,7 @@ write('flashcards/slavic/russian/finite-conjugation.html',
     ))
 
 """
-write('flashcards/slavic/russian/participle-declension.html', 
+deck_scheduling.schedule('flashcards/slavic/russian/participle-declension.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -553,7 +549,7 @@ write('flashcards/slavic/russian/participle-declension.html',
     ))
 """
 
-write('flashcards/slavic/russian/adpositions.html', 
+deck_scheduling.schedule('flashcards/slavic/russian/adpositions.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -573,7 +569,7 @@ write('flashcards/slavic/russian/adpositions.html',
         },
     ))
 
-write('flashcards/slavic/russian/common-noun-declension.html',
+deck_scheduling.schedule('flashcards/slavic/russian/common-noun-declension.html',
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -592,7 +588,7 @@ write('flashcards/slavic/russian/common-noun-declension.html',
     ))
 
 
-write('flashcards/slavic/russian/pronoun-declension.html', 
+deck_scheduling.schedule('flashcards/slavic/russian/pronoun-declension.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -608,7 +604,7 @@ write('flashcards/slavic/russian/pronoun-declension.html',
         },
     ))
 
-write('flashcards/slavic/russian/adjective-agreement.html', 
+deck_scheduling.schedule('flashcards/slavic/russian/adjective-agreement.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -627,7 +623,7 @@ write('flashcards/slavic/russian/adjective-agreement.html',
         },
     ))
 
-write('flashcards/slavic/russian/pronoun-possessives.html', 
+deck_scheduling.schedule('flashcards/slavic/russian/pronoun-possessives.html', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -650,6 +646,9 @@ write('flashcards/slavic/russian/pronoun-possessives.html',
         },
     ))
 
+if __name__ == '__main__':
+    deck_scheduling.run()
+
 end_time = time.time()
 duration = end_time-start_time
 print(f'runtime: {int(duration//60)}:{int(duration%60):02}')
@@ -12,12 +12,12 @@ from tools.nodemaps import (
     ListTools, ListGrammar, ListSemantics,
     RuleTools, RuleFormatting, RuleSyntax, 
 )
-from tools.cards import DeckGeneration
+from tools.cards import DeckGeneration, DeckScheduling
 from tools.inflections import (
     dict_bundle_to_map,
     LanguageSpecificTextDemonstration, LanguageSpecificEmojiDemonstration, 
     card_formatting,
-    tsv_parsing,
+    tsv_parsing, AnnotatedFiles,
     finite_annotation,
     pronoun_annotation, common_noun_annotation, possessive_pronoun_annotation, 
     conjugation_population, declension_population, 
@@ -37,6 +37,7 @@ from languages.english import native_english_demonstration
 
 label_editing = TermLabelEditing()
 deck_generation = DeckGeneration()
+deck_scheduling = DeckScheduling(write)
 list_tools = ListTools()
 rule_tools = RuleTools()
 
@@ -59,35 +60,30 @@ def definiteness(machine, tree, memory):
 foreign_language = Language(
     ListSemantics(
         case_usage_population.index(
-            case_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/germanic/swedish/modern/case-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (case_usage_annotation, 'data/inflection/indo-european/germanic/swedish/modern/case-usage.tsv')])),
         mood_usage_population.index(
-            mood_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/germanic/swedish/modern/mood-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (mood_usage_annotation, 'data/inflection/indo-european/germanic/swedish/modern/mood-usage.tsv')])),
         aspect_usage_population.index(
-            aspect_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/aspect-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (aspect_usage_annotation, 'data/inflection/indo-european/aspect-usage.tsv')])),
     ),
     ListGrammar(
         NestedDictLookup(
-            conjugation_population.index([
-                *finite_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/germanic/swedish/modern/conjugations.tsv')),
-            ])),
+            conjugation_population.index(AnnotatedFiles(tsv_parsing, [
+                (finite_annotation, 'data/inflection/indo-european/germanic/swedish/modern/conjugations.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/germanic/swedish/modern/common-noun-declensions.tsv')),
-                *pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/germanic/swedish/modern/pronoun-declensions.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (common_noun_annotation, 'data/inflection/indo-european/germanic/swedish/modern/common-noun-declensions.tsv'),
+                (pronoun_annotation, 'data/inflection/indo-european/germanic/swedish/modern/pronoun-declensions.tsv'),
+            ]))),
         NestedDictLookup(
-            declension_population.index([
-                *possessive_pronoun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/germanic/swedish/modern/pronoun-possessives.tsv')),
-                *common_noun_annotation.annotate(
-                    tsv_parsing.rows('data/inflection/indo-european/germanic/swedish/modern/adjective-agreements.tsv')),
-            ])),
+            declension_population.index(AnnotatedFiles(tsv_parsing, [
+                (possessive_pronoun_annotation, 'data/inflection/indo-european/germanic/swedish/modern/pronoun-possessives.tsv'),
+                (common_noun_annotation, 'data/inflection/indo-european/germanic/swedish/modern/adjective-agreements.tsv'),
+            ]))),
     ),
     RuleSyntax(
         parse_any.tokens('adposition det adj np n clause'),
@@ -395,7 +391,7 @@ declension_noun_traversal = (
 deck_path = 'flashcards/germanic/swedish'
 deck_format = 'tsv'
 
-write(f'{deck_path}/finite-conjugation.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/finite-conjugation.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -412,7 +408,7 @@ write(f'{deck_path}/finite-conjugation.{deck_format}',
     ))
 
 """
-write(f'{deck_path}/participle-declension.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/participle-declension.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = UniformDictLookup(
@@ -434,7 +430,7 @@ write(f'{deck_path}/participle-declension.{deck_format}',
     ))
 """
 
-write(f'{deck_path}/adpositions.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/adpositions.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -454,7 +450,7 @@ write(f'{deck_path}/adpositions.{deck_format}',
         },
     ))
 
-write(f'{deck_path}/common-noun-{deck_format}.tsv',
+deck_scheduling.schedule(f'{deck_path}/common-noun-{deck_format}.tsv',
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -470,7 +466,7 @@ write(f'{deck_path}/common-noun-{deck_format}.tsv',
         },
     ))
 
-write(f'{deck_path}/pronoun-declension.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/pronoun-declension.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -486,7 +482,7 @@ write(f'{deck_path}/pronoun-declension.{deck_format}',
         },
     ))
 
-write(f'{deck_path}/adjective-agreement.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/adjective-agreement.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -505,7 +501,7 @@ write(f'{deck_path}/adjective-agreement.{deck_format}',
         },
     ))
 
-write(f'{deck_path}/pronoun-possessives.{deck_format}', 
+deck_scheduling.schedule(f'{deck_path}/pronoun-possessives.{deck_format}', 
     deck_generation.generate(
         [demonstration.generator(
             tree_lookup = template_tree_lookup,
@@ -528,6 +524,9 @@ write(f'{deck_path}/pronoun-possessives.{deck_format}',
         },
     ))
 
+if __name__ == '__main__':
+    deck_scheduling.run()
+
 end_time = time.time()
 duration = end_time-start_time
 print(f'runtime: {int(duration//60)}:{int(duration%60):02}')
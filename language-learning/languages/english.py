@@ -18,8 +18,9 @@ from tools.inflections import (
     case_usage_annotation, mood_usage_annotation, aspect_usage_annotation, 
     pronoun_annotation, common_noun_annotation, possessive_pronoun_annotation, 
     finite_annotation, mood_annotation,
-    tsv_parsing,
+    tsv_parsing, AnnotatedFiles,
     parse_any,
+    lookup_caching,
     LanguageSpecificTextDemonstration
 )
 
@@ -389,50 +390,45 @@ english_conjugation_template_lookups = DictLookup(
 
 english_conjugation_population = NestedLookupPopulation(
     english_conjugation_template_lookups, 
-    KeyEvaluation('inflection'))
+    KeyEvaluation('inflection'),
+    caching=lookup_caching)
 
 english_language = Language(
     ListSemantics(
         case_usage_population.index(
-            case_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/germanic/english/modern/case-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (case_usage_annotation, 'data/inflection/indo-european/germanic/english/modern/case-usage.tsv')])),
         mood_usage_population.index(
-            mood_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/germanic/english/modern/mood-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (mood_usage_annotation, 'data/inflection/indo-european/germanic/english/modern/mood-usage.tsv')])),
         aspect_usage_population.index(
-            aspect_usage_annotation.annotate(
-                tsv_parsing.rows('data/inflection/indo-european/aspect-usage.tsv'))),
+            AnnotatedFiles(tsv_parsing, [
+                (aspect_usage_annotation, 'data/inflection/indo-european/aspect-usage.tsv')])),
         # debug=True,
     ),
     ListGrammar(
         FallbackDictLookup(
             NestedDictLookup(
-                english_conjugation_population.index([
-                    *finite_annotation.annotate(
-                        tsv_parsing.rows('data/inflection/indo-european/germanic/english/modern/irregular-conjugations.tsv')),
-                    *finite_annotation.annotate(
-                        tsv_parsing.rows('data/inflection/indo-european/germanic/english/modern/regular-conjugations.tsv')),
-                ])),
+                english_conjugation_population.index(AnnotatedFiles(tsv_parsing, [
+                    (finite_annotation, 'data/inflection/indo-european/germanic/english/modern/irregular-conjugations.tsv'),
+                    (finite_annotation, 'data/inflection/indo-european/germanic/english/modern/regular-conjugations.tsv'),
+                ]))),
             ProceduralLookup(regular_english_grammar.conjugate),
         ),
         FallbackDictLookup(
             NestedDictLookup(
-                declension_population.index([
-                    *pronoun_annotation.annotate(
-                        tsv_parsing.rows('data/inflection/indo-european/germanic/english/modern/pronoun-declensions.tsv')),
-                    *common_noun_annotation.annotate(
-                        tsv_parsing.rows('data/inflection/indo-european/germanic/english/modern/common-noun-declensions.tsv')),
-                ])),
+                declension_population.index(AnnotatedFiles(tsv_parsing, [
+                    (pronoun_annotation, 'data/inflection/indo-european/germanic/english/modern/pronoun-declensions.tsv'),
+                    (common_noun_annotation, 'data/inflection/indo-european/germanic/english/modern/common-noun-declensions.tsv'),
+                ]))),
             ProceduralLookup(regular_english_grammar.decline),
         ),
         FallbackDictLookup(
             NestedDictLookup(
-                declension_population.index([
-                    *possessive_pronoun_annotation.annotate(
-                        tsv_parsing.rows('data/inflection/indo-european/germanic/english/modern/pronoun-possessives.tsv')),
-                    *common_noun_annotation.annotate(
-                        tsv_parsing.rows('data/inflection/indo-european/germanic/english/modern/adjective-agreements.tsv')),
-                ])
+                declension_population.index(AnnotatedFiles(tsv_parsing, [
+                    (possessive_pronoun_annotation, 'data/inflection/indo-european/germanic/english/modern/pronoun-possessives.tsv'),
+                    (common_noun_annotation, 'data/inflection/indo-european/germanic/english/modern/adjective-agreements.tsv'),
+                ]))
             ),
             ProceduralLookup(regular_english_grammar.agree),
         ),
@@ -473,8 +469,8 @@ def mood_context(mood_templates):
 
 english_mood_context = mood_context(
     mood_population.index(
-        mood_annotation.annotate(
-            tsv_parsing.rows('data/inflection/indo-european/germanic/english/modern/mood-templates.tsv'))))
+        AnnotatedFiles(tsv_parsing, [
+            (mood_annotation, 'data/inflection/indo-european/germanic/english/modern/mood-templates.tsv')])))
 
 native_english_demonstration = LanguageSpecificTextDemonstration(
     english_orthography,
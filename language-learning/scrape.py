@@ -1,10 +1,38 @@
+'''
+"scrape.py" writes the `scraped-*.tsv` files of each language from the inflection tables of wiktionary.
+Each file is written by a `ScrapeJob`, and jobs run concurrently while sharing a rate limit for each host.
+Jobs that complete are recorded in a checkpoint file, so a run that is interrupted or fails resumes where it stopped.
+By default only the Middle English jobs run, as before, while the jobs of other languages run only when selected by language or with `--all`.
+
+Usage:
+    python3 scrape.py                            # scrape the languages that run by default
+    python3 scrape.py --all                      # scrape every language
+    python3 scrape.py swedish latin              # scrape only files whose paths contain the given text
+    python3 scrape.py greek --parts nouns genders
+    python3 scrape.py --offline                  # use only pages that were already fetched
+    python3 scrape.py --offline --processes 8    # reparse fetched pages across 8 worker processes
+    python3 scrape.py --offline --allow-missing  # write files even if some of their pages were never fetched
+    python3 scrape.py --restart                  # ignore the checkpoint of an earlier run
+'''
 
 # built-in libraries
-import requests
+import os
+import re
 import time
+import argparse
+import traceback
+import pickle
+import hashlib
+import tempfile
+import functools
+import threading
+import multiprocessing
+import urllib.parse
+import concurrent.futures
 
 # 3rd party libraries
-from bs4 import BeautifulSoup
+import requests
+import lxml.html
 
 # in-house libraries
 from tools.inflections import write
@@ -18,15 +46,74 @@ class Uniform:
     def __next__(self):
         return self.value
 
+def document(html):
+	'''
+	Returns the root element of `html` as parsed by lxml, which is several times faster than BeautifulSoup.
+	'''
+	return lxml.html.document_fromstring(html or '<html></html>')
+
+def language_section_html(html, language_id):
+	'''
+	Returns the part of `html` that runs from the header whose id is `language_id` up to the next header of the same level or higher,
+	so that only the section of a single language is ever parsed, or returns all of `html` if no such header exists.
+	'''
+	start = re.search(f'<h([1-6])\\b[^>]*\\bid="{re.escape(language_id)}"', html)
+	if not start:
+		return html
+	end = re.compile(f'<h[1-{start.group(1)}][\\s>]').search(html, start.end())
+	return html[start.start():end.start() if end else len(html)]
+
+def with_class(element, axis, tag, class_name):
+	'''
+	Returns the elements along `axis` of `element` that have the given `tag` and `class_name`, in the manner of ".class_name" within css.
+	'''
+	return element.xpath(f'{axis}::{tag}[contains(concat(" ", normalize-space(@class), " "), " {class_name} ")]')
+
+def next_element(element, tag):
+	'''
+	Returns the first element with the given `tag` that comes after the start of `element` within the document, 
+	including those nested within `element`, in the manner of `find_next()` within BeautifulSoup, or None if there is none.
+	'''
+	for descendant in element.iterdescendants(tag):
+		return descendant
+	while element is not None:
+		for sibling in element.itersiblings():
+			for following in sibling.iter(tag):
+				return following
+		element = element.getparent()
+	return None
+
+def headers(level_id):
+	return [f'h{i}' for i in range(level_id,7)]
+
+def headers_after(element, level_id, texts):
+	'''
+	Returns the headers of level `level_id` or lower that follow `element`, and whose text is any of `texts`.
+	'''
+	return [header 
+		for header in element.xpath('following::*[' + ' or '.join(f'self::{header}' for header in headers(level_id)) + ']')
+		if header.text_content() in texts]
+
+def bunched_rows(ops, parsing, lemma_html):
+	(lemma, html) = lemma_html
+	return ops.bunch(
+		Uniform([lemma]), 
+		parsing.parse(parsing.document(html)))
+
 class TableScraping:
-	def __init__(self, ops):
+	'''
+	`TableScraping` parses the pages of a crawl into rows, each of which begins with the lemma of its page.
+	If a `pool` of worker processes is given, pages are parsed across the pool, 
+	but rows are still yielded in the order of the crawl, so that output files only change where their content does.
+	'''
+	def __init__(self, ops, pool=None):
 		self.ops = ops
+		self.pool = pool
 	def scrape(self, parsing, lemma_html):
-		for (lemma, html) in lemma_html:
-			soup = BeautifulSoup(html)
-			bunched = self.ops.bunch(
-				Uniform([lemma]), 
-				parsing.parse(soup))
+		lemma_html = list(lemma_html)
+		parse = functools.partial(bunched_rows, self.ops, parsing)
+		bunches = self.pool.imap(parse, lemma_html) if self.pool else map(parse, lemma_html)
+		for ((lemma, html), bunched) in zip(lemma_html, bunches):
 			# print a progress indicator since rate limiting slows us down considerably
 			print('\t'.join(['    ' if bunched else 'FAIL', lemma]))
 			for row in bunched:
@@ -67,49 +154,69 @@ class RowMajorWikiTableHtml:
 		self.language_id = language_id
 		self.language_code = language_code
 		self.table_count = table_count
+	def document(self, html):
+		return document(language_section_html(html, self.language_id))
+	def grid(self, rows):
+		'''
+		Returns the rows of a table whose cells are given as (colspan, rowspan, lines) for each row of `rows`,
+		after expanding every cell over its spans, where every line of a cell is given a column of its own.
+		The grid is allocated in full before it is filled, since its height is known from the spans of the cells.
+		'''
+		height = max([0, *[y+rowspan for (y, row) in enumerate(rows) for (colspan, rowspan, lines) in row if colspan >= 1 and rowspan >= 1]])
+		grid = [[] for y in range(height)]
+		for (y, row) in enumerate(rows):
+			x = 0
+			for (colspan, rowspan, lines) in row:
+				# cells that span no rows or columns, such as those with rowspan="0", cover nothing and may lie beyond the grid
+				if colspan < 1 or rowspan < 1:
+					continue
+				while x < len(grid[y]) and grid[y][x] is not None: x+=1
+				for dy in range(rowspan):
+					cells = grid[y+dy]
+					if len(cells) < x+colspan:
+						cells.extend([None]*(x+colspan-len(cells)))
+					for dx in range(colspan):
+						# a cell that overlaps another only replaces as many lines as it has
+						previous = cells[x+dx]
+						cells[x+dx] = lines if not previous or len(previous) <= len(lines) else lines+previous[len(lines):]
+		width = max([0, *[len(cells) for cells in grid]])
+		depth = max([0, *[len(lines) for cells in grid for lines in cells if lines]])
+		for cells in grid:
+			if any(cells):
+				cells = cells + [None]*(width-len(cells))
+				yield [(lines[z] if lines and z < len(lines) else '') 
+					for lines in cells
+					for z in range(depth)]
+			else:
+				yield ['']*(width*depth)
 	def body(self, content): 
 		def extract(source, extractions):
-			remainder = source.text
+			remainder = source.text_content()
 			for extraction in extractions:
-				remainder = remainder.replace(extraction.text, '')
-			return [remainder, *[extraction.text for extraction in extractions]]
-		def maxi(vectors, i):
-			return max([0,*[vector[i]+1 for vector in vectors]])
+				remainder = remainder.replace(extraction.text_content(), '')
+			return [remainder, *[extraction.text_content() for extraction in extractions]]
 		def span(attrs, span):
 			return int(attrs[span]) if span in attrs and '%' not in attrs[span] else 1
-		cells = {}
-		for (y, row) in enumerate(content.select('tr')):
-			x = 0
-			for cell in row.select('td,th'):
-				while (x,y,0) in cells: x+=1
-				colspan = span(cell.attrs, 'colspan')
-				rowspan = span(cell.attrs, 'rowspan')
-				lines = (extract(cell, cell.select('span.tr')) if cell.name == 'td' else [cell.text.lower()])
-				for dx in range(colspan):
-					for dy in range(rowspan):
-						for (z, line) in enumerate(lines):
-							cells[(x+dx,y+dy,z)] = line
-		lx = maxi(cells.keys(), 0)
-		ly = maxi(cells.keys(), 1)
-		lz = maxi(cells.keys(), 2)
-		for y in range(ly):
-			yield [(cells[(x,y,z)] if (x,y,z) in cells else '') 
-				for x in range(lx)
-				for z in range(lz)]
-	def parse(self, soup):
-		header = lambda level_id: [f'h{i}' for i in range(level_id,7)]
-		language_section = soup.find(header(1), id=self.language_id)
-		if language_section:
-			level_id = int(language_section.name.replace('h',''))
-			part_of_speech_section = language_section.find_next(header(level_id+1), text=self.part_of_speech_text)
-			if part_of_speech_section:
-				for section in part_of_speech_section.find_all_next(header(level_id+2), text=self.table_texts):
+		return self.grid([
+			[(span(cell.attrib, 'colspan'), 
+			  span(cell.attrib, 'rowspan'), 
+			  (extract(cell, with_class(cell, 'descendant', 'span', 'tr')) if cell.tag == 'td' else [cell.text_content().lower()]))
+				for cell in row.iterdescendants('td', 'th')]
+			for row in content.iterdescendants('tr')])
+	def parse(self, root):
+		language_sections = [header for header in root.iter(*headers(1)) if header.get('id') == self.language_id]
+		if language_sections:
+			language_section = language_sections[0]
+			level_id = int(language_section.tag.replace('h',''))
+			part_of_speech_sections = headers_after(language_section, level_id+1, [self.part_of_speech_text])
+			if part_of_speech_sections:
+				for section in headers_after(part_of_speech_sections[0], level_id+2, self.table_texts):
 					for i in range(self.table_count):
-						section2 = section.find_next('table')
-						if not section2:
+						section2 = next_element(section, 'table')
+						if section2 is None:
 							break
 						else:
-							if not self.language_code or section2.select(f'span[lang="{self.language_code}"]'):
+							if not self.language_code or any(span.get('lang') == self.language_code for span in section2.iter('span')):
 								for row in self.body(section2):
 									yield row
 								section = section2
@@ -117,17 +224,19 @@ class RowMajorWikiTableHtml:
 class GreekRowMajorWikiTableHtml(RowMajorWikiTableHtml):
 	def __init__(self, ops):
 		self.ops = ops
+	def document(self, html):
+		return document(html)
 	def dialect(self, head): 
 		head = head
-		dialect = head.select_one('.extiw')
+		dialect = with_class(head, 'descendant', '*', 'extiw')
 		# if dialect:
-		# 	return dialect.text.lower()
-		return head.text or ''
-	def parse(self, soup):
-		for frame in soup.select('.NavFrame'):
+		# 	return dialect[0].text_content().lower()
+		return head.text_content() or ''
+	def parse(self, root):
+		for frame in with_class(root, 'descendant', '*', 'NavFrame'):
 			for row in self.ops.bunch(
-					Uniform([self.dialect(frame.select_one('.NavHead'))]), 
-					self.body(frame.select_one('.NavContent'))):
+					Uniform([self.dialect(with_class(frame, 'descendant', '*', 'NavHead')[0])]), 
+					self.body(with_class(frame, 'descendant', '*', 'NavContent')[0])):
 				yield row
 
 class GenderWikiHtml:
@@ -135,16 +244,18 @@ class GenderWikiHtml:
 		self.ops = ops
 		self.part_of_speech_text = part_of_speech_text
 		self.language_id = language_id
-	def parse(self, soup):
-		header = lambda level_id: [f'h{i}' for i in range(level_id,7)]
-		language_section = soup.find(header(1), id=self.language_id)
-		if language_section:
-			level_id = int(language_section.name.replace('h',''))
-			part_of_speech_section = language_section.find_next(header(level_id+1), text=self.part_of_speech_text)
-			if part_of_speech_section:
-				gender_sections = language_section.find_all_next('span', class_='gender')
+	def document(self, html):
+		return document(language_section_html(html, self.language_id))
+	def parse(self, root):
+		language_sections = [header for header in root.iter(*headers(1)) if header.get('id') == self.language_id]
+		if language_sections:
+			language_section = language_sections[0]
+			level_id = int(language_section.tag.replace('h',''))
+			part_of_speech_sections = headers_after(language_section, level_id+1, [self.part_of_speech_text])
+			if part_of_speech_sections:
+				gender_sections = with_class(language_section, 'following', 'span', 'gender')
 				if gender_sections:
-					for gender in (gender_sections[0].text
+					for gender in (gender_sections[0].text_content()
 										.replace('n','neuter')
 										.replace('m','masculine')
 										.replace('f','feminine')
@@ -152,30 +263,225 @@ class GenderWikiHtml:
 						yield [gender]
 
 
+class TokenBucket:
+	'''
+	`TokenBucket` allows bursts of up to `capacity` requests, which are then refilled at `rate` requests per second.
+	`take()` reserves a token before sleeping, so threads that share a bucket are served in the order that they arrive.
+	'''
+	def __init__(self, rate, capacity=1):
+		self.rate = rate
+		self.capacity = capacity
+		self.tokens = capacity
+		self.updated = time.monotonic()
+		self.lock = threading.Lock()
+	def take(self):
+		with self.lock:
+			now = time.monotonic()
+			self.tokens = min(self.capacity, self.tokens + (now-self.updated)*self.rate) - 1
+			self.updated = now
+			delay = -self.tokens/self.rate if self.tokens < 0 else 0
+		time.sleep(delay)
+
+class RateLimiting:
+	'''
+	`RateLimiting` keeps a separate `TokenBucket` for each host, so that requests to one host never delay those to another.
+	'''
+	def __init__(self, rate=1, capacity=1):
+		self.rate = rate
+		self.capacity = capacity
+		self.buckets = {}
+		self.lock = threading.Lock()
+	def wait(self, url):
+		host = urllib.parse.urlsplit(url).netloc
+		with self.lock:
+			if host not in self.buckets:
+				self.buckets[host] = TokenBucket(self.rate, self.capacity)
+			bucket = self.buckets[host]
+		bucket.take()
+
 class Caching:
-	def __init__(self, parsing):
+	'''
+	`Caching` fetches the page for each lemma of a crawl, storing responses as files within `directory`, keyed by url, 
+	so that later runs only request pages that have changed since.
+	A stored response is used as is for `max_age` seconds, after which it is revalidated by a conditional request, 
+	which costs the server little if the page has not changed.
+	If `offline`, pages are only ever read from `directory`, and lemmas whose pages were never stored are crawled as None.
+	Requests are made by up to `max_workers` threads that share a pooled `requests.Session`, 
+	while `limiting` keeps each host to its rate limit however many threads there are.
+	'''
+	def __init__(self, parsing, directory=os.path.join('.cache', 'scrape'), limiting=None, 
+			max_workers=4, max_age=24*60*60, offline=False):
 		self.parsing = parsing
+		self.directory = directory
+		self.limiting = limiting or RateLimiting()
+		self.max_workers = max_workers
+		self.max_age = max_age
+		self.offline = offline
+		self.session = requests.Session()
+		adapter = requests.adapters.HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+		self.session.mount('http://', adapter)
+		self.session.mount('https://', adapter)
+	def filename(self, url):
+		# fragments are never sent to the server, so urls that differ only by fragment share the same response
+		digest = hashlib.sha256(urllib.parse.urldefrag(url).url.encode()).hexdigest()
+		return os.path.join(self.directory, f'{digest}.pickle')
+	def load(self, url):
+		try:
+			with open(self.filename(url), 'rb') as file:
+				return pickle.load(file)
+		except (OSError, EOFError, pickle.UnpicklingError):
+			return None
+	def store(self, url, response):
+		os.makedirs(self.directory, exist_ok=True)
+		with tempfile.NamedTemporaryFile('wb', dir=self.directory, suffix='.tmp', delete=False) as file:
+			pickle.dump(response, file, protocol=pickle.HIGHEST_PROTOCOL)
+		os.replace(file.name, self.filename(url))
+	def fetch(self, url):
+		'''
+		Returns the text of the page at `url`, or None if it is not stored and `offline` is set.
+		If the page cannot be fetched, the stored copy is returned if there is one, and an error is raised otherwise.
+		'''
+		cached = self.load(url)
+		if self.offline or (cached and time.time() - cached['time'] < self.max_age):
+			return cached['text'] if cached else None
+		headers = {}
+		if cached and cached['etag']:
+			headers['If-None-Match'] = cached['etag']
+		if cached and cached['last_modified']:
+			headers['If-Modified-Since'] = cached['last_modified']
+		self.limiting.wait(url)
+		try:
+			response = self.session.get(urllib.parse.urldefrag(url).url, headers=headers, timeout=60)
+		except requests.RequestException:
+			if cached:
+				return cached['text']
+			raise
+		if response.status_code == 304 and cached:
+			self.store(url, {**cached, 'time': time.time()})
+			return cached['text']
+		if not 200 <= response.status_code < 300:
+			# error pages, such as those served when rate limited or overloaded, must never be mistaken for the page itself
+			if cached:
+				return cached['text']
+			raise requests.HTTPError(f'{response.status_code} response for {url}', response=response)
+		self.store(url, {
+			'url': url,
+			'time': time.time(),
+			'etag': response.headers.get('ETag'),
+			'last_modified': response.headers.get('Last-Modified'),
+			'text': response.text,
+		})
+		return response.text
 	def crawl(self, lemma_url_text):
-		result = []
-		for lemma_url in self.parsing.tokenpoints(lemma_url_text):
-			if len(lemma_url) == 2:
-				(lemma, url) = lemma_url
-				print('\t'.join([lemma, url]))
-				time.sleep(1) # rate limit for kindness
-				result.append((lemma, requests.get(url).text))
-		return result
+		'''
+		Returns a list of (lemma, text) for every lemma of `lemma_url_text` that has a url, 
+		where `text` is None if the page of the lemma is missing.
+		'''
+		lemma_urls = [lemma_url 
+			for lemma_url in self.parsing.tokenpoints(lemma_url_text)
+			if len(lemma_url) == 2]
+		def fetch(lemma_url):
+			(lemma, url) = lemma_url
+			text = self.fetch(url)
+			print('\t'.join([lemma, url] if text is not None else [lemma, url, 'MISSING']))
+			return (lemma, text)
+		with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+			return list(executor.map(fetch, lemma_urls))
+
+class ScrapeJob:
+	'''
+	`ScrapeJob` writes the rows that `html_parsing` finds within the pages of `lemma_url_text` to `filename`,
+	which also serves as the name of the job, since no two jobs write the same file.
+	A job fails without writing if the page of any lemma is missing, such as when offline with a partial cache,
+	since its file would otherwise lose the rows of those lemmas, unless `allow_missing` is given.
+	'''
+	def __init__(self, filename, html_parsing, lemma_url_text):
+		self.filename = filename
+		self.html_parsing = html_parsing
+		self.lemma_url_text = lemma_url_text
+	def run(self, scraping, caching, formatting, allow_missing=False):
+		lemma_html = caching.crawl(self.lemma_url_text)
+		missing = [lemma for (lemma, html) in lemma_html if html is None]
+		if missing and not allow_missing:
+			raise LookupError(f'pages are missing for {self.filename}: {" ".join(missing)}')
+		lemma_html = [(lemma, html) for (lemma, html) in lemma_html if html is not None]
+		if not lemma_html:
+			raise LookupError(f'no pages are available for {self.filename}')
+		write(self.filename, formatting.format(scraping.scrape(self.html_parsing, lemma_html)))
+
+class Checkpoint:
+	'''
+	`Checkpoint` records the name of each job in `filename` as soon as it completes, 
+	so that a run that is interrupted can skip those jobs when it is resumed.
+	The jobs of a run are cleared from the file once every one of them completes, so that the next run of them starts afresh,
+	while any jobs that remain from an interrupted run of other jobs are kept, and the file is removed once it is empty.
+	'''
+	def __init__(self, filename):
+		self.filename = filename
+		self.lock = threading.Lock()
+		self.completed = set()
+		if os.path.exists(filename):
+			with open(filename) as file:
+				self.completed = {line.strip() for line in file if line.strip()}
+	def complete(self, name):
+		with self.lock:
+			os.makedirs(os.path.dirname(self.filename) or '.', exist_ok=True)
+			with open(self.filename, 'a') as file:
+				file.write(name+'\n')
+			self.completed.add(name)
+	def clear(self, names=None):
+		'''
+		Removes each of `names` from the checkpoint, or every name if `names` is None.
+		'''
+		with self.lock:
+			self.completed = set() if names is None else self.completed - set(names)
+			if self.completed:
+				with open(self.filename+'.tmp', 'w') as file:
+					file.writelines(name+'\n' for name in sorted(self.completed))
+				os.replace(self.filename+'.tmp', self.filename)
+			elif os.path.exists(self.filename):
+				os.remove(self.filename)
+
+def select(jobs, languages, parts):
+	'''
+	Returns the `jobs` whose directories contain any of `languages` and whose files are named for any of `parts`,
+	where an empty list selects every job.
+	'''
+	return [job for job in jobs
+		if (not languages or any(language in os.path.dirname(job.filename) for language in languages))
+		and (not parts or any(os.path.basename(job.filename) == f'scraped-{part}.tsv' for part in parts))]
+
+def run_all(jobs, checkpoint, scraping, caching, formatting, max_jobs=4, allow_missing=False):
+	'''
+	Runs every job of `jobs` that is not yet in `checkpoint`, up to `max_jobs` at a time,
+	and returns a list of (job, duration, error) tuples in the order that they were completed,
+	where `error` is a formatted traceback if the job failed, or None otherwise.
+	'''
+	def run(job):
+		start_time = time.time()
+		try:
+			job.run(scraping, caching, formatting, allow_missing)
+			checkpoint.complete(job.filename)
+			error = None
+		except Exception:
+			error = traceback.format_exc()
+		return (job, time.time()-start_time, error)
+	remaining = [job for job in jobs if job.filename not in checkpoint.completed]
+	with concurrent.futures.ThreadPoolExecutor(max_jobs) as executor:
+		return [future.result() 
+			for future in concurrent.futures.as_completed([executor.submit(run, job) for job in remaining])]
 
 ops = RowMajorTableOps()
 scraping = TableScraping(ops)
 parsing = TokenParsing()
-caching = Caching(parsing)
 formatting = RowMajorTableText('\t','\n')
 
-print('ENGLISH/MIDDLE')
-write('data/inflection/indo-european/germanic/english/middle/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Middle_English', 'enm'), 
-			caching.crawl('''
+jobs = []
+
+# ENGLISH/MIDDLE
+jobs.append(ScrapeJob('data/inflection/indo-european/germanic/english/middle/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Middle_English', 'enm'), 
+	'''
 				animal    
 				attention 
 				bird      https://en.wiktionary.org/wiki/brid#Middle_English
@@ -216,16 +522,12 @@ write('data/inflection/indo-european/germanic/english/middle/scraped-nouns.tsv',
 				woman     
 				worm      https://en.wiktionary.org/wiki/worm#Middle_English
 				work      
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/indo-european/germanic/english/middle/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Middle_English', 'enm'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/indo-european/germanic/english/middle/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Middle_English', 'enm'), 
+	'''
 				appear    
 				be-inherently  https://en.wiktionary.org/wiki/been#Middle_English
 				be-momentarily 
@@ -279,18 +581,16 @@ write('data/inflection/indo-european/germanic/english/middle/scraped-verbs.tsv',
 				know      https://en.wiktionary.org/wiki/cunnen#Middle_English
 				dare      https://en.wiktionary.org/wiki/durren#Middle_English
 				need      https://en.wiktionary.org/wiki/moten#Middle_English
-			''')
-		)
-	)
-)
-
-raise 'done'
-
-print('SWEDISH')
-write('data/inflection/indo-european/germanic/swedish/modern/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Swedish', 'sv'), 
-			caching.crawl('''
+			'''))
+
+# only the jobs above run by default, as before when the jobs below were stopped early with `raise 'done'`,
+# so that a run without any selection never overwrites the files of the jobs below
+default_job_count = len(jobs)
+
+# SWEDISH
+jobs.append(ScrapeJob('data/inflection/indo-european/germanic/swedish/modern/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Swedish', 'sv'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/framtr%C3%A4da#Swedish
 				be-inherently  https://en.wiktionary.org/wiki/vara#Swedish
 				be-momentarily 
@@ -324,12 +624,9 @@ write('data/inflection/indo-european/germanic/swedish/modern/scraped-verbs.tsv',
                 read      https://en.wiktionary.org/wiki/l%C3%A4sa#Swedish
                 sew       https://en.wiktionary.org/wiki/sy#Swedish
                 strike    https://en.wiktionary.org/wiki/stryka#Swedish
-			''')
-		)
-	)
-)
+			'''))
 
-noun_html = caching.crawl('''
+noun_urls = '''
 	animal    https://en.wiktionary.org/wiki/djur#Swedish
 	attention https://en.wiktionary.org/wiki/uppm%C3%A4rksamhet#Swedish
 	bird      https://en.wiktionary.org/wiki/f%C3%A5gel#Swedish
@@ -370,30 +667,21 @@ noun_html = caching.crawl('''
 	woman     https://en.wiktionary.org/wiki/kvinna#Swedish
 	worm      https://en.wiktionary.org/wiki/mask#Swedish
 	work      https://en.wiktionary.org/wiki/arbete#Swedish
-''')
-
-write('data/inflection/indo-european/germanic/swedish/modern/scraped-genders.tsv',
-	formatting.format(
-		scraping.scrape(GenderWikiHtml(ops, 'Noun', 'Swedish'), noun_html)
-	)
-)
-
-write('data/inflection/indo-european/germanic/swedish/modern/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Swedish', 'sv'), 
-			noun_html
-		)
-	)
-)
-
-raise 'done'
-
-write('data/inflection/indo-european/greek/attic/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(
-			GreekRowMajorWikiTableHtml(ops),
-			# RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Ancient_Greek', 'grc', table_count=9), 
-			caching.crawl('''
+'''
+
+jobs.append(ScrapeJob('data/inflection/indo-european/germanic/swedish/modern/scraped-genders.tsv',
+	GenderWikiHtml(ops, 'Noun', 'Swedish'), 
+	noun_urls))
+
+jobs.append(ScrapeJob('data/inflection/indo-european/germanic/swedish/modern/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Swedish', 'sv'), 
+	noun_urls))
+
+
+jobs.append(ScrapeJob('data/inflection/indo-european/greek/attic/scraped-verbs.tsv',
+	GreekRowMajorWikiTableHtml(ops), 
+	# RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Ancient_Greek', 'grc', table_count=9), 
+	'''
 				appear    https://en.wiktionary.org/wiki/%CE%B5%E1%BC%B4%CE%B4%CE%BF%CE%BC%CE%B1%CE%B9#Ancient_Greek
 				be-inherently  https://en.wiktionary.org/wiki/%CE%B5%E1%BC%B0%CE%BC%CE%AF#Ancient_Greek
 				be-momentarily
@@ -422,12 +710,9 @@ write('data/inflection/indo-european/greek/attic/scraped-verbs.tsv',
 
 				go        https://en.wiktionary.org/wiki/%CE%B5%E1%BC%B6%CE%BC%CE%B9#Ancient_Greek
 				release   https://en.wiktionary.org/wiki/%CE%BB%CF%8D%CF%89#Ancient_Greek
-			''')
-		)
-	)
-)
+			'''))
 
-noun_html = caching.crawl('''
+noun_urls = '''
 	animal    https://en.wiktionary.org/wiki/%CE%B6%E1%BF%B7%CE%BF%CE%BD#Ancient_Greek
 	attention https://en.wiktionary.org/wiki/%CF%86%CF%81%CE%BF%CE%BD%CF%84%CE%AF%CF%82#Ancient_Greek
 	bird      https://en.wiktionary.org/wiki/%E1%BD%84%CF%81%CE%BD%CE%B9%CF%82#Ancient_Greek
@@ -525,24 +810,20 @@ noun_html = caching.crawl('''
     ship      https://en.wiktionary.org/wiki/%E1%BC%A7%CF%80%CE%B1%CF%81
     ear       https://en.wiktionary.org/wiki/%CE%BD%CE%B1%E1%BF%A6%CF%82
     hand      https://en.wiktionary.org/wiki/%CE%BF%E1%BD%96%CF%82
-''')
+'''
 
-print('GREEK/ANCIENT')
-write('data/inflection/indo-european/greek/attic/scraped-genders.tsv',
-	formatting.format(
-		scraping.scrape(GenderWikiHtml(ops, 'Noun', 'Ancient_Greek'), noun_html)
-	)
-)
+# GREEK/ANCIENT
+jobs.append(ScrapeJob('data/inflection/indo-european/greek/attic/scraped-genders.tsv',
+	GenderWikiHtml(ops, 'Noun', 'Ancient_Greek'), 
+	noun_urls))
 
-print('GREEK/ANCIENT')
-write('data/inflection/indo-european/greek/attic/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(GreekRowMajorWikiTableHtml(ops), noun_html)
-	)
-)
+# GREEK/ANCIENT
+jobs.append(ScrapeJob('data/inflection/indo-european/greek/attic/scraped-nouns.tsv',
+	GreekRowMajorWikiTableHtml(ops), 
+	noun_urls))
 
 
-noun_html = caching.crawl('''
+noun_urls = '''
 	animal    https://en.wiktionary.org/wiki/animal#Latin
 	attention https://en.wiktionary.org/wiki/attentio#Latin
 	bird      https://en.wiktionary.org/wiki/avis#Latin
@@ -604,28 +885,21 @@ noun_html = caching.crawl('''
 	atom      https://en.wiktionary.org/wiki/atomus#Latin
 	nymph     https://en.wiktionary.org/wiki/nymphe#Latin
 	comet     https://en.wiktionary.org/wiki/cometes#Latin
-''')
-
-print('LATIN')
-write('data/inflection/indo-european/romance/latin/scraped-genders.tsv',
-	formatting.format(
-		scraping.scrape(GenderWikiHtml(ops, 'Noun', 'Latin'), noun_html)
-	)
-)
-
-print('LATIN')
-write('data/inflection/indo-european/romance/latin/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Latin', 'la'), 
-			noun_html
-		)
-	)
-)
-
-write('data/inflection/indo-european/romance/latin/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Latin', 'la'), 
-			caching.crawl('''
+'''
+
+# LATIN
+jobs.append(ScrapeJob('data/inflection/indo-european/romance/latin/scraped-genders.tsv',
+	GenderWikiHtml(ops, 'Noun', 'Latin'), 
+	noun_urls))
+
+# LATIN
+jobs.append(ScrapeJob('data/inflection/indo-european/romance/latin/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Latin', 'la'), 
+	noun_urls))
+
+jobs.append(ScrapeJob('data/inflection/indo-european/romance/latin/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Latin', 'la'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/appareo#Latin
 				be-inherently  https://en.wiktionary.org/wiki/sum#Latin
 				be-momentarily https://en.wiktionary.org/wiki/sum#Latin
@@ -663,12 +937,9 @@ write('data/inflection/indo-european/romance/latin/scraped-verbs.tsv',
 				advise    https://en.wiktionary.org/wiki/moneo#Latin
 				capture   https://en.wiktionary.org/wiki/capio#Latin
 				figure    https://en.wiktionary.org/wiki/puto#Latin
-			''')
-		)
-	)
-)
+			'''))
 
-noun_html = caching.crawl('''
+noun_urls = '''
 	animal    # oxsus
 	attention # ueliia
 	bird      # etnos
@@ -710,28 +981,21 @@ noun_html = caching.crawl('''
 	worm      
 	work      # uergon
 
-''')
-
-print('GAULISH')
-write('data/inflection/indo-european/celtic/gaulish/scraped-genders.tsv',
-	formatting.format(
-		scraping.scrape(GenderWikiHtml(ops, 'Noun', 'Gaulish'), noun_html)
-	)
-)
-
-print('GAULISH')
-write('data/inflection/indo-european/celtic/gaulish/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Gaulish'), 
-			noun_html
-		)
-	)
-)
-
-# write('data/inflection/indo-european/celtic/gaulish/scraped-verbs.tsv',
-# 	formatting.format(
-# 		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Gaulish'), 
-# 			caching.crawl('''
+'''
+
+# GAULISH
+jobs.append(ScrapeJob('data/inflection/indo-european/celtic/gaulish/scraped-genders.tsv',
+	GenderWikiHtml(ops, 'Noun', 'Gaulish'), 
+	noun_urls))
+
+# GAULISH
+jobs.append(ScrapeJob('data/inflection/indo-european/celtic/gaulish/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Gaulish'), 
+	noun_urls))
+
+# jobs.append(ScrapeJob('data/inflection/indo-european/celtic/gaulish/scraped-verbs.tsv',
+# 	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Gaulish'), 
+# 	'''
 # 				appear    
 # 				be-inherently  # essi
 # 				be-momentarily # essi
@@ -758,12 +1022,9 @@ write('data/inflection/indo-european/celtic/gaulish/scraped-nouns.tsv',
 # 				warm      # taiet
 # 				watch     # uiliet
 # 				work      # ureget
-# 			''')
-# 		)
-# 	)
-# )
+# 			'''))
 
-noun_html = caching.crawl('''
+noun_urls = '''
 	animal    https://en.wiktionary.org/wiki/nieten#Old_English
 	attention https://en.wiktionary.org/wiki/ge%C3%BEoht#Old_English
 	bird      https://en.wiktionary.org/wiki/fugol#Old_English
@@ -827,26 +1088,20 @@ noun_html = caching.crawl('''
 	piglet    https://en.wiktionary.org/wiki/fearh#Old_English
 	shadow    https://en.wiktionary.org/wiki/sceadu#Old_English
 	meadow    https://en.wiktionary.org/wiki/m%C3%A6d#Old_English
-''')
-
-print('ENGLISH/OLD')
-write('data/inflection/indo-european/germanic/english/old/scraped-genders.tsv',
-	formatting.format(
-		scraping.scrape(GenderWikiHtml(ops, 'Noun', 'Old_English'), noun_html)
-	)
-)
-
-write('data/inflection/indo-european/germanic/english/old/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Old_English', 'ang'), 
-			noun_html)
-	)
-)
-
-write('data/inflection/indo-european/germanic/english/old/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Old_English', 'ang'), 
-			caching.crawl('''
+'''
+
+# ENGLISH/OLD
+jobs.append(ScrapeJob('data/inflection/indo-european/germanic/english/old/scraped-genders.tsv',
+	GenderWikiHtml(ops, 'Noun', 'Old_English'), 
+	noun_urls))
+
+jobs.append(ScrapeJob('data/inflection/indo-european/germanic/english/old/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Old_English', 'ang'), 
+	noun_urls))
+
+jobs.append(ScrapeJob('data/inflection/indo-european/germanic/english/old/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Old_English', 'ang'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/%C3%A6tiewan#Old_English
 				be-inherently  https://en.wiktionary.org/wiki/wesan#Old_English
 				be-momentarily https://en.wiktionary.org/wiki/beon#Old_English
@@ -886,16 +1141,12 @@ write('data/inflection/indo-european/germanic/english/old/scraped-verbs.tsv',
             	live      https://en.wiktionary.org/wiki/libban
             	say       https://en.wiktionary.org/wiki/secgan
             	think     https://en.wiktionary.org/wiki/hycgan
-			''')
-		)
-	)
-)
-
-print('PROTO-INDO-EUROPEAN/SIHLER')
-write('data/inflection/indo-european/proto-indo-european/sihler/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Proto-Indo-European', 'ine-pro'), 
-			caching.crawl('''
+			'''))
+
+# PROTO-INDO-EUROPEAN/SIHLER
+jobs.append(ScrapeJob('data/inflection/indo-european/proto-indo-european/sihler/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Proto-Indo-European', 'ine-pro'), 
+	'''
 				animal    https://en.wiktionary.org/wiki/Reconstruction:Proto-Indo-European/t%C3%A1wros
 				attention https://en.wiktionary.org/wiki/Reconstruction:Proto-Indo-European/m%C3%A9nos
 				bird      https://en.wiktionary.org/wiki/Reconstruction:Proto-Indo-European/h%E2%82%82%C3%A9wis
@@ -948,15 +1199,11 @@ write('data/inflection/indo-european/proto-indo-european/sihler/scraped-nouns.ts
 				fight     https://en.wiktionary.org/wiki/Reconstruction:Proto-Indo-European/k%C3%A9h%E2%82%83tus
 				cloud     https://en.wiktionary.org/wiki/Reconstruction:Proto-Indo-European/n%C3%A9b%CA%B0os
 				stone     https://en.wiktionary.org/wiki/Reconstruction:Proto-Indo-European/h%E2%82%82%C3%A9%E1%B8%B1m%C5%8D
-			''')
-		)
-	)
-)
-
-write('data/inflection/indo-european/proto-indo-european/sihler/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Proto-Indo-European', 'ine-pro'), 
-			caching.crawl('''
+			'''))
+
+jobs.append(ScrapeJob('data/inflection/indo-european/proto-indo-european/sihler/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Proto-Indo-European', 'ine-pro'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/Reconstruction:Proto-Indo-European/h%E2%82%81lud%CA%B0%C3%A9t # "arrive"
 				be        https://en.wiktionary.org/wiki/Reconstruction:Proto-Indo-European/h%E2%82%81%C3%A9sti
 				change    
@@ -1003,13 +1250,10 @@ write('data/inflection/indo-european/proto-indo-european/sihler/scraped-verbs.ts
 				point-out   https://en.wiktionary.org/wiki/Reconstruction:Proto-Indo-European/d%E1%B8%97y%E1%B8%B1st
 				think       https://en.wiktionary.org/wiki/Reconstruction:Proto-Indo-European/mem%C3%B3ne
 
-			''')
-		)
-	)
-)
+			'''))
 
 
-noun_html = caching.crawl('''
+noun_urls = '''
 	animal    https://en.wiktionary.org/wiki/%D0%B6%D0%B8%D0%B2%D0%BE%D1%82%D0%BD%D0%BE%D0%B5#Russian
 	attention https://en.wiktionary.org/wiki/%D0%B2%D0%BD%D0%B8%D0%BC%D0%B0%D0%BD%D0%B8%D0%B5#Russian
 	bird      https://en.wiktionary.org/wiki/%D0%BF%D1%82%D0%B8%D1%86%D0%B0#Russian
@@ -1063,31 +1307,22 @@ noun_html = caching.crawl('''
 	sea       https://en.wiktionary.org/wiki/%D0%BC%D0%BE%D1%80%D0%B5#Russian
 	bone      https://en.wiktionary.org/wiki/%D0%BA%D0%BE%D1%81%D1%82%D1%8C#Russian
 	mouse     https://en.wiktionary.org/wiki/%D0%BC%D1%8B%D1%88%D1%8C#Russian
-''')
-
-print('RUSSIAN')
-write('data/inflection/indo-european/slavic/russian/scraped-genders.tsv',
-	formatting.format(
-		scraping.scrape(GenderWikiHtml(ops, 'Noun', 'Russian'), 
-			noun_html
-		)
-	)
-)
-
-print('RUSSIAN')
-write('data/inflection/indo-european/slavic/russian/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Russian', 'ru'), 
-			noun_html
-		)
-	)
-)
-
-
-write('data/inflection/indo-european/slavic/russian/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Russian', 'ru'), 
-			caching.crawl('''
+'''
+
+# RUSSIAN
+jobs.append(ScrapeJob('data/inflection/indo-european/slavic/russian/scraped-genders.tsv',
+	GenderWikiHtml(ops, 'Noun', 'Russian'), 
+	noun_urls))
+
+# RUSSIAN
+jobs.append(ScrapeJob('data/inflection/indo-european/slavic/russian/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Russian', 'ru'), 
+	noun_urls))
+
+
+jobs.append(ScrapeJob('data/inflection/indo-european/slavic/russian/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Russian', 'ru'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/%D0%BF%D0%BE%D1%8F%D0%B2%D0%BB%D1%8F%D1%82%D1%8C%D1%81%D1%8F#Russian
 				be        https://en.wiktionary.org/wiki/%D0%B1%D1%8B%D1%82%D1%8C#Russian
 				be-inherently  https://en.wiktionary.org/wiki/%D0%B1%D1%8B%D1%82%D1%8C#Russian
@@ -1152,20 +1387,14 @@ write('data/inflection/indo-european/slavic/russian/scraped-verbs.tsv',
 				ask       https://en.wiktionary.org/wiki/%D0%BF%D1%80%D0%BE%D1%81%D0%B8%D1%82%D1%8C#Russian
 				pay       https://en.wiktionary.org/wiki/%D0%BF%D0%BB%D0%B0%D0%BA%D0%B0%D1%82%D1%8C#Russian
 				forgive   https://en.wiktionary.org/wiki/%D1%85%D0%BE%D0%B4%D0%B8%D1%82%D1%8C#Russian
-			''')
-		)
-	)
-)
-
+			'''))
 
-# raise 'done'
 
 
-print('ARABIC')
-write('data/inflection/semitic/arabic/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Arabic', 'ar'), 
-			caching.crawl('''
+# ARABIC
+jobs.append(ScrapeJob('data/inflection/semitic/arabic/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Arabic', 'ar'), 
+	'''
 				animal    https://en.wiktionary.org/wiki/%D8%AD%D9%8A%D9%88%D8%A7%D9%86#Arabic
 				attention https://en.wiktionary.org/wiki/%D8%A7%D9%87%D8%AA%D9%85%D8%A7%D9%85#Arabic
 				bird      https://en.wiktionary.org/wiki/%D8%B7%D8%A7%D8%A6%D8%B1#Arabic
@@ -1206,15 +1435,11 @@ write('data/inflection/semitic/arabic/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/%D8%A7%D9%85%D8%B1%D8%A3%D8%A9#Arabic
 				worm      https://en.wiktionary.org/wiki/%D8%AF%D9%88%D8%AF%D8%A9#Arabic
 				work      https://en.wiktionary.org/wiki/%D8%AE%D8%AF%D9%85%D8%A9#Arabic
-			''')
-		)
-	)
-)
-
-write('data/inflection/semitic/arabic/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Arabic', 'ar'), 
-			caching.crawl('''
+			'''))
+
+jobs.append(ScrapeJob('data/inflection/semitic/arabic/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Arabic', 'ar'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/%D8%B9%D8%B1%D8%B6#Arabic
 				be-inherently  https://en.wiktionary.org/wiki/%D9%83%D8%A7%D9%86#Arabic # indicates that subject is a predicate, not that it is self-same to
 				be-momentarily https://en.wiktionary.org/wiki/%D9%83%D8%A7%D9%86#Arabic # indicates that subject is a predicate, not that it is self-same to
@@ -1241,16 +1466,12 @@ write('data/inflection/semitic/arabic/scraped-verbs.tsv',
 				warm      https://en.wiktionary.org/wiki/%D8%B3%D8%AE%D9%86#Arabic
 				watch     https://en.wiktionary.org/wiki/%D8%B4%D8%A7%D9%87%D8%AF#Arabic
 				work      https://en.wiktionary.org/wiki/%D8%B9%D9%85%D9%84#Arabic
-			''')
-		)
-	)
-)
-
-print('BASQUE')
-write('data/inflection/isolates/basque/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Basque', 'eu'), 
-			caching.crawl('''
+			'''))
+
+# BASQUE
+jobs.append(ScrapeJob('data/inflection/isolates/basque/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Basque', 'eu'), 
+	'''
 				animal    https://en.wiktionary.org/wiki/animalia#Basque
 				attention https://en.wiktionary.org/wiki/gogo#Basque
 				bird      https://en.wiktionary.org/wiki/txori#Basque
@@ -1291,16 +1512,12 @@ write('data/inflection/isolates/basque/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/andre#Basque
 				worm      https://en.wiktionary.org/wiki/beldar#Basque
 				work      https://en.wiktionary.org/wiki/lan#Basque
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/isolates/basque/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Basque', 'eu'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/isolates/basque/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Basque', 'eu'), 
+	'''
 				appear    
 				be-inherently  https://en.wiktionary.org/wiki/izan#Basque
 				be-momentarily https://en.wiktionary.org/wiki/egon#Basque
@@ -1327,17 +1544,13 @@ write('data/inflection/isolates/basque/scraped-verbs.tsv',
 				warm      
 				watch     
 				work      
-			''')
-		)
-	)
-)
+			'''))
 
 
 
-write('data/inflection/indo-european/celtic/cornish/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Cornish'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/indo-european/celtic/cornish/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Cornish'), 
+	'''
 				appear    
 				be-inherently  https://en.wiktionary.org/wiki/bones#Cornish
 				be-momentarily https://en.wiktionary.org/wiki/bones#Cornish
@@ -1370,16 +1583,12 @@ write('data/inflection/indo-european/celtic/cornish/scraped-verbs.tsv',
 				do        https://en.wiktionary.org/wiki/gul#Cornish
 				know      https://en.wiktionary.org/wiki/godhvos#Cornish
 				wish      https://en.wiktionary.org/wiki/mynnes#Cornish
-			''')
-		)
-	)
-)
-
-print('EGYPTIAN')
-write('data/inflection/egyptian/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Egyptian', 'egy'), 
-			caching.crawl('''
+			'''))
+
+# EGYPTIAN
+jobs.append(ScrapeJob('data/inflection/egyptian/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Egyptian', 'egy'), 
+	'''
 				animal    
 				attention 
 				bird      https://en.wiktionary.org/wiki/%EA%9C%A3pd#Egyptian
@@ -1420,16 +1629,12 @@ write('data/inflection/egyptian/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/zt#Egyptian
 				worm      https://en.wiktionary.org/wiki/fn%E1%B9%AF#Egyptian
 				work      
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/egyptian/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Egyptian', 'egy'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/egyptian/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Egyptian', 'egy'), 
+	'''
 				appear    
 				be-inherently 
 				be-momentarily
@@ -1456,16 +1661,12 @@ write('data/inflection/egyptian/scraped-verbs.tsv',
 				warm      
 				watch     
 				work      
-			''')
-		)
-	)
-)
-
-print('FINNISH')
-write('data/inflection/uralic/finnish/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Finnish', 'fi',2), 
-			caching.crawl('''
+			'''))
+
+# FINNISH
+jobs.append(ScrapeJob('data/inflection/uralic/finnish/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Finnish', 'fi',2), 
+	'''
 				animal    https://en.wiktionary.org/wiki/el%C3%A4in#Finnish
 				attention https://en.wiktionary.org/wiki/huomio#Finnish
 				bird      https://en.wiktionary.org/wiki/lintu#Finnish
@@ -1506,16 +1707,12 @@ write('data/inflection/uralic/finnish/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/nainen#Finnish
 				worm      https://en.wiktionary.org/wiki/mato#Finnish
 				work      https://en.wiktionary.org/wiki/ty%C3%B6#Finnish
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/uralic/finnish/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Finnish', 'fi'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/uralic/finnish/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Finnish', 'fi'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/ilmesty%C3%A4#Finnish
 				be-inherently  https://en.wiktionary.org/wiki/olla#Finnish
 				be-momentarily https://en.wiktionary.org/wiki/olla#Finnish
@@ -1542,16 +1739,12 @@ write('data/inflection/uralic/finnish/scraped-verbs.tsv',
 				warm      https://en.wiktionary.org/wiki/l%C3%A4mmitt%C3%A4%C3%A4#Finnish
 				watch     https://en.wiktionary.org/wiki/katsella#Finnish
 				work      https://en.wiktionary.org/wiki/ty%C3%B6skennell%C3%A4#Finnish
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/indo-european/romance/french/modern/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'French', 'fr'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/indo-european/romance/french/modern/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'French', 'fr'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/appara%C3%AEtre#French
 				be-inherently  https://en.wiktionary.org/wiki/%C3%AAtre#French
 				be-momentarily 
@@ -1586,19 +1779,15 @@ write('data/inflection/indo-european/romance/french/modern/scraped-verbs.tsv',
 				choose    https://en.wiktionary.org/wiki/choisir#French
 				loose     https://en.wiktionary.org/wiki/perdre#French
 				receive   https://en.wiktionary.org/wiki/recevoir#French
-			''')
-		)
-	)
-)
+			'''))
 
 
 
 
-print('GEORGIAN')
-write('data/inflection/kartvelian/georgian/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Georgian', 'ka',2), 
-			caching.crawl('''
+# GEORGIAN
+jobs.append(ScrapeJob('data/inflection/kartvelian/georgian/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Georgian', 'ka',2), 
+	'''
 				animal    https://en.wiktionary.org/wiki/%E1%83%AA%E1%83%AE%E1%83%9D%E1%83%95%E1%83%94%E1%83%9A%E1%83%98#Georgian
 				attention https://en.wiktionary.org/wiki/%E1%83%A7%E1%83%A3%E1%83%A0%E1%83%90%E1%83%93%E1%83%A6%E1%83%94%E1%83%91%E1%83%90#Georgian
 				bird      https://en.wiktionary.org/wiki/%E1%83%A9%E1%83%98%E1%83%A2%E1%83%98#Georgian
@@ -1639,16 +1828,12 @@ write('data/inflection/kartvelian/georgian/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/%E1%83%A5%E1%83%90%E1%83%9A%E1%83%98#Georgian
 				worm      https://en.wiktionary.org/wiki/%E1%83%AD%E1%83%98%E1%83%90#Georgian
 				work      
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/kartvelian/georgian/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Georgian', 'ka'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/kartvelian/georgian/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Georgian', 'ka'), 
+	'''
 				appear    
 				be-inherently 
 				be-momentarily
@@ -1675,17 +1860,13 @@ write('data/inflection/kartvelian/georgian/scraped-verbs.tsv',
 				warm      https://en.wiktionary.org/wiki/%E1%83%90%E1%83%97%E1%83%91%E1%83%9D%E1%83%91%E1%83%A1#Georgian
 				watch     
 				work      https://en.wiktionary.org/wiki/%E1%83%9B%E1%83%A3%E1%83%A8%E1%83%90%E1%83%9D%E1%83%91%E1%83%90#Georgian
-			''')
-		)
-	)
-)
+			'''))
 
 
-print('GERMAN')
-write('data/inflection/indo-european/germanic/german/modern/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'German', 'de'), 
-			caching.crawl('''
+# GERMAN
+jobs.append(ScrapeJob('data/inflection/indo-european/germanic/german/modern/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'German', 'de'), 
+	'''
 				animal    https://en.wiktionary.org/wiki/Tier#German
 				attention https://en.wiktionary.org/wiki/Beachtung#German
 				bird      https://en.wiktionary.org/wiki/Vogel#German
@@ -1726,15 +1907,11 @@ write('data/inflection/indo-european/germanic/german/modern/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/Frau#German
 				worm      https://en.wiktionary.org/wiki/Wurm#German
 				work      https://en.wiktionary.org/wiki/Arbeit#German
-			''')
-		)
-	)
-)
-
-write('data/inflection/indo-european/germanic/german/modern/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'German', 'de'), 
-			caching.crawl('''
+			'''))
+
+jobs.append(ScrapeJob('data/inflection/indo-european/germanic/german/modern/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'German', 'de'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/erscheinen#German
 				be-inherently  https://en.wiktionary.org/wiki/sein#German
 				be-momentarily 
@@ -1761,16 +1938,12 @@ write('data/inflection/indo-european/germanic/german/modern/scraped-verbs.tsv',
 				warm      https://en.wiktionary.org/wiki/w%C3%A4rmen#German
 				watch     https://en.wiktionary.org/wiki/zusehen#German
 				work      https://en.wiktionary.org/wiki/arbeiten#German
-			''')
-		)
-	)
-)
-
-print('GOTHIC')
-write('data/inflection/indo-european/germanic/gothic/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Gothic', 'got'), 
-			caching.crawl('''
+			'''))
+
+# GOTHIC
+jobs.append(ScrapeJob('data/inflection/indo-european/germanic/gothic/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Gothic', 'got'), 
+	'''
 				animal    https://en.wiktionary.org/wiki/%F0%90%8C%B3%F0%90%8C%B9%F0%90%8C%BF%F0%90%8D%83#Gothic
 				attention https://en.wiktionary.org/wiki/%F0%90%8C%BC%F0%90%8C%B9%F0%90%8D%84%F0%90%8D%89%F0%90%8C%BD%F0%90%8D%83#Gothic
 				bird      https://en.wiktionary.org/wiki/%F0%90%8D%86%F0%90%8C%BF%F0%90%8C%B2%F0%90%8C%BB%F0%90%8D%83#Gothic
@@ -1811,16 +1984,12 @@ write('data/inflection/indo-european/germanic/gothic/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/%F0%90%8C%B5%F0%90%8C%B9%F0%90%8C%BD%F0%90%8D%89#Gothic
 				worm      https://en.wiktionary.org/wiki/%F0%90%8D%85%F0%90%8C%B0%F0%90%8C%BF%F0%90%8D%82%F0%90%8C%BC%F0%90%8D%83#Gothic
 				work      https://en.wiktionary.org/wiki/%F0%90%8C%B0%F0%90%8D%82%F0%90%8C%B1%F0%90%8C%B0%F0%90%8C%B9%F0%90%8C%B8%F0%90%8D%83#Gothic
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/indo-european/germanic/gothic/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Gothic', 'got'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/indo-european/germanic/gothic/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Gothic', 'got'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/%F0%90%8C%B0%F0%90%8D%84%F0%90%8D%86%F0%90%8C%B0%F0%90%8D%82%F0%90%8C%BE%F0%90%8C%B0%F0%90%8C%BD#Gothic # "arrive"
 				be-inherently  https://en.wiktionary.org/wiki/%F0%90%8D%85%F0%90%8C%B9%F0%90%8D%83%F0%90%8C%B0%F0%90%8C%BD#Gothic
 				be-momentarily 
@@ -1847,18 +2016,14 @@ write('data/inflection/indo-european/germanic/gothic/scraped-verbs.tsv',
 				warm      
 				watch     
 				work      https://en.wiktionary.org/wiki/%F0%90%8D%85%F0%90%8C%B0%F0%90%8C%BF%F0%90%8D%82%F0%90%8C%BA%F0%90%8C%BE%F0%90%8C%B0%F0%90%8C%BD#Gothic
-			''')
-		)
-	)
-)
+			'''))
 
 
 
-print('GREEK/MODERN')
-write('data/inflection/indo-european/greek/modern/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Greek', 'el'), 
-			caching.crawl('''
+# GREEK/MODERN
+jobs.append(ScrapeJob('data/inflection/indo-european/greek/modern/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Greek', 'el'), 
+	'''
 				animal    https://en.wiktionary.org/wiki/%CE%B6%CF%8E%CE%BF#Greek
 				attention https://en.wiktionary.org/wiki/%CF%80%CF%81%CE%BF%CF%83%CE%BF%CF%87%CE%AE#Greek
 				bird      https://en.wiktionary.org/wiki/%CF%80%CF%84%CE%B7%CE%BD%CF%8C#Greek
@@ -1899,15 +2064,11 @@ write('data/inflection/indo-european/greek/modern/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/%CE%B3%CF%85%CE%BD%CE%B1%CE%AF%CE%BA%CE%B1#Greek
 				worm      https://en.wiktionary.org/wiki/%CF%83%CE%BA%CE%BF%CF%85%CE%BB%CE%AE%CE%BA%CE%B9#Greek
 				work      https://en.wiktionary.org/wiki/%CE%B5%CF%81%CE%B3%CE%B1%CF%83%CE%AF%CE%B1#Greek
-			''')
-		)
-	)
-)
-
-write('data/inflection/indo-european/greek/modern/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Greek', 'el'), 
-			caching.crawl('''
+			'''))
+
+jobs.append(ScrapeJob('data/inflection/indo-european/greek/modern/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Greek', 'el'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/%CE%B5%CE%BC%CF%86%CE%B1%CE%BD%CE%AF%CE%B6%CE%BF%CE%BC%CE%B1%CE%B9#Greek
 				be-inherently  https://en.wiktionary.org/wiki/%CE%B5%CE%AF%CE%BC%CE%B1%CE%B9#Greek
 				be-momentarily 
@@ -1934,16 +2095,12 @@ write('data/inflection/indo-european/greek/modern/scraped-verbs.tsv',
 				warm      
 				watch     https://en.wiktionary.org/wiki/%CF%80%CE%B1%CF%81%CE%B1%CE%BA%CE%BF%CE%BB%CE%BF%CF%85%CE%B8%CF%8E#Greek
 				work      https://en.wiktionary.org/wiki/%CE%B4%CE%BF%CF%85%CE%BB%CE%B5%CF%8D%CF%89#Greek
-			''')
-		)
-	)
-)
-
-print('HEBREW')
-write('data/inflection/semitic/hebrew/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Hebrew', 'he'), 
-			caching.crawl('''
+			'''))
+
+# HEBREW
+jobs.append(ScrapeJob('data/inflection/semitic/hebrew/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Hebrew', 'he'), 
+	'''
 				animal    
 				attention https://en.wiktionary.org/wiki/%D7%9E%D7%97%D7%A9%D7%91%D7%94#Hebrew
 				bird      
@@ -1984,16 +2141,12 @@ write('data/inflection/semitic/hebrew/scraped-nouns.tsv',
 				woman     
 				worm      https://en.wiktionary.org/wiki/%D7%AA%D7%95%D7%9C%D7%A2%D7%AA#Hebrew
 				work      https://en.wiktionary.org/wiki/%D7%9E%D7%9C%D7%90%D7%9B%D7%94#Hebrew
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/semitic/hebrew/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Hebrew', 'he'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/semitic/hebrew/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Hebrew', 'he'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/%D7%94%D7%95%D7%A4%D7%99%D7%A2#Hebrew
 				be-inherently  https://en.wiktionary.org/wiki/%D7%94%D7%99%D7%94#Hebrew
 				be-momentarily 
@@ -2020,16 +2173,12 @@ write('data/inflection/semitic/hebrew/scraped-verbs.tsv',
 				warm      https://en.wiktionary.org/wiki/%D7%97%D7%99%D7%9E%D7%9D#Hebrew
 				watch     https://en.wiktionary.org/wiki/%D7%A6%D7%A4%D7%94#Hebrew
 				work      https://en.wiktionary.org/wiki/%D7%A2%D7%91%D7%93#Hebrew
-			''')
-		)
-	)
-)
-
-print('HINDI')
-write('data/inflection/indo-european/indo-iranian/hindi/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Hindi', 'hi'), 
-			caching.crawl('''
+			'''))
+
+# HINDI
+jobs.append(ScrapeJob('data/inflection/indo-european/indo-iranian/hindi/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Hindi', 'hi'), 
+	'''
 				animal    https://en.wiktionary.org/wiki/%E0%A4%9C%E0%A4%BE%E0%A4%A8%E0%A4%B5%E0%A4%B0#Hindi
 				attention https://en.wiktionary.org/wiki/%E0%A4%A7%E0%A5%8D%E0%A4%AF%E0%A4%BE%E0%A4%A8#Hindi
 				bird      https://en.wiktionary.org/wiki/%E0%A4%AA%E0%A4%82%E0%A4%9B%E0%A5%80#Hindi
@@ -2070,15 +2219,11 @@ write('data/inflection/indo-european/indo-iranian/hindi/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/%E0%A4%A8%E0%A4%BE%E0%A4%B0%E0%A5%80#Hindi
 				worm      https://en.wiktionary.org/wiki/%E0%A4%95%E0%A5%80%E0%A4%A1%E0%A4%BC%E0%A4%BE#Hindi
 				work      https://en.wiktionary.org/wiki/%E0%A4%95%E0%A4%BE%E0%A4%B0%E0%A5%8D%E0%A4%AF#Hindi
-			''')
-		)
-	)
-)
-
-write('data/inflection/indo-european/indo-iranian/hindi/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Hindi', 'hi'), 
-			caching.crawl('''
+			'''))
+
+jobs.append(ScrapeJob('data/inflection/indo-european/indo-iranian/hindi/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Hindi', 'hi'), 
+	'''
 				appear    
 				be-inherently  https://en.wiktionary.org/wiki/%E0%A4%B9%E0%A5%8B%E0%A4%A8%E0%A4%BE#Hindi
 				be-momentarily 
@@ -2105,17 +2250,13 @@ write('data/inflection/indo-european/indo-iranian/hindi/scraped-verbs.tsv',
 				warm      
 				watch     https://en.wiktionary.org/wiki/%E0%A4%A6%E0%A5%87%E0%A4%96%E0%A4%A8%E0%A4%BE#Hindi
 				work      https://en.wiktionary.org/wiki/%E0%A4%95%E0%A4%BE%E0%A4%AE_%E0%A4%95%E0%A4%B0%E0%A4%A8%E0%A4%BE#Hindi
-			''')
-		)
-	)
-)
+			'''))
 
 #TODO: Hittite needs its own custom format that does not rely on language code
-print('HITTITE')
-write('data/inflection/indo-european/hittite/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Hittite', table_count=2), 
-			caching.crawl('''
+# HITTITE
+jobs.append(ScrapeJob('data/inflection/indo-european/hittite/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Hittite', table_count=2), 
+	'''
 				animal    
 				attention 
 				bird      https://en.wiktionary.org/wiki/%F0%92%84%A9%F0%92%80%80%F0%92%8A%8F%F0%92%80%B8#Hittite # eagle
@@ -2166,16 +2307,12 @@ write('data/inflection/indo-european/hittite/scraped-nouns.tsv',
 				star      https://en.wiktionary.org/wiki/%F0%92%84%A9%F0%92%80%B8%F0%92%8B%BC%F0%92%85%95%F0%92%8D%9D#Hittite
 				father    https://en.wiktionary.org/wiki/%F0%92%80%9C%F0%92%8B%AB%F0%92%80%B8#Hittite
 				mother    https://en.wiktionary.org/wiki/%F0%92%80%AD%F0%92%88%BE%F0%92%80%B8#Hittite
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/indo-european/hittite/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Hittite', table_count=2), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/indo-european/hittite/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Hittite', table_count=2), 
+	'''
 				appear    
 				be-inherently  https://en.wiktionary.org/wiki/%F0%92%82%8A%F0%92%8C%8D%F0%92%8D%A3#Hittite
 				be-momentarily https://en.wiktionary.org/wiki/%F0%92%82%8A%F0%92%8C%8D%F0%92%8D%A3#Hittite
@@ -2202,16 +2339,12 @@ write('data/inflection/indo-european/hittite/scraped-verbs.tsv',
 				warm      
 				watch     
 				work      https://en.wiktionary.org/wiki/%F0%92%80%AD%F0%92%89%8C%F0%92%84%BF%F0%92%84%91%F0%92%8D%A3#Hittite
-			''')
-		)
-	)
-)
-
-print('HUNGARIAN')
-write('data/inflection/uralic/hungarian/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Hungarian', 'hu', 2), 
-			caching.crawl('''
+			'''))
+
+# HUNGARIAN
+jobs.append(ScrapeJob('data/inflection/uralic/hungarian/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Hungarian', 'hu', 2), 
+	'''
 				animal    https://en.wiktionary.org/wiki/%C3%A1llat#Hungarian
 				attention https://en.wiktionary.org/wiki/figyelem#Hungarian
 				bird      https://en.wiktionary.org/wiki/mad%C3%A1r#Hungarian
@@ -2252,17 +2385,13 @@ write('data/inflection/uralic/hungarian/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/n%C5%91#Hungarian
 				worm      https://en.wiktionary.org/wiki/kukac#Hungarian
 				work      https://en.wiktionary.org/wiki/munka#Hungarian
-			''')
-		)
-	)
-)
+			'''))
 
 
 
-write('data/inflection/uralic/hungarian/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Hungarian', 'hu'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/uralic/hungarian/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Hungarian', 'hu'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/megjelenik#Hungarian
 				be-inherently 
 				be-momentarily
@@ -2289,17 +2418,13 @@ write('data/inflection/uralic/hungarian/scraped-verbs.tsv',
 				warm      https://en.wiktionary.org/wiki/meleg%C3%ADt#Hungarian
 				watch     https://en.wiktionary.org/wiki/n%C3%A9z#Hungarian
 				work      https://en.wiktionary.org/wiki/dolgozik#Hungarian
-			''')
-		)
-	)
-)
+			'''))
 
 
-print('IRISH')
-write('data/inflection/indo-european/celtic/irish/modern/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Irish', 'ga'), 
-			caching.crawl('''
+# IRISH
+jobs.append(ScrapeJob('data/inflection/indo-european/celtic/irish/modern/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Irish', 'ga'), 
+	'''
 				animal    https://en.wiktionary.org/wiki/ainmh%C3%AD#Irish
 				attention https://en.wiktionary.org/wiki/aoidh#Irish
 				bird      https://en.wiktionary.org/wiki/%C3%A9an#Irish
@@ -2340,16 +2465,12 @@ write('data/inflection/indo-european/celtic/irish/modern/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/bean#Irish
 				worm      https://en.wiktionary.org/wiki/p%C3%A9ist#Irish
 				work      https://en.wiktionary.org/wiki/obair#Irish
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/indo-european/celtic/irish/modern/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Irish', 'ga'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/indo-european/celtic/irish/modern/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Irish', 'ga'), 
+	'''
 				appear    
 				be-inherently  https://en.wiktionary.org/wiki/is#Irish # for nouns only
 				be-momentarily https://en.wiktionary.org/wiki/b%C3%AD#Irish # for adjectives only
@@ -2376,17 +2497,13 @@ write('data/inflection/indo-european/celtic/irish/modern/scraped-verbs.tsv',
 				warm      
 				watch     https://en.wiktionary.org/wiki/fair#Irish
 				work      https://en.wiktionary.org/wiki/oibrigh#Irish
-			''')
-		)
-	)
-)
+			'''))
 
 
-print('ITALIAN')
-write('data/inflection/indo-european/romance/italian/modern/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Italian', 'it'), 
-			caching.crawl('''
+# ITALIAN
+jobs.append(ScrapeJob('data/inflection/indo-european/romance/italian/modern/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Italian', 'it'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/apparire#Italian
 				be-inherently 
 				be-momentarily
@@ -2413,15 +2530,11 @@ write('data/inflection/indo-european/romance/italian/modern/scraped-verbs.tsv',
 				warm      https://en.wiktionary.org/wiki/riscaldare#Italian
 				watch     https://en.wiktionary.org/wiki/guardare#Italian
 				work      https://en.wiktionary.org/wiki/lavorare#Italian
-			''')
-		)
-	)
-)
-
-write('data/inflection/japanese/modern/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Japanese', 'ja'), 
-			caching.crawl('''
+			'''))
+
+jobs.append(ScrapeJob('data/inflection/japanese/modern/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Japanese', 'ja'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/%E7%8F%BE%E3%82%8C%E3%82%8B#Japanese
 				be-inherently  https://en.wiktionary.org/wiki/%E3%81%A0#Japanese
 				be-momentarily https://en.wiktionary.org/wiki/%E3%81%A0#Japanese
@@ -2448,18 +2561,14 @@ write('data/inflection/japanese/modern/scraped-verbs.tsv',
 				warm      https://en.wiktionary.org/wiki/%E6%B8%A9%E3%82%81%E3%82%8B#Japanese
 				watch     https://en.wiktionary.org/wiki/%E8%A6%8B%E3%82%8B#Japanese
 				work      https://en.wiktionary.org/wiki/%E5%83%8D%E3%81%8F#Japanese
-			''')
-		)
-	)
-)
+			'''))
 
 
 
-print('OLD-CHURCH-SLAVONIC')
-write('data/inflection/indo-european/slavic/old-church-slavonic/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Old_Church_Slavonic', 'cu'), 
-			caching.crawl('''
+# OLD-CHURCH-SLAVONIC
+jobs.append(ScrapeJob('data/inflection/indo-european/slavic/old-church-slavonic/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Old_Church_Slavonic', 'cu'), 
+	'''
 				animal    https://en.wiktionary.org/wiki/%D0%B6%D0%B8%D0%B2%D0%BE%D1%82%D1%8A#Old_Church_Slavonic
 				attention https://en.wiktionary.org/wiki/%D0%BC%EA%99%91%D1%81%D0%BB%D1%8C#Old_Church_Slavonic
 				bird      https://en.wiktionary.org/wiki/%D0%BF%D1%8A%D1%82%D0%B8%D1%86%D0%B0#Old_Church_Slavonic
@@ -2500,16 +2609,12 @@ write('data/inflection/indo-european/slavic/old-church-slavonic/scraped-nouns.ts
 				woman     https://en.wiktionary.org/wiki/%D0%B6%D0%B5%D0%BD%D0%B0#Old_Church_Slavonic
 				worm      https://en.wiktionary.org/wiki/%D1%87%D1%80%D1%8C%D0%B2%D1%8C#Old_Church_Slavonic
 				work      https://en.wiktionary.org/wiki/%D1%80%D0%B0%D0%B1%D0%BE%D1%82%D0%B0#Old_Church_Slavonic
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/indo-european/slavic/old-church-slavonic/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Old_Church_Slavonic', 'cu'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/indo-european/slavic/old-church-slavonic/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Old_Church_Slavonic', 'cu'), 
+	'''
 				appear    
 				be-inherently  https://en.wiktionary.org/wiki/%D0%B1%EA%99%91%D1%82%D0%B8#Old_Church_Slavonic
 				be-momentarily 
@@ -2536,17 +2641,13 @@ write('data/inflection/indo-european/slavic/old-church-slavonic/scraped-verbs.ts
 				warm      
 				watch     
 				work      https://en.wiktionary.org/wiki/%D0%B4%D1%A3%D0%BB%D0%B0%D1%82%D0%B8#Old_Church_Slavonic
-			''')
-		)
-	)
-)
+			'''))
 
 
 
-write('data/inflection/indo-european/romance/portugese/modern/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Portuguese', 'pt'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/indo-european/romance/portugese/modern/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Portuguese', 'pt'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/aparecer#Portuguese
 				be-inherently  https://en.wiktionary.org/wiki/ser#Portuguese
 				be-momentarily https://en.wiktionary.org/wiki/estar#Portuguese
@@ -2579,17 +2680,13 @@ write('data/inflection/indo-european/romance/portugese/modern/scraped-verbs.tsv'
 				go        https://en.wiktionary.org/wiki/ir#Portuguese
 				put       https://en.wiktionary.org/wiki/p%C3%B4r#Portuguese
 
-			''')
-		)
-	)
-)
+			'''))
 
 
-print('QUECHUAN')
-write('data/inflection/quechuan/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Quechua', 'qu', 2), 
-			caching.crawl('''
+# QUECHUAN
+jobs.append(ScrapeJob('data/inflection/quechuan/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Quechua', 'qu', 2), 
+	'''
 				animal    https://en.wiktionary.org/wiki/uywa#Quechua
 				attention 
 				bird      https://en.wiktionary.org/wiki/pisqu#Quechua
@@ -2630,16 +2727,12 @@ write('data/inflection/quechuan/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/warmi#Quechua
 				worm      https://en.wiktionary.org/wiki/kuru#Quechua
 				work      
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/quechuan/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Quechua', 'qu'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/quechuan/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Quechua', 'qu'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/qispiy#Quechua
 				be-inherently 
 				be-momentarily
@@ -2666,19 +2759,15 @@ write('data/inflection/quechuan/scraped-verbs.tsv',
 				warm      
 				watch     https://en.wiktionary.org/wiki/qhaway#Quechua
 				work      https://en.wiktionary.org/wiki/llamk%27ay#Quechua
-			''')
-		)
-	)
-)
+			'''))
 
 
 
-print('ROMANIAN')
+# ROMANIAN
 
-write('data/inflection/indo-european/romance/romanian/modern/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Romanian', 'ro'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/indo-european/romance/romanian/modern/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Romanian', 'ro'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/p%C4%83rea#Romanian
 				be        https://en.wiktionary.org/wiki/fi#Romanian
 				be-inherently  https://en.wiktionary.org/wiki/fi#Romanian
@@ -2727,12 +2816,9 @@ write('data/inflection/indo-european/romance/romanian/modern/scraped-verbs.tsv',
 				offer     https://en.wiktionary.org/wiki/oferi#Romanian
 				choose    https://en.wiktionary.org/wiki/alege#Romanian
 				know      https://en.wiktionary.org/wiki/%C8%99ti#Romanian
-			''')
-		)
-	)
-)
+			'''))
 
-noun_html = caching.crawl('''
+noun_urls = '''
 	animal     https://en.wiktionary.org/wiki/animal#Romanian
 	attention  https://en.wiktionary.org/wiki/aten%C8%9Bie#Romanian
 	bird       https://en.wiktionary.org/wiki/pas%C4%83re#Romanian
@@ -2774,27 +2860,20 @@ noun_html = caching.crawl('''
 	woman      https://en.wiktionary.org/wiki/femeie#Romanian
 	worm       https://en.wiktionary.org/wiki/vierme#Romanian
 	work       https://en.wiktionary.org/wiki/munc%C4%83#Romanian
-''')
-
-write('data/inflection/indo-european/romance/romanian/modern/scraped-genders.tsv',
-	formatting.format(
-		scraping.scrape(GenderWikiHtml(ops, 'Noun', 'Romanian'), noun_html)
-	)
-)
-
-write('data/inflection/indo-european/romance/romanian/modern/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Romanian', 'ro'), 
-			noun_html
-		)
-	)
-)
-
-print('SANSKRIT')
-write('data/inflection/indo-european/indo-iranian/sanskrit/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Sanskrit', 'sa'), 
-			caching.crawl('''
+'''
+
+jobs.append(ScrapeJob('data/inflection/indo-european/romance/romanian/modern/scraped-genders.tsv',
+	GenderWikiHtml(ops, 'Noun', 'Romanian'), 
+	noun_urls))
+
+jobs.append(ScrapeJob('data/inflection/indo-european/romance/romanian/modern/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Romanian', 'ro'), 
+	noun_urls))
+
+# SANSKRIT
+jobs.append(ScrapeJob('data/inflection/indo-european/indo-iranian/sanskrit/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Sanskrit', 'sa'), 
+	'''
 				animal    https://en.wiktionary.org/wiki/%E0%A4%AE%E0%A5%83%E0%A4%97#Sanskrit
 				attention https://en.wiktionary.org/wiki/%E0%A4%A7%E0%A5%8D%E0%A4%AF%E0%A4%BE%E0%A4%A8#Sanskrit
 				bird      https://en.wiktionary.org/wiki/%E0%A4%B5%E0%A4%BF#Sanskrit
@@ -2855,16 +2934,12 @@ write('data/inflection/indo-european/indo-iranian/sanskrit/scraped-nouns.tsv',
 				king      https://en.wiktionary.org/wiki/%E0%A4%B0%E0%A4%BE%E0%A4%9C%E0%A4%BE#Sanskrit
 				yogi      https://en.wiktionary.org/wiki/%E0%A4%AF%E0%A5%8B%E0%A4%97%E0%A4%BF%E0%A4%A8%E0%A5%8D#Sanskrit
 				world     
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/indo-european/indo-iranian/sanskrit/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Sanskrit', 'sa'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/indo-european/indo-iranian/sanskrit/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Sanskrit', 'sa'), 
+	'''
 				appear    
 				be-inherently 
 				be-momentarily
@@ -2891,16 +2966,12 @@ write('data/inflection/indo-european/indo-iranian/sanskrit/scraped-verbs.tsv',
 				warm      https://en.wiktionary.org/wiki/%E0%A4%A4%E0%A4%AA%E0%A4%A4%E0%A4%BF#Sanskrit
 				watch     
 				work      
-			''')
-		)
-	)
-)
-
-print('SPANISH')
-write('data/inflection/indo-european/romance/spanish/modern/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Spanish', 'es'), 
-			caching.crawl('''
+			'''))
+
+# SPANISH
+jobs.append(ScrapeJob('data/inflection/indo-european/romance/spanish/modern/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Spanish', 'es'), 
+	'''
 				appear    https://en.wiktionary.org/wiki/aparecer#Spanish
 				be-inherently  https://en.wiktionary.org/wiki/ser#Spanish
 				be-momentarily https://en.wiktionary.org/wiki/estar#Spanish
@@ -2936,17 +3007,13 @@ write('data/inflection/indo-european/romance/spanish/modern/scraped-verbs.tsv',
 				part      https://en.wiktionary.org/wiki/partir#Spanish
 				know      https://en.wiktionary.org/wiki/conocer#Spanish
 				drive     https://en.wiktionary.org/wiki/conducir#Spanish
-			''')
-		)
-	)
-)
+			'''))
 
 
-print('TAMIL')
-write('data/inflection/dravidian/tamil/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Tamil'), 
-			caching.crawl('''
+# TAMIL
+jobs.append(ScrapeJob('data/inflection/dravidian/tamil/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Tamil'), 
+	'''
 				animal    https://en.wiktionary.org/wiki/%E0%AE%B5%E0%AE%BF%E0%AE%B2%E0%AE%99%E0%AF%8D%E0%AE%95%E0%AF%81#Tamil
 				attention 
 				bird      https://en.wiktionary.org/wiki/%E0%AE%AA%E0%AE%B1%E0%AE%B5%E0%AF%88#Tamil
@@ -2987,16 +3054,12 @@ write('data/inflection/dravidian/tamil/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/%E0%AE%AA%E0%AF%86%E0%AE%A3%E0%AF%8D#Tamil
 				worm      https://en.wiktionary.org/wiki/%E0%AE%AA%E0%AF%81%E0%AE%B4%E0%AF%81#Tamil
 				work      https://en.wiktionary.org/wiki/%E0%AE%B5%E0%AF%87%E0%AE%B2%E0%AF%88#Tamil
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/dravidian/tamil/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Tamil'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/dravidian/tamil/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Tamil'), 
+	'''
 				appear    
 				be-inherently 
 				be-momentarily
@@ -3023,16 +3086,12 @@ write('data/inflection/dravidian/tamil/scraped-verbs.tsv',
 				warm      
 				watch     
 				work      
-			''')
-		)
-	)
-)
-
-print('TURKISH')
-write('data/inflection/turkic/turkish/scraped-nouns.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Turkish', 'tr'), 
-			caching.crawl('''
+			'''))
+
+# TURKISH
+jobs.append(ScrapeJob('data/inflection/turkic/turkish/scraped-nouns.tsv',
+	RowMajorWikiTableHtml(ops, 'Noun', ['Declension','Inflection'], 'Turkish', 'tr'), 
+	'''
 				animal    https://en.wiktionary.org/wiki/hayvan#Turkish
 				attention 
 				bird      https://en.wiktionary.org/wiki/ku%C5%9F#Turkish
@@ -3073,16 +3132,12 @@ write('data/inflection/turkic/turkish/scraped-nouns.tsv',
 				woman     https://en.wiktionary.org/wiki/kad%C4%B1n#Turkish
 				worm      https://en.wiktionary.org/wiki/kurt#Turkish
 				work      https://en.wiktionary.org/wiki/i%C5%9F#Turkish
-			''')
-		)
-	)
-)
+			'''))
 
 
-write('data/inflection/turkic/turkish/scraped-verbs.tsv',
-	formatting.format(
-		scraping.scrape(RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Turkish', 'tr'), 
-			caching.crawl('''
+jobs.append(ScrapeJob('data/inflection/turkic/turkish/scraped-verbs.tsv',
+	RowMajorWikiTableHtml(ops, 'Verb', ['Conjugation','Inflection'], 'Turkish', 'tr'), 
+	'''
 				appear    
 				be-inherently 
 				be-momentarily
@@ -3109,7 +3164,53 @@ write('data/inflection/turkic/turkish/scraped-verbs.tsv',
 				warm      
 				watch     https://en.wiktionary.org/wiki/seyretmek#Turkish
 				work      https://en.wiktionary.org/wiki/%C3%A7al%C4%B1%C5%9Fmak#Turkish
-			''')
-		)
-	)
-)
+			'''))
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Writes the scraped inflection tables of every language.')
+	parser.add_argument('languages', nargs='*',
+		help='scrape only files whose paths contain the given text')
+	parser.add_argument('--parts', nargs='*', default=[],
+		help='scrape only files for the given parts of speech, such as "nouns", "verbs", or "genders"')
+	parser.add_argument('--all', action='store_true',
+		help='select from every job, rather than only those that run by default, when no languages are given')
+	parser.add_argument('--jobs', type=int, default=4,
+		help='number of jobs to run at once')
+	parser.add_argument('--processes', type=int, default=None,
+		help='number of worker processes that parse pages, which are shared by all jobs (default: number of cores)')
+	parser.add_argument('--rate', type=float, default=1,
+		help='number of requests per second to each host, shared by all jobs')
+	parser.add_argument('--offline', action='store_true',
+		help='use only pages that were already fetched')
+	parser.add_argument('--allow-missing', action='store_true',
+		help='write files even if the pages of some of their lemmas are missing, leaving out the rows of those lemmas')
+	parser.add_argument('--checkpoint', default=os.path.join('.cache', 'scrape', 'checkpoint.txt'),
+		help='file that records the jobs that have completed')
+	parser.add_argument('--restart', action='store_true',
+		help='run every selected job, even those that completed during an earlier run')
+	args = parser.parse_args()
+
+	os.chdir(os.path.dirname(os.path.abspath(__file__)))
+	caching = Caching(parsing, limiting=RateLimiting(args.rate), offline=args.offline)
+	checkpoint = Checkpoint(args.checkpoint)
+	selected = select(jobs if args.all or args.languages else jobs[:default_job_count], args.languages, args.parts)
+	if args.restart:
+		checkpoint.clear([job.filename for job in selected])
+	processes = args.processes or os.cpu_count() or 1
+	# the pool is forked before any job starts, since forking a process while other threads run is unsafe
+	pool = multiprocessing.get_context('fork').Pool(processes) if processes > 1 else None
+	try:
+		results = run_all(selected, checkpoint, TableScraping(ops, pool), caching, formatting, args.jobs, args.allow_missing)
+	finally:
+		if pool:
+			pool.terminate()
+
+	for (job, _, error) in results:
+		if error:
+			print(f'{job.filename} failed:')
+			print(error)
+	failures = [job for (job, _, error) in results if error]
+	print(f'{len(results)-len(failures)} jobs completed, {len(failures)} failed, {len(selected)-len(results)} skipped by checkpoint')
+	if failures:
+		raise SystemExit(1)
+	checkpoint.clear([job.filename for job in selected])
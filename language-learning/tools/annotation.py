@@ -1,7 +1,7 @@
 '''
 "*Annotation" classes contain a single pure method, "annotate()", 
-that maps the contents of a table (represented as a list of lists of strings)
-to lists of annotation tuples where 'cell' is the contents of a cell within the table,
+that maps the contents of a table (represented as an iterable of lists of strings)
+to a generator of annotation tuples where 'cell' is the contents of a cell within the table,
  and 'annotations' is a dict of attribute:keyword associated with a cell.
 
 The concept of an "*Annotation" class is useful since we see 
@@ -18,13 +18,10 @@ class RowAnnotation:
     def __init__(self, header_column_names):
         self.header_column_names = header_column_names
     def annotate(self, rows):
-        annotations = []
         for row in rows:
-            dict_row = {key:value 
+            yield {key:value 
                 for (key,value) in zip(self.header_column_names, row)
                 if value}
-            annotations.append(dict_row)
-        return annotations
 
 class CellAnnotation:
     '''
@@ -51,8 +48,8 @@ class CellAnnotation:
 
     `CellAnnotation` converts tables that are written in this manner between 
     two reprepresentations: 
-    The first representation is a list of rows, where rows are lists of cell contents.
-    The second representation is a list where each element is annotation,
+    The first representation is an iterable of rows, where rows are lists of cell contents.
+    The second representation is a generator where each element is an annotation,
      i.e., a dict of attribute:keyword where cell contents are associated with a given attribute, `cell_termaxis`.
     '''
     def __init__(self, cell_termaxis, term_to_termaxis, 
@@ -68,10 +65,11 @@ class CellAnnotation:
     def annotate(self, rows):
         header_row_count = float('inf')
         header_column_count = 0
-        column_count = max([len(row) for row in rows])
-        column_based_attributes = [{} for i in range(column_count)]
-        annotations = []
+        # grown as rows are read, so that `rows` may be any iterable, including a generator
+        column_based_attributes = []
         for i, row in enumerate(rows):
+            if len(row) > len(column_based_attributes):
+                column_based_attributes.extend([{} for j in range(len(row)-len(column_based_attributes))])
             if i < header_row_count and row[0] == self.canton_value: # header row identified
                 for j, cell in enumerate(row):
                     if cell == self.canton_value:
@@ -95,11 +93,9 @@ class CellAnnotation:
                     for i in range(header_column_count,len(row)):
                         cell = row[i]
                         if cell and (row_based_attributes or column_based_attributes[i]):
-                            annotation = {
+                            yield {
                                 **self.default_attributes,
                                 **row_based_attributes,
                                 **column_based_attributes[i],
                                 self.cell_termaxis: cell
                             }
-                            annotations.append(annotation)
-        return annotations
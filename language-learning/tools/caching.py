@@ -0,0 +1,156 @@
+import os
+import sys
+import types
+import functools
+import collections
+import pickle
+import hashlib
+import operator
+import tempfile
+
+def _source_hash(module_name, hashes={}):
+    '''
+    Returns a hash of the source file of the module with the given `module_name`, or '' if it has no source file.
+    Hashes are calculated once per module for the lifetime of the process.
+    '''
+    if module_name not in hashes:
+        filename = getattr(sys.modules.get(module_name), '__file__', None)
+        hashes[module_name] = ''
+        if filename and os.path.isfile(filename):
+            with open(filename, 'rb') as file:
+                hashes[module_name] = hashlib.sha256(file.read()).hexdigest()
+    return hashes[module_name]
+
+def _container_fingerprint(value, elements):
+    '''
+    Returns a fingerprint of a value of a builtin type, such as a list or str, given fingerprints of its `elements`.
+    Subclasses are named by their module and source as well, along with any state that they add to their base class,
+    so that for instance `OrderedDict(a=1)` and `Counter(a=1)` are never confused with one another or with `{'a':1}`.
+    '''
+    cls = type(value)
+    if cls.__module__ == 'builtins':
+        name = cls.__name__
+    else:
+        name = ''.join([cls.__module__, '.', cls.__qualname__, ',', _source_hash(cls.__module__)])
+    state = []
+    if isinstance(value, collections.defaultdict):
+        state.append(fingerprint(value.default_factory))
+    if hasattr(value, '__dict__'):
+        state.append(fingerprint(vars(value)))
+    return name + '(' + ','.join([*elements, *state]) + ')'
+
+def fingerprint(value):
+    '''
+    Returns a string that describes `value` in a manner that does not change between runs,
+    so long as neither `value` nor the source code of the classes and functions that it is composed of change.
+    Unlike `repr()` or `pickle`, sets and dicts are sorted, so results do not depend on hash randomization.
+    A `TypeError` is raised for values that cannot be described in this way, such as open files or modules,
+    since describing them by `repr()` or by their attributes alone could cause unrelated values to share a fingerprint.
+    '''
+    cls = type(value)
+    if value is None or cls in {str, int, float, bool, bytes}:
+        return repr(value)
+    elif isinstance(value, (str, int, float, bytes)):
+        # subclasses, such as those of `enum`, are described by both their value and the state that they add to it
+        base = next(base for base in [bool, int, float, str, bytes] if isinstance(value, base))
+        return _container_fingerprint(value, [base.__repr__(value)])
+    elif isinstance(value, (list, tuple)):
+        return _container_fingerprint(value, [fingerprint(element) for element in value])
+    elif isinstance(value, (set, frozenset)):
+        return _container_fingerprint(value, sorted([fingerprint(element) for element in value]))
+    elif isinstance(value, dict):
+        items = [fingerprint(key)+':'+fingerprint(element) for (key, element) in value.items()]
+        # the order of an `OrderedDict` is part of its value, since it affects equality
+        return _container_fingerprint(value, items if isinstance(value, collections.OrderedDict) else sorted(items))
+    elif cls == types.FunctionType:
+        code = value.__code__
+        return ''.join([
+            'function(', value.__module__, '.', value.__qualname__,
+            ',', hashlib.sha256(code.co_code).hexdigest(),
+            ',', fingerprint([constant for constant in code.co_consts if type(constant) != types.CodeType]),
+            ',', fingerprint([cell.cell_contents for cell in (value.__closure__ or [])]),
+            ',', _source_hash(value.__module__), ')'])
+    elif cls == types.MethodType:
+        return 'method(' + fingerprint(value.__self__) + ',' + fingerprint(value.__func__) + ')'
+    elif cls == types.BuiltinFunctionType:
+        # builtin functions are bound to their module, while builtin methods are bound to the object that they are called on
+        owner = value.__self__
+        if owner is None or isinstance(owner, types.ModuleType):
+            return 'builtin(' + repr(value.__module__) + ',' + value.__qualname__ + ')'
+        return 'builtin(' + fingerprint(owner) + ',' + value.__qualname__ + ')'
+    elif isinstance(value, functools.partial):
+        return ''.join([
+            'partial(', fingerprint(value.func),
+            ',', fingerprint(value.args),
+            ',', fingerprint(value.keywords), ')'])
+    elif isinstance(value, (operator.itemgetter, operator.attrgetter, operator.methodcaller)):
+        # these are implemented in C, so they are described by the arguments that `pickle` would recreate them from
+        return 'operator(' + fingerprint(value.__reduce__()) + ')'
+    elif isinstance(value, type):
+        return 'class(' + value.__module__ + '.' + value.__qualname__ + ',' + _source_hash(value.__module__) + ')'
+    elif hasattr(value, '__dict__') and _source_hash(cls.__module__):
+        # only classes that are written in python are described by their attributes,
+        # since the state of objects that are implemented in C, such as files, is not stored in their attributes
+        return ''.join([
+            cls.__module__, '.', cls.__qualname__,
+            '(', fingerprint(vars(value)), ',', _source_hash(cls.__module__), ')'])
+    else:
+        raise TypeError(f'{cls.__module__}.{cls.__qualname__} objects cannot be fingerprinted')
+
+class SnapshotCaching:
+    '''
+    `SnapshotCaching` stores the results of expensive functions as files within a given `directory`,
+    so that they can be loaded on later runs rather than being recalculated.
+    A result is stored under a hash of everything that it depends upon, as given by `fingerprint()`,
+    so results never need to be explicitly invalidated:
+    if a table, its annotation, or any of the code that populates it changes, its hash changes as well.
+    Stale files may be removed at any time by deleting `directory`.
+    Results that cannot be pickled, or whose dependencies cannot be fingerprinted, are simply recalculated on every run.
+    '''
+    def __init__(self, directory='.cache', enabled=True):
+        self.directory = directory
+        self.enabled = enabled
+    def filename(self, *dependencies):
+        digest = hashlib.sha256(fingerprint(dependencies).encode()).hexdigest()
+        return os.path.join(self.directory, f'{digest}.pickle')
+    def load(self, filename):
+        '''
+        Returns the result that is stored in `filename`, or None if no such result could be loaded.
+        '''
+        try:
+            with open(filename, 'rb') as file:
+                return pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+    def store(self, filename, result):
+        '''
+        Stores `result` in `filename`, replacing the file in a single step
+        so that processes running at the same time never see a partially written file.
+        '''
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile('wb', dir=self.directory, suffix='.tmp', delete=False) as file:
+                try:
+                    pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+                except (pickle.PicklingError, AttributeError, TypeError):
+                    file.close()
+                    os.remove(file.name)
+                    return
+            os.replace(file.name, filename)
+        except OSError:
+            pass
+    def __call__(self, calculate, *dependencies):
+        '''
+        Returns `calculate()`, loading it from `directory` if it was calculated from the same `dependencies` before.
+        '''
+        if not self.enabled:
+            return calculate()
+        try:
+            filename = self.filename(*dependencies)
+        except TypeError:
+            return calculate()
+        result = self.load(filename)
+        if result is None:
+            result = calculate()
+            self.store(filename, result)
+        return result
@@ -1,21 +1,114 @@
+import multiprocessing
+import multiprocessing.connection
+import os
+
+
+# the function that renders shards within a worker process, as set by `_initialize_shard_worker()`
+_render_shard = None
+
+def _initialize_shard_worker(render_shard):
+    global _render_shard
+    _render_shard = render_shard
+
+def _render_shard_by_id(shard_id):
+    return _render_shard(shard_id)
 
 class DeckGeneration:
-    def __init__(self, omit_codes = ['—','❕','❔']):
+    '''
+    `DeckGeneration` renders a card for each tuplekey within a traversal, 
+    omitting cards that contain any of the given `omit_codes`.
+    If a `shard_size` is given, the tuplekeys of a traversal are split into shards of that size,
+    and shards are rendered at the same time within a pool of `processes` worker processes.
+    Workers are forked from the process that calls `generate()`, so demonstrations need not be pickled,
+    and cards are yielded in the same order as they would be without sharding.
+    Sharding is skipped within daemonic worker processes, since they are not allowed to have children.
+    '''
+    def __init__(self, omit_codes = ['—','❕','❔'], shard_size=None, processes=None):
         self.omit_codes = omit_codes
-    def generate(self, 
+        self.shard_size = shard_size
+        self.processes = processes or os.cpu_count() or 1
+    def cards(self, 
             demonstrations,
-            traversal, 
+            indexing, 
+            tuplekeys, 
             tag_templates={},
         ):
-        for tuplekey in traversal:
-            tags = traversal.indexing.dictkey(tuplekey)
+        '''
+        Returns a list of cards for the given `tuplekeys`, in order.
+        '''
+        cards = []
+        for tuplekey in tuplekeys:
+            tags = indexing.dictkey(tuplekey)
             card = ' '.join([
                 str(demonstration(tags, tag_templates)) 
                 for demonstration in demonstrations])
             if all([symbol not in card for symbol in self.omit_codes]):
                 # if '{{' not in card:
                 #     breakpoint()
-                yield card
+                cards.append(card)
+        return cards
+    def generate(self, 
+            demonstrations,
+            traversal, 
+            tag_templates={},
+        ):
+        if (self.shard_size is None or self.processes < 2 
+                or multiprocessing.current_process().daemon):
+            for tuplekey in traversal:
+                yield from self.cards(demonstrations, traversal.indexing, [tuplekey], tag_templates)
+            return
+        tuplekeys = list(traversal)
+        shards = [tuplekeys[i:i+self.shard_size] 
+            for i in range(0, len(tuplekeys), self.shard_size)]
+        def render_shard(shard_id):
+            return self.cards(demonstrations, traversal.indexing, shards[shard_id], tag_templates)
+        context = multiprocessing.get_context('fork')
+        with context.Pool(min(self.processes, len(shards)) or 1, 
+                _initialize_shard_worker, (render_shard,)) as pool:
+            for cards in pool.imap(_render_shard_by_id, range(len(shards))):
+                yield from cards
+
+
+class DeckScheduling:
+    '''
+    `DeckScheduling` declares decks as jobs that are all generated at the same time once `run()` is called.
+    A job consists of a filename and a lazy sequence of cards, such as the generator returned by `DeckGeneration.generate()`,
+    and it is completed by passing both to a given `write` function.
+    Each job runs in its own process that is forked only once `run()` is called,
+    so that jobs inherit any languages, lookups, and traversals that were built beforehand
+    without having to copy or pickle them.
+    Jobs run serially if `processes` is 1, or if the current process is itself a daemonic worker
+    (such as those started by "inflections.py"), since daemonic processes are not allowed to have children.
+    '''
+    def __init__(self, write, processes=None):
+        self.write = write
+        self.processes = processes or os.cpu_count() or 1
+        self.jobs = []
+    def schedule(self, filename, cards):
+        self.jobs.append((filename, cards))
+    def run(self):
+        jobs, self.jobs = self.jobs, []
+        if self.processes < 2 or len(jobs) < 2 or multiprocessing.current_process().daemon:
+            for (filename, cards) in jobs:
+                self.write(filename, cards)
+            return
+        context = multiprocessing.get_context('fork')
+        pending = list(reversed(jobs))
+        running = {}
+        failed = []
+        while pending or running:
+            while pending and len(running) < self.processes:
+                (filename, cards) = pending.pop()
+                process = context.Process(target=self.write, args=(filename, cards), name=filename)
+                process.start()
+                running[process.sentinel] = process
+            for sentinel in multiprocessing.connection.wait(list(running.keys())):
+                process = running.pop(sentinel)
+                process.join()
+                if process.exitcode != 0:
+                    failed.append(process.name)
+        if failed:
+            raise RuntimeError('The following decks could not be generated: ' + ', '.join(failed))
 
 
 class CardFormatting:
@@ -1,4 +1,5 @@
 from .shorthands import EmojiPerson
+from .indexing import TagContext
 
 def TextDemonstration(
             label_editing, 
@@ -16,12 +17,11 @@ def TextDemonstration(
             def demonstrate(tags, tag_templates):
                 tags = {**tags, **self.orthography.language.tags}
                 semes = {
-                    label:{
-                        **tags, 
+                    label:TagContext(tags, {
                         **label_editing.termaxis_to_term(
                             label_filtering.termaxis_to_term(tags, label),
                             strip=label),
-                        **(tag_templates[label]  if label in tag_templates else {})}
+                        **(tag_templates[label]  if label in tag_templates else {})})
                     for label in 'test dummy speaker participle'.split()
                 }
                 completed_substitutions = [
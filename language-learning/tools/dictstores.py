@@ -1,8 +1,278 @@
 import math
+import operator
 import itertools
+from array import array
 from collections import OrderedDict
 
-from .indexing import DictTupleIndexing
+from .indexing import DictKeyIndexing, DictTupleIndexing, mapping_types, dictkey_types
+
+def _filter_keys(other):
+    '''
+    Returns the keys whose values determine whether a dictkey is contained within a `DictSet` or `DictSpace`, `other`.
+    '''
+    return set(other.key_to_values.keys() if type(other) == DictSpace else other.indexing)
+
+def _membership(indexing, other):
+    '''
+    Returns a function that indicates whether the dictkey of a tuplekey from `indexing` is within `other`,
+    where `other` is a `DictSet` or `DictSpace`.
+    Where possible, the function projects columns of the tuplekey directly onto the keys of `other` 
+    using a map of column indices that is calculated only once,
+    so that testing a tuplekey costs only a tuple slice and a set probe.
+    Otherwise, the function converts the tuplekey to a dictkey, as would `indexing.dictkey(tuplekey) in other`.
+    '''
+    columns = {key:i for (i, key) in enumerate(indexing.keys)}
+    if any(key in indexing.defaults for key in _filter_keys(other)):
+        return lambda tuplekey: indexing.dictkey(tuplekey) in other
+    if type(other) == DictSpace:
+        # a key that is missing from the tuplekey can never match, just as it would never match the dictkey
+        if any(key not in columns for key in other.key_to_values):
+            return lambda tuplekey: False
+        column_values = [(columns[key], set(values)) for (key, values) in other.key_to_values.items()]
+        return lambda tuplekey: all([tuplekey[i] in values for (i, values) in column_values])
+    if type(other.indexing) == DictKeyIndexing:
+        i = columns[other.indexing.key]
+        return lambda tuplekey: tuplekey[i] in other.content
+    permutation = [columns[key] for key in other.indexing.keys]
+    project = (operator.itemgetter(*permutation) if len(permutation) > 1
+        else (lambda tuplekey: (tuplekey[permutation[0]],)) if len(permutation) == 1
+        else (lambda tuplekey: ()))
+    return lambda tuplekey: project(tuplekey) in other.content
+
+class ColumnarTuplekeys:
+    '''
+    `ColumnarTuplekeys` is a sequence of tuplekeys that is stored as a list of columns rather than a list of tuples.
+    Each column is dictionary encoded as a `vocabulary` of the distinct values within the column
+    alongside an `array` of small integer `codes` that index into the vocabulary.
+    A traversal with many keys then costs a few bytes per key per row rather than a tuple of references,
+    and tuplekeys are only decoded as they are iterated.
+    '''
+    def __init__(self, columns, length):
+        self.columns = columns
+        self.length = length
+    def __iter__(self):
+        if not self.columns:
+            return itertools.repeat((), self.length)
+        return zip(*[map(vocabulary.__getitem__, codes) for (vocabulary, codes) in self.columns])
+    def __len__(self):
+        return self.length
+    def __getitem__(self, i):
+        return tuple([vocabulary[codes[i]] for (vocabulary, codes) in self.columns])
+
+def _codes(values, count):
+    '''
+    Returns an `array` of integer codes that stores `values`, given that there are `count` distinct codes.
+    '''
+    return array('H' if count <= 0xFFFF else 'L', values)
+
+def _encode(tuplekeys, width):
+    '''
+    Returns `ColumnarTuplekeys` that store the given `tuplekeys`, each of which has `width` values.
+    '''
+    tuplekeys = list(tuplekeys)
+    columns = []
+    for column in (zip(*tuplekeys) if tuplekeys else [()]*width):
+        vocabulary = list(dict.fromkeys(column))
+        code_of = {value:code for (code, value) in enumerate(vocabulary)}
+        columns.append((vocabulary, _codes(map(code_of.__getitem__, column), len(vocabulary))))
+    return ColumnarTuplekeys(columns, len(tuplekeys))
+
+def _columnar_product(inner, outer):
+    '''
+    Returns `ColumnarTuplekeys` that store the cartesian product of two `ColumnarTuplekeys`,
+    in the same order as `DictProductExpression.tuplekeys()`.
+    Columns of `inner` are repeated as a whole, and each code within the columns of `outer` is repeated in place,
+    so that no tuplekey is ever constructed.
+    '''
+    return ColumnarTuplekeys([
+            *[(vocabulary, codes*outer.length) 
+              for (vocabulary, codes) in inner.columns],
+            *[(vocabulary, array(codes.typecode, itertools.chain.from_iterable(
+                    map(itertools.repeat, codes, itertools.repeat(inner.length)))))
+              for (vocabulary, codes) in outer.columns],
+        ], inner.length*outer.length)
+
+def _columnar_membership(indexing, other, tuplekeys):
+    '''
+    Returns a sequence of booleans that indicate whether the dictkey of each tuplekey within `ColumnarTuplekeys` is within `other`,
+    where `other` is a `DictSet` or `DictSpace`, and tuplekeys are ordered according to `indexing`.
+    Tests are made on codes, so each distinct value of a column is tested against `other` only once.
+    '''
+    columns = {key:i for (i, key) in enumerate(indexing.keys)}
+    if any(key in indexing.defaults for key in _filter_keys(other)):
+        return list(map(_membership(indexing, other), tuplekeys))
+    if type(other) == DictSpace:
+        if any(key not in columns for key in other.key_to_values):
+            return bytes(tuplekeys.length)
+        mask = None
+        for (key, values) in other.key_to_values.items():
+            (vocabulary, codes) = tuplekeys.columns[columns[key]]
+            allowed = bytes([value in values for value in vocabulary])
+            selectors = int.from_bytes(bytes(map(allowed.__getitem__, codes)), 'little')
+            mask = selectors if mask is None else mask & selectors
+        return (bytes([1])*tuplekeys.length if mask is None 
+            else mask.to_bytes(tuplekeys.length, 'little'))
+    if type(other.indexing) == DictKeyIndexing:
+        (vocabulary, codes) = tuplekeys.columns[columns[other.indexing.key]]
+        allowed = bytes([value in other.content for value in vocabulary])
+        return bytes(map(allowed.__getitem__, codes))
+    permutation = [columns[key] for key in other.indexing.keys]
+    code_ofs = [{value:code for (code, value) in enumerate(tuplekeys.columns[i][0])} for i in permutation]
+    allowed = set([
+        tuple([code_of[value] for (code_of, value) in zip(code_ofs, tuplekey)])
+        for tuplekey in other.content
+        if all([value in code_of for (code_of, value) in zip(code_ofs, tuplekey)])])
+    return list(map(allowed.__contains__, zip(*[tuplekeys.columns[i][1] for i in permutation]) if permutation
+        else itertools.repeat((), tuplekeys.length)))
+
+def _columnar(*stores):
+    '''
+    Returns whether any of the given stores is a columnar `DictList`.
+    '''
+    return any([type(store) == DictList and store.columnar for store in stores])
+
+def _expression(store):
+    '''
+    Returns an expression that generates the tuplekeys of a `DictList` or `DictSpace`.
+    Expressions of `DictList`s that have not yet been materialized are reused,
+    so that filters may be pushed down into them.
+    '''
+    if type(store) == DictList and store.expression is not None:
+        return store.expression
+    return DictStoreExpression(store)
+
+class DictStoreExpression:
+    '''
+    `DictStoreExpression` is the leaf of an expression graph that is built by the operators of `DictList` and `DictSpace`.
+    It generates the tuplekeys of a store that already exists in memory.
+    '''
+    def __init__(self, store):
+        self.store = store
+        self.indexing = store.indexing
+    def tuplekeys(self):
+        return iter(self.store)
+    def columns(self):
+        '''
+        Returns `ColumnarTuplekeys` that store the same tuplekeys as `tuplekeys()`.
+        The columns of a `DictSpace` are built key by key without generating any tuplekeys.
+        '''
+        store = self.store
+        if type(store) == DictSpace:
+            columns = ColumnarTuplekeys([], 1)
+            for key in store.indexing.keys:
+                values = list(store.key_to_values[key])
+                columns = _columnar_product(columns, 
+                    ColumnarTuplekeys([(values, _codes(range(len(values)), len(values)))], len(values)))
+            return columns
+        if type(store) == DictList and type(store.sequence) == ColumnarTuplekeys:
+            return store.sequence
+        return _encode(iter(store), len(list(store.indexing)))
+    def filter(self, other, keep, name):
+        '''
+        Returns an expression that generates only the tuplekeys whose dictkeys are (or if not `keep`, are not) within `other`.
+        Filtering a `DictSpace` by another `DictSpace` simply narrows the values of each key, 
+        which produces tuplekeys in the same order as would filtering each tuplekey individually.
+        '''
+        store = self.store
+        if (keep and type(store) == DictSpace and type(other) == DictSpace 
+                and _filter_keys(other) <= set(store.indexing)):
+            key_to_values = {
+                key: [value for value in values if key not in other.key_to_values or value in other.key_to_values[key]]
+                for (key, values) in store.key_to_values.items()}
+            narrowed = DictSpace(store.name, store.indexing, key_to_values)
+            if len(narrowed) < 1:
+                raise ValueError(f'Empty DictList: {name}')
+            return DictStoreExpression(narrowed)
+        return DictFilterExpression(self, other, keep, name)
+
+class DictFilterExpression:
+    '''
+    `DictFilterExpression` generates the tuplekeys of another expression, `source`,
+    whose dictkeys are (or if not `keep`, are not) within a `DictSet` or `DictSpace`, `other`.
+    '''
+    def __init__(self, source, other, keep, name):
+        self.source = source
+        self.other = other
+        self.keep = keep
+        self.name = name
+        self.indexing = source.indexing
+    def tuplekeys(self):
+        contains = _membership(self.indexing, self.other)
+        keep = self.keep
+        empty = True
+        for tuplekey in self.source.tuplekeys():
+            if contains(tuplekey) == keep:
+                empty = False
+                yield tuplekey
+        if empty:
+            raise ValueError(f'Empty DictList: {self.name}')
+    def columns(self):
+        source = self.source.columns()
+        mask = _columnar_membership(self.indexing, self.other, source)
+        if not self.keep:
+            mask = bytes(map(operator.not_, mask))
+        columns = ColumnarTuplekeys(
+            [(vocabulary, array(codes.typecode, itertools.compress(codes, mask)))
+             for (vocabulary, codes) in source.columns], 
+            sum(mask))
+        if columns.length < 1:
+            raise ValueError(f'Empty DictList: {self.name}')
+        return columns
+    def filter(self, other, keep, name):
+        '''
+        Filters commute, so a new filter is pushed beneath this one, towards the leaves of the graph.
+        '''
+        return DictFilterExpression(self.source.filter(other, keep, name), self.other, self.keep, self.name)
+
+class DictProductExpression:
+    '''
+    `DictProductExpression` generates the cartesian product of the tuplekeys of two expressions with disjoint keys.
+    For each tuplekey of `outer`, it generates every tuplekey of `inner`, 
+    concatenated with the tuplekey of `outer`, which matches the order of keys in `inner.indexing | outer.indexing`.
+    Tuplekeys are concatenated directly, without converting them to dictkeys.
+    '''
+    def __init__(self, inner, outer):
+        self.inner = inner
+        self.outer = outer
+        self.indexing = inner.indexing | outer.indexing
+    def tuplekeys(self):
+        inner = list(self.inner.tuplekeys())
+        for outer in self.outer.tuplekeys():
+            for tuplekey in inner:
+                yield tuplekey + outer
+    def columns(self):
+        return _columnar_product(self.inner.columns(), self.outer.columns())
+    def filter(self, other, keep, name):
+        '''
+        Pushes a filter into whichever operand contains all the keys that the filter depends upon,
+        so that the filter is applied before the product is taken.
+        '''
+        keys = _filter_keys(other)
+        if keys <= set(self.inner.indexing):
+            return DictProductExpression(self.inner.filter(other, keep, name), self.outer)
+        elif keys <= set(self.outer.indexing):
+            return DictProductExpression(self.inner, self.outer.filter(other, keep, name))
+        return DictFilterExpression(self, other, keep, name)
+
+class DictConcatenationExpression:
+    '''
+    `DictConcatenationExpression` generates the tuplekeys of `first`, followed by those of `second`,
+    where the tuplekeys of `second` are reordered to match the keys of `first`.
+    '''
+    def __init__(self, first, second):
+        self.first = first
+        self.second = second
+        self.indexing = first.indexing
+    def tuplekeys(self):
+        yield from self.first.tuplekeys()
+        tuplekey = self.indexing.tuplekey
+        dictkey = self.second.indexing.dictkey
+        for other in self.second.tuplekeys():
+            yield tuplekey(dictkey(other))
+    def columns(self):
+        return _encode(self.tuplekeys(), len(self.indexing.keys))
+    def filter(self, other, keep, name):
+        return DictFilterExpression(self, other, keep, name)
 
 class DictList:
     '''
@@ -13,18 +283,43 @@ class DictList:
     It can be considered a set of points within a `DictSpace`.
     A 'dictkey' is a dictionary that maps each key to either a value or a set of values.
     A 'dictkey' is indexed by one or more 'tuplekeys', which are ordinary tuples of values.
+    The operators of `DictList` and `DictSpace` return `DictList`s that are built from an `expression`
+    rather than a `sequence`. The expression is only evaluated once the `DictList` is first traversed,
+    at which point filters have been pushed down the expression as far as they can go,
+    and the resulting sequence is kept so that the expression is never evaluated again.
+    If `columnar` is set, the sequence is stored as `ColumnarTuplekeys`, 
+    and expressions are evaluated a column at a time rather than a tuplekey at a time.
+    `DictList`s that are returned by operators are columnar if any of their operands are columnar.
     '''
-    def __init__(self, name, indexing, sequence):
+    def __init__(self, name, indexing, sequence=None, expression=None, columnar=False):
         self.name = name
         self.indexing = indexing
-        self.sequence = [indexing.tuplekey(entry) for entry in sequence]
-        misaligned = [len(tuplekey) 
-            for tuplekey in self.sequence
-            if len(tuplekey) != len(indexing.keys)]
-        if misaligned:
-            raise ValueError(
-                f'DictList indexing is misaligned with keys: expected {len(indexing.keys)}, got '+
-                ', '.join(misaligned))
+        self.expression = expression
+        self.columnar = columnar
+        self._sequence = None
+        if expression is None:
+            self._sequence = [indexing.tuplekey(entry) for entry in sequence]
+            misaligned = [len(tuplekey) 
+                for tuplekey in self._sequence
+                if len(tuplekey) != len(indexing.keys)]
+            if misaligned:
+                raise ValueError(
+                    f'DictList indexing is misaligned with keys: expected {len(indexing.keys)}, got '+
+                    ', '.join(misaligned))
+            if columnar:
+                self._sequence = _encode(self._sequence, len(indexing.keys))
+    @property
+    def sequence(self):
+        if self._sequence is None:
+            self._sequence = (self.expression.columns() if self.columnar
+                else list(self.expression.tuplekeys()))
+            self.expression = None
+        return self._sequence
+    def in_columns(self):
+        '''
+        Return a columnar `DictList` that contains the same tuplekeys as `self`.
+        '''
+        return DictList(self.name, self.indexing, expression=_expression(self), columnar=True)
     def __str__(self):
         cell_width = 13
         return '\n'.join([
@@ -64,14 +359,9 @@ class DictList:
             f'Indexes of "{self.name}" and "{other.name}" are not equivalent.',
             f'Addition is only supported for equivalent indexes.',
             f'The nonequivalent keys are: {nonequivalent}'])
-        result = DictList(
-            name, indexing,
-            sequence = [
-                *self,
-                *[indexing.tuplekey(other.indexing.dictkey(tuplekey))
-                  for tuplekey in other]
-            ])
-        return result
+        return DictList(name, indexing, 
+            expression = DictConcatenationExpression(_expression(self), _expression(other)),
+            columnar = _columnar(self, other))
     def __mul__(self, other):
         '''
         Return the cartesian product of two `DictList`s.
@@ -84,41 +374,27 @@ class DictList:
             f'Indexes of "{self.name}" and "{other.name}" are not disjoint.',
             f'Multiplication is only supported for disjoint indexes. ',
             f'The overlapping keys are: {overlap}'])
-        result = DictList(
-            name, indexing,
-            sequence = [
-                indexing.tuplekey({**dictkey1, **dictkey2})
-                for (dictkey1, dictkey2) in itertools.product(
-                    [other.indexing.dictkey(tuplekey) for tuplekey in other],
-                    [self.indexing.dictkey(tuplekey) for tuplekey in self])
-            ])
-        return result
+        return DictList(name, indexing, 
+            expression = DictProductExpression(_expression(self), _expression(other)),
+            columnar = _columnar(self, other))
     def __and__(self, other):
         '''
         Return the intersection of `self` with a `DictSet`s whose keys are disjoint with those of `self`.
         '''
         assert type(other) in {DictSet, DictSpace}
         name = f'({self.name}) & ({other.name})'
-        result = DictList(name,
-            self.indexing,
-            sequence = [tuplekey
-                 for tuplekey in self
-                 if self.indexing.dictkey(tuplekey) in other])
-        if result.empty(): raise ValueError(f'Empty DictList: {name}')
-        return result
+        return DictList(name, self.indexing, 
+            expression = _expression(self).filter(other, True, name),
+            columnar = _columnar(self))
     def __sub__(self, other):
         '''
         Return the negation of `self` with a `DictSet`.
         '''
         assert type(other) in {DictSet, DictSpace}
         name = f'({self.name}) - ({other.name})'
-        result = DictList(name,
-            self.indexing,
-            sequence = [tuplekey
-                 for tuplekey in self
-                 if self.indexing.dictkey(tuplekey) not in other])
-        if result.empty(): raise ValueError(f'Empty DictList: {name}')
-        return result
+        return DictList(name, self.indexing, 
+            expression = _expression(self).filter(other, False, name),
+            columnar = _columnar(self))
 
 class DictSpace:
     '''
@@ -157,7 +433,7 @@ class DictSpace:
             *[f'{key:10}:{values}' for (key,values) in self.key_to_values.items()],
         ])
     def __contains__(self, dictkey):
-        assert type(dictkey) in {dict}
+        assert type(dictkey) in mapping_types
         return all([
             key in dictkey and dictkey[key] in values
             for (key,values) in self.key_to_values.items()])
@@ -203,14 +479,9 @@ class DictSpace:
             f'Indexes of "{self.name}" and "{other.name}" are not equivalent.',
             f'Addition is only supported for equivalent indexes.',
             f'The nonequivalent keys are: {nonequivalent}'])
-        result = DictList(
-            name, indexing,
-            sequence = [
-                *self,
-                *[indexing.tuplekey(other.indexing.dictkey(tuplekey)) 
-                  for tuplekey in other]
-            ])
-        return result
+        return DictList(name, indexing, 
+            expression = DictConcatenationExpression(_expression(self), _expression(other)),
+            columnar = _columnar(self, other))
     def __mul__(self, other):
         '''
         Return the cartesian product of two `DictSpace`s.
@@ -224,20 +495,9 @@ class DictSpace:
             f'Multiplication is only supported for disjoint indexes. ',
             f'The overlapping keys are: {overlap}'])
         if type(other) == DictList:
-            tuplekeys = [
-                    indexing.tuplekey({**dictkey1, **dictkey2})
-                    for (dictkey1, dictkey2) in itertools.product(
-                        [other.indexing.dictkey(tuplekey) for tuplekey in other],
-                        [self.indexing.dictkey(tuplekey) for tuplekey in self])
-                ]
-            result = DictList(
-                name, indexing,
-                sequence = [tuplekey 
-                    for tuplekey in tuplekeys
-                    if indexing.dictkey(tuplekey) in self
-                    or indexing.dictkey(tuplekey) in other
-                ])
-            return result
+            return DictList(name, indexing, 
+                expression = DictProductExpression(_expression(self), _expression(other)),
+                columnar = _columnar(self, other))
         elif type(other) == DictSpace:
             result = DictSpace(
                 name, indexing,
@@ -252,27 +512,17 @@ class DictSpace:
         If keys are not disjoint, replace values from `self` with those of `other`.
         '''
         name = f'({self.name}) & ({other.name})'
-        result = DictList(
-                name, self.indexing,
-                sequence = [tuplekey
-                    for tuplekey in self
-                    if self.indexing.dictkey(tuplekey) in other])
-        if result.empty():
-            raise ValueError(f'Empty DictList: {name}')
-        return result
+        return DictList(name, self.indexing, 
+            expression = _expression(self).filter(other, True, name),
+            columnar = _columnar(self))
     def __sub__(self, other):
         '''
         Return the negation of two `DictSpace`s.
         '''
         name = f'({self.name}) - ({other.name})'
-        result = DictList(
-                name, self.indexing,
-                sequence = [tuplekey
-                    for tuplekey in self
-                    if self.indexing.dictkey(tuplekey) not in other])
-        if result.empty():
-            raise ValueError(f'Empty DictList: {name}')
-        return result
+        return DictList(name, self.indexing, 
+            expression = _expression(self).filter(other, False, name),
+            columnar = _columnar(self))
 
 class DictSet:
     '''
@@ -288,7 +538,7 @@ class DictSet:
         self.indexing = indexing
         self.content = set([indexing.tuplekey(entry) for entry in content])
     def __contains__(self, key):
-        assert type(key) in {tuple, str, dict}
+        assert type(key) in dictkey_types
         return self.indexing.tuplekey(key) in self.content
     def __str__(self):
         cell_width = 13
@@ -343,11 +593,14 @@ class DictLookup:
         Return the value that is indexed by `dictkey` 
         if it is the only such value, otherwise return None.
         '''
-        assert type(dictkey) in {tuple, str, dict}
+        assert type(dictkey) in dictkey_types
         if type(dictkey) in {tuple,str}:
             return self.content[dictkey]
         else:
             # self.indexing.check(dictkey)
+            tuplekey = self.indexing.scalar_tuplekey(dictkey)
+            if tuplekey is not None and tuplekey in self.content:
+                return self.content[tuplekey]
             tuplekeys = [tuplekey 
                 for tuplekey in self.indexing.tuplekeys(dictkey)
                 if tuplekey in self.content]
@@ -376,7 +629,7 @@ class DictLookup:
         '''
         Store `value` within the indices represented by `dictkey`.
         '''
-        assert type(dictkey) in {tuple, str, dict}
+        assert type(dictkey) in dictkey_types
         if type(dictkey) in {tuple,str}:
             self.content[dictkey] = value
         else:
@@ -412,13 +665,30 @@ class DictLookup:
              if inpoint in self])
         return composition
     def __contains__(self, dictkey):
-        assert type(dictkey) in {tuple, str, dict}
+        assert type(dictkey) in dictkey_types
         if type(dictkey) in {tuple,str}:
             return dictkey in self.content
         else:
             # self.indexing.check(dictkey)
+            tuplekey = self.indexing.scalar_tuplekey(dictkey)
+            if tuplekey is not None:
+                return tuplekey in self.content
             tuplekeys = list(self.indexing.tuplekeys(dictkey))
             return len(tuplekeys) == 1 and tuplekeys[0] in self
+    def get_many(self, dictkeys):
+        '''
+        Return a list of the values that are indexed by each of the given `dictkeys`, in order.
+        This is equivalent to `[self[dictkey] for dictkey in dictkeys]`,
+        but it resolves dictkeys that map each key to a single value without method dispatch.
+        '''
+        content = self.content
+        scalar_tuplekey = self.indexing.scalar_tuplekey
+        values = []
+        for dictkey in dictkeys:
+            tuplekey = scalar_tuplekey(dictkey) if type(dictkey) in mapping_types else dictkey
+            values.append(content[tuplekey] if tuplekey is not None and tuplekey in content 
+                else self[dictkey])
+        return values
     def __iter__(self):
         return self.content.__iter__()
     def __len__(self):
@@ -441,7 +711,7 @@ class DefaultDictLookup:
         Return the value that is indexed by `key` 
         if it is the only such value, otherwise return None.
         '''
-        assert type(key) in {tuple, str, dict}
+        assert type(key) in dictkey_types
         if type(key) in {tuple, str}:
             if key in self.content:
                 return self.content[key]
@@ -453,6 +723,9 @@ class DefaultDictLookup:
             # if type(key) in {dict}:
             #     assert all([type(value)==list for (key, value) in key.items()]), 'key should not map keys to lists'
             # self.indexing.check(key)
+            tuplekey = self.indexing.scalar_tuplekey(key)
+            if tuplekey is not None:
+                return self.__getitem__(tuplekey)
             tuplekeys = list(self.indexing.tuplekeys(key))
             if len(tuplekeys) == 1:
                 return self.__getitem__(tuplekeys[0])
@@ -469,7 +742,7 @@ class DefaultDictLookup:
         '''
         Store `value` within the indices represented by `key`.
         '''
-        assert type(key) in {tuple, str, dict}
+        assert type(key) in dictkey_types
         if type(key) in {tuple, str}:
             self.content[key] = value
         else:
@@ -488,13 +761,16 @@ class DefaultDictLookup:
                 else:
                     self.content[tuplekey] = value
     def __contains__(self, key):
-        assert type(key) in {tuple, str, dict}
+        assert type(key) in dictkey_types
         if type(key) in {tuple,str}:
             return key in self.content
         else:
             # if type(key) in {dict}:
             #     assert all([type(value)==list for (key, value) in key.items()]), 'key should not map keys to lists'
             # self.indexing.check(key)
+            tuplekey = self.indexing.scalar_tuplekey(key)
+            if tuplekey is not None:
+                return tuplekey in self.content
             tuplekeys = list(self.indexing.tuplekeys(key))
             return len(tuplekeys) == 1 and tuplekeys[0] in self
     def __iter__(self):
@@ -509,10 +785,10 @@ class NestedDictLookup:
     def __init__(self, dict_lookups):
         self.dict_lookups = dict_lookups
     def __getitem__(self, key):
-        assert type(key) in {tuple, str, dict}
+        assert type(key) in dictkey_types
         return self.dict_lookups[key][key]
     def __setitem__(self, key, value):
-        assert type(key) in {tuple, str, dict}
+        assert type(key) in dictkey_types
         self.dict_lookups[key][key] = value
     def __contains__(self, key):
         return key in self.dict_lookups and key in self.dict_lookups[key]
@@ -525,7 +801,7 @@ class FallbackDictLookup:
         self.main = main
         self.fallback = fallback
     def __getitem__(self, key):
-        assert type(key) in {tuple, str, dict}
+        assert type(key) in dictkey_types
         if key in self.main:
             return self.main[key]
         else:
@@ -533,10 +809,10 @@ class FallbackDictLookup:
             self.main[key] = value
             return value
     def __setitem__(self, key, value):
-        assert type(key) in {tuple, str, dict}
+        assert type(key) in dictkey_types
         self.main[key] = value
     def __contains__(self, key):
-        assert type(key) in {tuple, str, dict}
+        assert type(key) in dictkey_types
         return True
 
 class UniformDictLookup:
@@ -546,10 +822,10 @@ class UniformDictLookup:
     def __init__(self, constant):
         self.constant = constant
     def __getitem__(self, key):
-        assert type(key) in {tuple, str, dict}
+        assert type(key) in dictkey_types
         return self.constant
     def __contains__(self, key):
-        assert type(key) in {tuple, str, dict}
+        assert type(key) in dictkey_types
         return True
     def __iter__(self):
         return [self.constant].__iter__()
@@ -561,8 +837,8 @@ class ProceduralLookup:
     def __init__(self, get):
         self.get = get
     def __getitem__(self, key):
-        assert type(key) in {tuple, str, dict}
+        assert type(key) in dictkey_types
         return self.get(key)
     def __contains__(self, key):
-        assert type(key) in {tuple, str, dict}
+        assert type(key) in dictkey_types
         return True
@@ -1,5 +1,75 @@
 import math
+import operator
 import itertools
+from collections.abc import Mapping
+
+# types that indicate a dictkey maps a key to several possible values
+multiple_value_types = frozenset([set, list])
+
+class TagContext(Mapping):
+    '''
+    `TagContext` is an immutable dictkey that is passed down a syntax tree by tree maps.
+    Whenever a node modifies the tags of its parent, a new `TagContext` is created 
+    that stores only the modified tags (`overlay`) alongside a reference to the tags of the parent (`parent`),
+    in a manner similar to `collections.ChainMap`.
+    This spares us from copying every tag at every node of every tree.
+    Both `parent` and `overlay` may be any mapping, and `parent` may be None.
+    Neither may be modified once the `TagContext` is created.
+    Since the same tags are often looked up several times at a single node, 
+    tuplekeys that are projected from a `TagContext` by an indexing can be cached using `cached()`.
+    '''
+    __slots__ = ('parent', 'overlay', 'projections')
+    def __init__(self, parent, overlay):
+        self.parent = parent
+        self.overlay = overlay
+        self.projections = None
+    def __getitem__(self, key):
+        context = self
+        while type(context) is TagContext:
+            if key in context.overlay:
+                return context.overlay[key]
+            context = context.parent
+        if context is None:
+            raise KeyError(key)
+        return context[key]
+    def __contains__(self, key):
+        context = self
+        while type(context) is TagContext:
+            if key in context.overlay:
+                return True
+            context = context.parent
+        return context is not None and key in context
+    def __iter__(self):
+        return self.flat().__iter__()
+    def __len__(self):
+        return len(self.flat())
+    def __str__(self):
+        return str(self.flat())
+    def __repr__(self):
+        return str(self.flat())
+    def flat(self):
+        '''
+        Returns a dict that contains the same tags as the `TagContext`, in the order they would have if they were merged.
+        '''
+        parent = self.parent
+        return {
+            **(parent.flat() if type(parent) is TagContext else {} if parent is None else parent),
+            **self.overlay,
+        }
+    def cached(self, key, project):
+        '''
+        Returns `project(self)`, calling `project` only if no result has been cached for `key`.
+        '''
+        if self.projections is None:
+            self.projections = {}
+        projections = self.projections
+        if key not in projections:
+            projections[key] = project(self)
+        return projections[key]
+
+# types that can serve as dictkeys, either as mappings or as tuplekeys
+mapping_types = frozenset([dict, TagContext])
+dictkey_types = frozenset([tuple, str, *mapping_types])
 
 class DictKeyIndexing:
     '''
@@ -34,17 +104,26 @@ class DictKeyIndexing:
         Returns a value that represents the `containerkey` according to the indexing,
         where `containerkey` is either a value, or a dict that maps a key from `keys` to a single value.
         '''
-        if type(containerkey) == dict:
+        if type(containerkey) in mapping_types:
             return containerkey[self.key]
         else:
             return containerkey
+    def scalar_tuplekey(self, dictkey):
+        '''
+        Returns the only value that can be indexed by a `dictkey` dict if it maps `key` to a single value,
+        otherwise returns None.
+        '''
+        key = self.key
+        if key not in dictkey or type(dictkey[key]) in multiple_value_types:
+            return None
+        return dictkey[key]
     def tuplekeys(self, dictkey):
         '''
         Returns a generator that iterates through possible values for the given `key`
         given values from a `dictkey` dict that maps a key to either a value or a set of possible values.
         '''
         key = self.key
-        if type(dictkey) in {dict}:
+        if type(dictkey) in mapping_types:
             return ([] if key not in dictkey 
                     else dictkey[key] if type(dictkey[key]) in {set,list} 
                     else [dictkey[key]])
@@ -54,7 +133,7 @@ class DictKeyIndexing:
             return [dictkey]
     def count(self, dictkey):
         key = self.key
-        if type(dictkey) in {dict}:
+        if type(dictkey) in mapping_types:
             return (0 if key not in dictkey 
                     else len(dictkey[key]) if type(dictkey[key]) in {set,list} 
                     else 1)
@@ -76,6 +155,12 @@ class DictTupleIndexing:
     def __init__(self, keys, defaults=None):
         self.keys = keys
         self.defaults = {} if defaults is None else defaults
+        self.getter = (operator.itemgetter(*keys) if len(keys) > 1
+            else (lambda dictkey: (dictkey[keys[0]],)) if len(keys) == 1
+            else (lambda dictkey: ()))
+    def __reduce__(self):
+        # `getter` may be a lambda, so it is rebuilt from `keys` rather than pickled
+        return (DictTupleIndexing, (self.keys, self.defaults))
     def __str__(self):
         return ''.join([f'DictTupleIndexing(', ', '.join(self.keys), ')'])
     def __repr__(self):
@@ -92,10 +177,30 @@ class DictTupleIndexing:
         '''
         if type(containerkey) == tuple:
             return containerkey
-        elif type(containerkey) == dict:
+        elif type(containerkey) in mapping_types:
             return tuple([containerkey[key] for key in self.keys])
         else:
             raise ValueError(f'Invalid key of type "{type(containerkey)}"')
+    def scalar_tuplekey(self, dictkey):
+        '''
+        Returns the only tuple that can be generated from `self.tuplekeys(dictkey)`
+        if `dictkey` maps every key from `keys` to a single value, otherwise returns None.
+        This is equivalent to `self.tuplekeys(dictkey)` in the common case where only one tuple exists,
+        but it does not need to merge defaults or build a cartesian product.
+        Results are cached if `dictkey` is a `TagContext`.
+        '''
+        if type(dictkey) is TagContext:
+            return dictkey.cached(self, self._scalar_tuplekey)
+        return self._scalar_tuplekey(dictkey)
+    def _scalar_tuplekey(self, dictkey):
+        try:
+            tuplekey = self.getter(dictkey)
+        except KeyError:
+            try:
+                tuplekey = self.getter({**self.defaults, **dictkey})
+            except KeyError:
+                return None
+        return tuplekey if multiple_value_types.isdisjoint(map(type, tuplekey)) else None
     def tuplekeys(self, dictkey):
         '''
         Returns a generator that iterates through 
@@ -24,7 +24,8 @@ from tools.dictstores import DefaultDictLookup, DictLookup, DictSet
 from tools.indexing import DictTupleIndexing, DictKeyIndexing
 from tools.labels import TermLabelEditing, TermLabelFiltering
 from tools.evaluation import KeyEvaluation, MultiKeyEvaluation
-from tools.population import NestedLookupPopulation, FlatLookupPopulation, DictSetPopulation
+from tools.population import NestedLookupPopulation, FlatLookupPopulation, DictSetPopulation, AnnotatedFiles
+from tools.caching import SnapshotCaching
 from tools.nodemaps import ListTools, RuleTools
 from tools.demonstration import TextDemonstration, EmojiDemonstration
 from tools.cards import CardFormatting
@@ -442,20 +443,24 @@ template_dummy_annotation = RowAnnotation('flag subjectivity verb voice valency
 template_tree_annotation = RowAnnotation('flag valency subjectivity tree'.split())
 noun_template_annotation = RowAnnotation('noun template'.split())
 
-conjugation_population = NestedLookupPopulation(conjugation_template_lookups, KeyEvaluation('inflection'))
-declension_population  = NestedLookupPopulation(declension_template_lookups, KeyEvaluation('inflection'))
-emoji_noun_population = FlatLookupPopulation(DictLookup('emoji noun', DictTupleIndexing(['noun','number'])), KeyEvaluation('inflection'))
-emoji_noun_adjective_population = FlatLookupPopulation(DictLookup('emoji noun adjective', DictTupleIndexing(['adjective','noun'])), KeyEvaluation('inflection'))
-emoji_noun_verb_population = FlatLookupPopulation(DictLookup('emoji noun verb', DictTupleIndexing('noun verb'.split())), KeyEvaluation('emoji'))
-emoji_verb_population = FlatLookupPopulation(DictLookup('emoji verb', DictTupleIndexing('template verb'.split())), KeyEvaluation('emoji'))
-emoji_noun_declensions_population = FlatLookupPopulation(DictLookup('declension-templates', DictTupleIndexing('valency subjectivity motion role'.split())), KeyEvaluation('inflection'))
-mood_population = FlatLookupPopulation(DictLookup('mood', DictTupleIndexing('mood column'.split())), KeyEvaluation('inflection'))
-noun_template_population = DictSetPopulation(DictSet('noun-template', DictTupleIndexing('noun template'.split()), set()))
-template_verb_population = DictSetPopulation(DictSet('template-verb', DictTupleIndexing('template role subjectivity valency verb'.split()), set()))
-template_tree_population = FlatLookupPopulation(DictLookup('template-tree', DictTupleIndexing('valency subjectivity'.split())), KeyEvaluation('tree'))
+# populated lookups are stored in ".cache" so that later runs need not repopulate them
+lookup_caching = SnapshotCaching('.cache')
+
+conjugation_population = NestedLookupPopulation(conjugation_template_lookups, KeyEvaluation('inflection'), caching=lookup_caching)
+declension_population  = NestedLookupPopulation(declension_template_lookups, KeyEvaluation('inflection'), caching=lookup_caching)
+emoji_noun_population = FlatLookupPopulation(DictLookup('emoji noun', DictTupleIndexing(['noun','number'])), KeyEvaluation('inflection'), caching=lookup_caching)
+emoji_noun_adjective_population = FlatLookupPopulation(DictLookup('emoji noun adjective', DictTupleIndexing(['adjective','noun'])), KeyEvaluation('inflection'), caching=lookup_caching)
+emoji_noun_verb_population = FlatLookupPopulation(DictLookup('emoji noun verb', DictTupleIndexing('noun verb'.split())), KeyEvaluation('emoji'), caching=lookup_caching)
+emoji_verb_population = FlatLookupPopulation(DictLookup('emoji verb', DictTupleIndexing('template verb'.split())), KeyEvaluation('emoji'), caching=lookup_caching)
+emoji_noun_declensions_population = FlatLookupPopulation(DictLookup('declension-templates', DictTupleIndexing('valency subjectivity motion role'.split())), KeyEvaluation('inflection'), caching=lookup_caching)
+mood_population = FlatLookupPopulation(DictLookup('mood', DictTupleIndexing('mood column'.split())), KeyEvaluation('inflection'), caching=lookup_caching)
+noun_template_population = DictSetPopulation(DictSet('noun-template', DictTupleIndexing('noun template'.split()), set()), caching=lookup_caching)
+template_verb_population = DictSetPopulation(DictSet('template-verb', DictTupleIndexing('template role subjectivity valency verb'.split()), set()), caching=lookup_caching)
+template_tree_population = FlatLookupPopulation(DictLookup('template-tree', DictTupleIndexing('valency subjectivity'.split())), KeyEvaluation('tree'), caching=lookup_caching)
 template_dummy_population = FlatLookupPopulation(
     DictLookup('template-dummy', DictTupleIndexing('subjectivity verb voice valency'.split())), 
-    MultiKeyEvaluation('dummy-motion dummy-role dummy-subjectivity dummy-definiteness dummy-noun'.split()) 
+    MultiKeyEvaluation('dummy-motion dummy-role dummy-subjectivity dummy-definiteness dummy-noun'.split()),
+    caching=lookup_caching,
 )
 
 nonfinite_traversal = DictTupleIndexing(['tense', 'aspect', 'mood', 'voice'])
@@ -468,32 +473,40 @@ tsv_parsing = SeparatedValuesFileParsing()
 
 template_verb_whitelist = (
     template_verb_population.index(
-        template_verb_annotation.annotate(
-            tsv_parsing.rows('data/inflection/template-verbs.tsv')))
+        AnnotatedFiles(tsv_parsing, [
+            (template_verb_annotation, 'data/inflection/template-verbs.tsv')]))
 )
 
 template_dummy_lookup = (
     template_dummy_population.index(
-        template_dummy_annotation.annotate(
-            tsv_parsing.rows('data/inflection/template-dummies.tsv')))
+        AnnotatedFiles(tsv_parsing, [
+            (template_dummy_annotation, 'data/inflection/template-dummies.tsv')]))
 )
 
 noun_template_whitelist = (
     noun_template_population.index(
-        noun_template_annotation.annotate(
-            tsv_parsing.rows('data/inflection/noun-template.tsv')))
+        AnnotatedFiles(tsv_parsing, [
+            (noun_template_annotation, 'data/inflection/noun-template.tsv')]))
 )
 
 template_tree_lookup = (
     template_tree_population.index(
-        template_tree_annotation.annotate(
-            tsv_parsing.rows('data/inflection/template-trees.tsv')))
+        AnnotatedFiles(tsv_parsing, [
+            (template_tree_annotation, 'data/inflection/template-trees.tsv')]))
 )
 
 case_usage_dict = {
     **case_episemaxis_to_episemes,
     'script':tagaxis_to_tags['script'],
 }
+# named functions are used here in place of lambdas so that populated usage lookups can be pickled by `lookup_caching`
+def case_usage_columns(dictkey):
+    return DictLookup('grammatical-case-columns', DictKeyIndexing('column'))
+def mood_usage_columns(dictkey):
+    return DictLookup('grammatical-mood-columns', DictKeyIndexing('column'))
+def aspect_usage_columns(dictkey):
+    return DictLookup('grammatical-aspect-columns', DictKeyIndexing('column'))
+
 case_usage_annotation = CellAnnotation('case', 
     dict_bundle_to_map(case_usage_dict), {0:'column'}, {}, {})
 case_usage_population = NestedLookupPopulation(
@@ -502,9 +515,9 @@ case_usage_population = NestedLookupPopulation(
             'valency subjectivity motion role script'.split(),
             case_usage_dict,
         ),
-        lambda dictkey: DictLookup('grammatical-case-columns',
-            DictKeyIndexing('column'))),
-    KeyEvaluation('case')
+        case_usage_columns),
+    KeyEvaluation('case'),
+    caching=lookup_caching,
 )
 
 mood_usage_annotation = CellAnnotation('mood', dict_bundle_to_map(mood_episemaxis_to_episemes), {0:'column'}, {}, {}, debug=True)
@@ -514,9 +527,9 @@ mood_usage_population = NestedLookupPopulation(
             [key for key in mood_episemaxis_to_episemes.keys()],
             mood_episemaxis_to_episemes,
         ),
-        lambda dictkey: DictLookup('grammatical-mood-columns',
-            DictKeyIndexing('column'))),
-    KeyEvaluation('mood')
+        mood_usage_columns),
+    KeyEvaluation('mood'),
+    caching=lookup_caching,
 )
 
 aspect_usage_annotation = CellAnnotation('aspect', dict_bundle_to_map(aspect_episemaxis_to_episemes), {0:'column'}, {}, {})
@@ -526,9 +539,9 @@ aspect_usage_population = NestedLookupPopulation(
             [key for key in aspect_episemaxis_to_episemes.keys()],
             aspect_episemaxis_to_episemes,
         ),
-        lambda dictkey: DictLookup('grammatical-aspect-columns',
-            DictKeyIndexing('column'))),
+        aspect_usage_columns),
     KeyEvaluation('aspect'),
+    caching=lookup_caching,
     # debug=True
 )
 
@@ -548,23 +561,23 @@ LanguageSpecificTextDemonstration = TextDemonstration(
 LanguageSpecificEmojiDemonstration = EmojiDemonstration(
     nouns_to_depictions,
     emoji_noun_adjective_population.index(
-        emoji_noun_adjective_annotation.annotate(
-            tsv_parsing.rows('data/inflection/emoji/noun-adjectives.tsv'))),
+        AnnotatedFiles(tsv_parsing, [
+            (emoji_noun_adjective_annotation, 'data/inflection/emoji/noun-adjectives.tsv')])),
     emoji_noun_verb_population.index(
-        emoji_noun_verb_annotation.annotate(
-            tsv_parsing.rows('data/inflection/emoji/noun-verbs.tsv'))),
+        AnnotatedFiles(tsv_parsing, [
+            (emoji_noun_verb_annotation, 'data/inflection/emoji/noun-verbs.tsv')])),
     emoji_noun_declensions_population.index(
-        emoji_noun_declensions_annotation.annotate(
-            tsv_parsing.rows('data/inflection/emoji/noun-declensions.tsv'))),
+        AnnotatedFiles(tsv_parsing, [
+            (emoji_noun_declensions_annotation, 'data/inflection/emoji/noun-declensions.tsv')])),
     emoji_noun_population.index(
-        common_noun_annotation.annotate(
-            tsv_parsing.rows('data/inflection/emoji/nouns.tsv'))),
+        AnnotatedFiles(tsv_parsing, [
+            (common_noun_annotation, 'data/inflection/emoji/nouns.tsv')])),
     emoji_verb_population.index(
-        emoji_verb_annotation.annotate(
-            tsv_parsing.rows('data/inflection/emoji/verbs.tsv'))),
+        AnnotatedFiles(tsv_parsing, [
+            (emoji_verb_annotation, 'data/inflection/emoji/verbs.tsv')])),
     mood_population.index(
-        mood_annotation.annotate(
-            tsv_parsing.rows('data/inflection/emoji/moods.tsv'))),
+        AnnotatedFiles(tsv_parsing, [
+            (mood_annotation, 'data/inflection/emoji/moods.tsv')])),
     TermLabelEditing(),
     TermLabelFiltering(),
     EmojiInflectionShorthand(
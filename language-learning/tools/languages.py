@@ -1,6 +1,86 @@
+import functools
 from collections import defaultdict
 
 from .treemaps import ListTreeMap, RuleTreeMap
+from .indexing import TagContext
+
+# tags that are inserted into the memory of a tree wherever an opcode is encountered
+opcode_tags = {
+    'cloze':       {'show-clozure': True},
+    'parentheses': {'show-parentheses': True},
+    'implicit':    {'show-brackets': True},
+    'informal':    {'formality': 'informal'},
+    'indicative':  {'mood': 'indicative'},
+    'present':     {'tense': 'present'},
+    'perfective':  {'aspect': 'perfective'},
+    'imperfective':{'aspect': 'imperfective'},
+    'progressive': {'aspect': 'imperfective'},
+    'simple':      {'aspect': 'simple'},
+    'finished':    {'progress': 'finished'},
+    'unfinished':  {'progress': 'unfinished'},
+    'atelic':      {'progress': 'atelic'},
+    'active':      {'voice': 'active'},
+    'passive':     {'voice': 'passive'},
+    'middle':      {'voice': 'middle'},
+    'infinitive':  {'verb-form': 'infinitive'},
+    'finite':      {'verb-form': 'finite'},
+    'participle':  {'verb-form': 'participle'},
+    'common':      {'noun-form': 'common'},
+    'personal':    {'noun-form': 'personal'},
+    'agent':       {'role':'agent'},
+    'force':       {'role':'force'},
+    'patient':     {'role':'patient'},
+    'theme':       {'role':'theme'},
+    'experiencer': {'role':'experiencer'},
+    'stimulus':    {'role':'stimulus'},
+    'predicate':   {'role':'predicate'},
+    'predicand':   {'role':'predicand'},
+    'subject':        {'subjectivity':'subject'},
+    'direct-object':  {'subjectivity':'direct-object'},
+    'indirect-object':{'subjectivity':'indirect-object'},
+    'adverbial':  {'subjectivity':'adverbial'},
+    'adnominal':  {'subjectivity':'adnominal'},
+    'addressee':      {'subjectivity':'addressee'},
+    'common-possessive':   {'noun-form': 'common-possessive'},
+    'personal-possessive': {'noun-form': 'personal-possessive'},
+    'definite': {'definiteness': 'definite'},
+    'indefinite': {'definiteness': 'indefinite'},
+    'adefinite': {'definiteness': 'adefinite'},
+}
+
+class LanguagePipeline:
+    """
+    A `LanguagePipeline` is the sequence of tree maps that is used by `Language.map()`.
+    Building the tree maps is costly in comparison to walking a tree, 
+    so a `LanguagePipeline` is built once for a given script, set of seme labels, and set of substitution opcodes,
+    then reused for every tree that shares them.
+    Semes and substitutions vary with each tree that is mapped, 
+    so the tree maps of a `LanguagePipeline` refer to them indirectly by key through `bindings`,
+    which are assigned only for the duration of a call to `map()`.
+    """
+    def __init__(self, context):
+        self.context = context
+        self.steps = []
+        self.bindings = {}
+    def bound(self, key):
+        def _map(machine, tree, memory):
+            return self.bindings[key](machine, tree, memory)
+        return _map
+    def map(self, tree, bindings, debug=False):
+        previous = self.bindings
+        self.bindings = bindings
+        try:
+            if debug:
+                print(f'input:')
+                print(tree)
+            for i, step in enumerate(self.steps):
+                tree = step.map(tree, TagContext(None, self.context))
+                if debug:
+                    print(f'step {i} results:')
+                    print(tree)
+        finally:
+            self.bindings = previous
+        return tree
 
 class Language:
     """
@@ -30,6 +110,7 @@ class Language:
             rule_tools,
             formatting,
             substitutions=[],
+            pipeline_cache_size=256,
             debug=False):
         self.semantics = semantics
         self.grammar = grammar
@@ -40,56 +121,26 @@ class Language:
         self.formatting = formatting
         self.substitutions = substitutions
         self.debug = debug
-    def map(self, tree, script, semes={}, substitutions=[], debug=False):
-        opcode_tags = {
-            'cloze':       {'show-clozure': True},
-            'parentheses': {'show-parentheses': True},
-            'implicit':    {'show-brackets': True},
-            'informal':    {'formality': 'informal'},
-            'indicative':  {'mood': 'indicative'},
-            'present':     {'tense': 'present'},
-            'perfective':  {'aspect': 'perfective'},
-            'imperfective':{'aspect': 'imperfective'},
-            'progressive': {'aspect': 'imperfective'},
-            'simple':      {'aspect': 'simple'},
-            'finished':    {'progress': 'finished'},
-            'unfinished':  {'progress': 'unfinished'},
-            'atelic':      {'progress': 'atelic'},
-            'active':      {'voice': 'active'},
-            'passive':     {'voice': 'passive'},
-            'middle':      {'voice': 'middle'},
-            'infinitive':  {'verb-form': 'infinitive'},
-            'finite':      {'verb-form': 'finite'},
-            'participle':  {'verb-form': 'participle'},
-            'common':      {'noun-form': 'common'},
-            'personal':    {'noun-form': 'personal'},
-            'agent':       {'role':'agent'},
-            'force':       {'role':'force'},
-            'patient':     {'role':'patient'},
-            'theme':       {'role':'theme'},
-            'experiencer': {'role':'experiencer'},
-            'stimulus':    {'role':'stimulus'},
-            'predicate':   {'role':'predicate'},
-            'predicand':   {'role':'predicand'},
-            'subject':        {'subjectivity':'subject'},
-            'direct-object':  {'subjectivity':'direct-object'},
-            'indirect-object':{'subjectivity':'indirect-object'},
-            'adverbial':  {'subjectivity':'adverbial'},
-            'adnominal':  {'subjectivity':'adnominal'},
-            'addressee':      {'subjectivity':'addressee'},
-            'common-possessive':   {'noun-form': 'common-possessive'},
-            'personal-possessive': {'noun-form': 'personal-possessive'},
-            'definite': {'definiteness': 'definite'},
-            'indefinite': {'definiteness': 'indefinite'},
-            'adefinite': {'definiteness': 'adefinite'},
-            **semes
+        self.pipeline = functools.lru_cache(maxsize=pipeline_cache_size)(self.compile)
+    def compile(self, script, seme_labels, substitution_opcodes):
+        '''
+        Returns a `LanguagePipeline` for the given `script` that maps trees using semes labeled by `seme_labels`
+        and substitutions whose opcodes are given by `substitution_opcodes`, a list with one tuple of opcodes per substitution.
+        '''
+        debug = self.debug
+        pipeline = LanguagePipeline({**self.tags, 'script': script})
+        tag_insertion = {
+            **{opcode:self.semantics.tag({**value,'script':script}, remove=False) for (opcode, value) in opcode_tags.items()},
+            **{label:pipeline.bound(('insertion', label)) for label in seme_labels},
+        }
+        tag_removal = {
+            **{opcode:self.semantics.tag({**value,'script':script}, remove=True, debug=debug) for (opcode, value) in opcode_tags.items()},
+            **{label:pipeline.bound(('removal', label)) for label in seme_labels},
         }
-        debug =  self.debug
-        tag_insertion = {opcode:self.semantics.tag({**value,'script':script}, remove=False) for (opcode, value) in opcode_tags.items()}
-        tag_removal   = {opcode:self.semantics.tag({**value,'script':script}, remove=True, debug=debug)  for (opcode, value) in opcode_tags.items()}
         rules = 'clause det adj np vp n v adposition'
-        pipeline = [
-            *[ListTreeMap({**tag_insertion, **substitution}) for substitution in substitutions],      # deck specific substitutions
+        pipeline.steps = [
+            *[ListTreeMap({**tag_insertion, **{opcode:pipeline.bound((i, opcode)) for opcode in opcodes}}) 
+              for (i, opcodes) in enumerate(substitution_opcodes)],                                   # deck specific substitutions
             *[ListTreeMap({**tag_insertion, **substitution}) for substitution in self.substitutions], # language specific substitutions
             ListTreeMap({
                 **tag_insertion, 
@@ -115,12 +166,17 @@ class Language:
                 **{tag:self.formatting.default for tag in rules.split()},
             }),
         ]
-        if debug:
-            print(f'input:')
-            print(tree)
-        for i, step in enumerate(pipeline):
-            tree = step.map(tree, {**self.tags, 'script': script})
-            if debug:
-                print(f'step {i} results:')
-                print(tree)
-        return tree
+        return pipeline
+    def map(self, tree, script, semes={}, substitutions=[], debug=False):
+        debug =  self.debug
+        pipeline = self.pipeline(script, 
+            tuple(semes.keys()), 
+            tuple(tuple(substitution.keys()) for substitution in substitutions))
+        bindings = {
+            **{('insertion', label):self.semantics.tag(TagContext(value, {'script':script}), remove=False) for (label, value) in semes.items()},
+            **{('removal', label):self.semantics.tag(TagContext(value, {'script':script}), remove=True, debug=debug) for (label, value) in semes.items()},
+            **{(i, opcode):operation 
+               for (i, substitution) in enumerate(substitutions) 
+               for (opcode, operation) in substitution.items()},
+        }
+        return pipeline.map(tree, bindings, debug)
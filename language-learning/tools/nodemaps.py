@@ -1,6 +1,7 @@
 import re
 
 from .nodes import Rule
+from .indexing import TagContext
 
 """
 "nodes.py" contains functionality used to manipulate individual nodes in a syntax tree
@@ -51,19 +52,18 @@ class ListSemantics:
             ('aspect', self.aspect_usage),
             # ('mood', self.mood_usage),
         ]
-        return {
-            **tags, 
-            **{tagaxis: usage[tags][tagaxis] 
-               for (tagaxis, usage) in tagaxis_usages
-               # if tagaxis not in tags and tagaxis in usage[tags]
-               if tags in usage and tagaxis in usage[tags]
-            }
+        augmentation = {
+            tagaxis: usage[tags][tagaxis] 
+            for (tagaxis, usage) in tagaxis_usages
+            # if tagaxis not in tags and tagaxis in usage[tags]
+            if tags in usage and tagaxis in usage[tags]
         }
+        return TagContext(tags, augmentation) if augmentation else tags
     def tag(self, modifications, remove=False, debug=False):
         def _map(machine, tree, memory):
             # if self.debug and 'verb-form' in modifications:
             #     print(modifications['verb-form'])
-            arguments = machine.map(tree[1:], self.augment({**memory, **modifications}))
+            arguments = machine.map(tree[1:], self.augment(TagContext(memory, modifications)))
             return arguments if remove else [tree[0], *arguments]
         return _map
     def stock_adposition(self, treemap, content, tags):
@@ -95,35 +95,26 @@ class ListGrammar:
     def decline(self, treemap, content, tags):
         if 'case' not in tags:
             return self.omit_code
-        sememe = {
-            **tags, 
-            **({'noun':content[1]} if len(content)>1 else {}), 
-        }
+        sememe = TagContext(tags, {'noun':content[1]}) if len(content)>1 else tags
         return [content[0], 
             None if sememe not in self.declension_lookups
             else self.inflection_formatting.format(self.declension_lookups[sememe], tags)]
     def agree(self, treemap, content, tags):
         if 'case' not in tags:
             return self.omit_code
-        sememe = {
-            **tags, 
-            **({'noun':content[1]} if len(content)>1 else {}), 
-        }
+        sememe = TagContext(tags, {'noun':content[1]}) if len(content)>1 else tags
         return [content[0], 
             None if sememe not in self.agreement_lookups
             else self.inflection_formatting.format(self.agreement_lookups[sememe], tags)]
     def conjugate(self, treemap, content, tags):
         if any([tagaxis not in tags for tagaxis in 'aspect mood'.split()]):
             return self.omit_code
-        sememe = {
-            **tags, 
-            'verb':content[1],
-        }
+        sememe = TagContext(tags, {'verb':content[1]})
         return [content[0], 
             None if sememe not in self.conjugation_lookups
             else self.inflection_formatting.format(self.conjugation_lookups[sememe], tags)]
     def stock_modifier(self, treemap, content, tags):
-        alttag = {**tags, 'verb-form':'argument'}
+        alttag = TagContext(tags, {'verb-form':'argument'})
         return [content[0], 
             None if alttag not in self.conjugation_lookups
             else self.conjugation_lookups[alttag]]
@@ -374,7 +365,7 @@ class ListTools:
         pass
     def tag(self, modifications, remove=False):
         def _map(machine, tree, memory):
-            arguments = machine.map(tree[1:], {**memory, **modifications})
+            arguments = machine.map(tree[1:], TagContext(memory, modifications))
             return arguments if remove else [tree[0], *arguments]
         return _map
     def rule(self):
@@ -1,4 +1,7 @@
+import os
 import re
+import mmap
+import functools
 
 from tools.indexing import DictTupleIndexing
 from tools.dictstores import DictSpace, DictList, DictSet, DictLookup
@@ -6,20 +9,28 @@ from tools.dictstores import DictSpace, DictList, DictSet, DictLookup
 class SeparatedValuesFileParsing:
     '''
     Parses files composed of rows of values that are separated by `delimeters`.
+    `iter_rows()` reads a file through a memory map and yields rows one at a time,
+    so that large files never have to be held in memory as a whole.
+    Files are expected to be encoded in `encoding`, with lines ending in either "\\n" or "\\r\\n".
     '''
-    def __init__(self, comment='#', delimeter='\t', padding=' \t\r\n', quotation='"'):
+    def __init__(self, comment='#', delimeter='\t', padding=' \t\r\n', quotation='"', encoding='utf-8'):
         self.comment = comment
         self.delimeter = delimeter
         self.padding = padding
+        self.encoding = encoding
+    def iter_rows(self, filename):
+        with open(filename, 'rb') as file:
+            if os.fstat(file.fileno()).st_size < 1:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                for line in iter(buffer.readline, b''):
+                    line = line.decode(self.encoding)
+                    if self.comment is not None:
+                        line = line.split(self.comment)[0]
+                    if len(line.strip()) >= 1:
+                        yield [column.strip(self.padding) for column in line.split(self.delimeter)]
     def rows(self, filename):
-        rows_ = []
-        with open(filename) as file:
-            for line in file.readlines():
-                if self.comment is not None:
-                    line = line.split(self.comment)[0]
-                if len(line.strip()) >= 1:
-                    rows_.append([column.strip(self.padding) for column in line.split(self.delimeter)])
-        return rows_
+        return list(self.iter_rows(filename))
 
 
 class TokenParsing:
@@ -213,28 +224,45 @@ class ListParsing:
     To guarantee security, we strongly discourage any manipulation of input `string`s
     if there is a chance that the parser will handle public facing input.
     Modification of `LispInterpreter` and its usages should not proceed until the above sentence is understood.
+    The same handful of strings are typically parsed many times, 
+    so parses are cached for up to `cache_size` strings as trees of immutable tuples.
+    Each call to `parse()` returns a fresh tree of lists built from the cached tuples,
+    so that callers may modify the tree without corrupting the cache.
     '''
-    def __init__(self, L='[', R=']'):
+    def __init__(self, L='[', R=']', cache_size=1024):
         self.L = L
         self.R = R
+        self.token_regex = re.compile('[()]|[^() ]+')
+        self.frozen = functools.lru_cache(maxsize=cache_size)(self.freeze)
     def parse(self, string):
+        return self.thaw(self.frozen(string))
+    def freeze(self, string):
+        '''
+        Returns a tree of tuples that represents the given `string`.
+        '''
         open_count = 0
         stack = [[]]
         # standardize string so that it can be handled without regex escape codes
         standardized = string
         standardized = standardized.replace(self.L,'(')
         standardized = standardized.replace(self.R,')')
-        for match in re.finditer('[()]|[^() ]+', standardized):
+        for match in self.token_regex.finditer(standardized):
             token = match.group(0)
             if token == '(':
                 stack.append([])
             elif token == ')':
                 closed = stack.pop()
-                stack[-1].append(closed)
+                stack[-1].append(tuple(closed))
             elif len(token.strip()):
                 stack[-1].append(token)
         assert len(stack) == 1, f'start and end delimeter mismatch in string: {string}'
-        return stack[0]
+        return tuple(stack[0])
+    def thaw(self, frozen):
+        '''
+        Returns a tree of lists that is a copy of the given tree of tuples, `frozen`.
+        '''
+        return [self.thaw(element) if type(element) == tuple else element
+            for element in frozen]
 
 class LatexlikeParsing:
     '''
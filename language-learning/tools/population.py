@@ -1,5 +1,69 @@
+import os
 import copy
 
+from tools.dictstores import DictLookup, DefaultDictLookup, DictSet
+
+def clone(template):
+    '''
+    Returns a copy of a `template` store that can be populated without modifying the template.
+    Only the `content` of stores (and any lists, dicts, or sets within) are copied,
+    while indexings and other attributes are never modified after construction, so they are shared with the template.
+    '''
+    if type(template) in {DictLookup, DefaultDictLookup}:
+        copied = copy.copy(template)
+        copied.content = {key: clone(value) for (key, value) in template.content.items()}
+        return copied
+    elif type(template) == DictSet:
+        copied = copy.copy(template)
+        copied.content = set(template.content)
+        return copied
+    elif type(template) == list:
+        return [clone(value) for value in template]
+    elif type(template) == dict:
+        return {key: clone(value) for (key, value) in template.items()}
+    elif type(template) == set:
+        return set(template)
+    elif type(template) in {str, tuple, int, float, bool, type(None)}:
+        return template
+    else:
+        return copy.deepcopy(template)
+
+class AnnotatedFiles:
+    '''
+    `AnnotatedFiles` represents the annotations of tables that are stored in files,
+    given as a list of `(annotation, filename)` pairs, where each file is read using `parsing`.
+    Files are only parsed and annotated when iterated over,
+    so that populations can recognize tables that they have indexed on an earlier run by their `stamp()` alone.
+    '''
+    def __init__(self, parsing, annotation_filenames):
+        self.parsing = parsing
+        self.annotation_filenames = annotation_filenames
+    def stamp(self):
+        '''
+        Returns a list that identifies each file by its name, size, and time of modification, along with its annotation,
+        which changes whenever a file is edited or the manner in which it is parsed or annotated changes.
+        '''
+        stamps = []
+        for (annotation, filename) in self.annotation_filenames:
+            status = os.stat(filename)
+            stamps.append((annotation, filename, status.st_size, status.st_mtime_ns))
+        return [self.parsing, stamps]
+    def __iter__(self):
+        for (annotation, filename) in self.annotation_filenames:
+            yield from annotation.annotate(self.parsing.iter_rows(filename))
+
+def _cached_index(population, annotations):
+    '''
+    Returns `population.populate(annotations)`, 
+    loading the result from `population.caching` if it was populated from the same files on an earlier run.
+    Only `AnnotatedFiles` are cached, since their files can be identified without being parsed or annotated,
+    so a lookup that is loaded from `population.caching` never has to read its tables at all.
+    Any other annotations are populated on every run.
+    '''
+    if population.caching is None or not isinstance(annotations, AnnotatedFiles):
+        return population.populate(annotations)
+    return population.caching(lambda: population.populate(annotations), population, annotations.stamp())
+
 class FlatLookupPopulation:
     '''
     `FlatLookupIndexing` converts a list of annotations
@@ -8,13 +72,16 @@ class FlatLookupPopulation:
     The cells are indexed by their annotations according to the indexing behavior 
     within a given `template_lookup`.
     '''
-    def __init__(self, template_lookup, evaluation, debug=False):
+    def __init__(self, template_lookup, evaluation, debug=False, caching=None):
         self.template_lookup = template_lookup
         self.evaluation = evaluation
         self.debug = debug
+        self.caching = caching
     def index(self, annotations):
+        return _cached_index(self, annotations)
+    def populate(self, annotations):
         if self.debug: breakpoint()
-        lookup = copy.deepcopy(self.template_lookup)
+        lookup = clone(self.template_lookup)
         for annotation in annotations:
             lookup[annotation] = self.evaluation(annotation)
         return lookup
@@ -31,13 +98,16 @@ class NestedLookupPopulation:
     since inner nested lookups can each use separate indexing methods,
     so that their content is a strict function of the key and nothing else.
     '''
-    def __init__(self, template_lookups, evaluation, debug=False):
+    def __init__(self, template_lookups, evaluation, debug=False, caching=None):
         self.template_lookups = template_lookups
         self.evaluation = evaluation
         self.debug = debug
+        self.caching = caching
     def index(self, annotations):
+        return _cached_index(self, annotations)
+    def populate(self, annotations):
         if self.debug: breakpoint()
-        lookups = copy.deepcopy(self.template_lookups)
+        lookups = clone(self.template_lookups)
         for annotation in annotations:
             for tuplekey in lookups.indexing.tuplekeys(annotation):
                 lookup = lookups[tuplekey]
@@ -53,13 +123,16 @@ class ListLookupPopulation:
     The cells are indexed by their annotations according to the indexing behavior 
     within a given `template_lookup`.
     '''
-    def __init__(self, template_lookup, evaluation, debug=False):
+    def __init__(self, template_lookup, evaluation, debug=False, caching=None):
         self.template_lookup = template_lookup
         self.evaluation = evaluation
         self.debug = debug
+        self.caching = caching
     def index(self, annotations):
+        return _cached_index(self, annotations)
+    def populate(self, annotations):
         if self.debug: breakpoint()
-        lookup = copy.deepcopy(self.template_lookup)
+        lookup = clone(self.template_lookup)
         for annotation in annotations:
             for tuplekey in lookup.indexing.tuplekeys(annotation):
                 lookup[tuplekey].append(self.evaluation(annotation))
@@ -73,12 +146,15 @@ class DictSetPopulation:
     The cells are indexed by their annotations according to the indexing behavior 
     within a given `template_set`.
     '''
-    def __init__(self, template_set, debug=False):
+    def __init__(self, template_set, debug=False, caching=None):
         self.template_set = template_set
         self.debug = debug
+        self.caching = caching
     def index(self, annotations):
+        return _cached_index(self, annotations)
+    def populate(self, annotations):
         if self.debug: breakpoint()
-        dictset = copy.deepcopy(self.template_set)
+        dictset = clone(self.template_set)
         for annotation in annotations:
             for tuplekey in dictset.indexing.tuplekeys(annotation):
                 dictset.content.add(tuplekey)
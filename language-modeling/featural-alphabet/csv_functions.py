@@ -1,42 +1,14 @@
-
+# csv_functions is maintained in language-learning/data/vocabulary/csv_functions.py,
+# this file only makes it importable by the scripts that are run from this directory
+import os
+import importlib.util
+
+_filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'language-learning', 'data', 'vocabulary', 'csv_functions.py')
+_spec = importlib.util.spec_from_file_location('shared_csv_functions', _filename)
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+globals().update({name: value for (name, value) in vars(_module).items() if not name.startswith('__')})
+
+# retained from the earlier interface of this file, which returned only the first two columns of each row
 def csv_tuples(filename, stripped=' \t\r\n'):
-	result = []
-	with open(filename) as file:
-		for line in file.readlines():
-			if not line.strip().startswith('#') and not len(line.strip()) < 1:
-				cells = [column.strip(stripped) for column in line.split('\t') ]
-				if len(cells) > 1:
-					result.append((cells[0], cells[1]))
-	return result
-
-def csv_dict(filename, columns, keys):
-	result = {}
-	with open(filename) as file:
-		for line in file.readlines():
-			if not line.strip().startswith('#') and not len(line.strip()) < 1:
-				cells = [column.strip(' \t\r\n*?') for column in line.split('\t') ]
-				row = {columns[i]:cells[i] for i, cell in enumerate(cells) if i < len(columns)}
-				value = {column:row[column] for column in row if column not in keys}
-				result[tuple(row[key] for key in keys)] = value if len(value) > 1 else list(value.values())[0]
-	return result
-
-def dict_function(dict_, sentinel='', fallback=None):
-	def result(*keys):
-		keys_tuple = tuple(keys)
-		return (
-			dict_[keys_tuple] if keys_tuple in dict_ else 
-			fallback(*keys) if fallback else 
-			sentinel
-		)
-	return result
-
-def curried_dict_function(dict_, sentinel='', fallback=None):
-	def result(*keys):
-		keys_tuple = tuple(keys)
-		result = lambda attribute: dict_[keys_tuple][attribute]
-		return (
-			result if keys_tuple in dict_ else 
-			fallback if fallback else 
-			lambda *x:sentinel
-		)
-	return result
+	return [(cells[0], cells[1]) for cells in iter_tuples_from_csv(filename, padding=stripped) if len(cells) > 1]
@@ -100,8 +100,8 @@ It's not likely we'll see much of his kind anymore, eh?"
 
 ipa_text_tuples = csv_functions.tuples_from_csv('../english/pronunciation/ipa_narrow_us_pronunciation_to_word.tsv')
 ipa_text_tuples_proscription = csv_functions.tuples_from_csv('../english/pronunciation/ipa_narrow_us_pronunciation_to_word_prescriptions.tsv')
-text_to_ipa_lookup = csv_functions.setdict_from_tuples(ipa_text_tuples, ['pronunciation','word'], ['word'])
-text_to_ipa_lookup.update(csv_functions.setdict_from_tuples(ipa_text_tuples_proscription, ['pronunciation','word'], ['word']))
+text_to_ipa_lookup = csv_functions.setdict_from_tuples(ipa_text_tuples, ['pronunciation','word'], ['word'], complete_only=True)
+text_to_ipa_lookup.update(csv_functions.setdict_from_tuples(ipa_text_tuples_proscription, ['pronunciation','word'], ['word'], complete_only=True))
 
 ipa_inflection = EnglishIpaInflection()
 text_inflection = EnglishTextInflection()
@@ -11,13 +11,17 @@ def roots(etymology_tags):
                 elif type_ == 'suffix':
                     yield word, layer, part1
             
-for word, layer, root in chain_compose(
-        raw, pages, 
-        header2('English'),
-        # preheader('Etymology\\s*\\d*'), 
-        # bulleted_list_items, 
-        tags,
-        roots
-    )(1e9):
-    print(f'{word.lower()}\t{root}')
-    # print(f'{word.upper():<15} {root}')
+def lines(entries):
+    for word, layer, root in chain_compose(
+            header2('English'),
+            # preheader('Etymology\\s*\\d*'), 
+            # bulleted_list_items, 
+            tags,
+            roots
+        )(entries):
+        yield f'{word.lower()}\t{root}'
+        # yield f'{word.upper():<15} {root}'
+
+if __name__ == '__main__':
+    for line in chain_compose(raw, pages, lines)(1e9):
+        print(line)
@@ -8,18 +8,22 @@ def inflections(plural_tags):
             if language == 'en' and type_ == 'inflection of':
                 yield word, layer, [verb, person, plurality, *args]
 
-for word, layer, tags in chain_compose( 
-        raw, pages, 
-        header2('English'),
-        anyheader('Verb'), 
-        # preheader, 
-        bulleted_list_items, 
-        must_not_include_any_of_annotations(*ignored_annotations), 
-        must_not_include_abbreviations,
-        tags,
-        inflections,
-    )(1e9):
-    print(f'{word}\t{"|".join(tags)}')
-    # print(f'{word.upper():<15} {tags}')
+def lines(entries):
+    for word, layer, inflection_tags in chain_compose( 
+            header2('English'),
+            anyheader('Verb'), 
+            # preheader, 
+            bulleted_list_items, 
+            must_not_include_any_of_annotations(*ignored_annotations), 
+            must_not_include_abbreviations,
+            tags,
+            inflections,
+        )(entries):
+        yield f'{word}\t{"|".join(inflection_tags)}'
+        # yield f'{word.upper():<15} {inflection_tags}'
+
+if __name__ == '__main__':
+    for line in chain_compose(raw, pages, lines)(1e9):
+        print(line)
 
 
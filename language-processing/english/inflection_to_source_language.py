@@ -8,13 +8,17 @@ def source_languages(etymology_tags):
             if language == 'en' and type_ == 'inh':
                 yield word, layer, source
 
-for word, layer, language_tag in chain_compose(
-        raw, pages, 
-        header2('English'),
-        anyheader('Etymology\\s*\\d*'), 
-        # bulleted_list_items, 
-        # first_tag,
-        source_languages
-    )(1e9):
-    print(f'{word.lower()}\t{language_tag}')
-    # print(f'{word.upper():<15} {language_tag}')
+def lines(entries):
+    for word, layer, language_tag in chain_compose(
+            header2('English'),
+            anyheader('Etymology\\s*\\d*'), 
+            # bulleted_list_items, 
+            # first_tag,
+            source_languages
+        )(entries):
+        yield f'{word.lower()}\t{language_tag}'
+        # yield f'{word.upper():<15} {language_tag}'
+
+if __name__ == '__main__':
+    for line in chain_compose(raw, pages, lines)(1e9):
+        print(line)
@@ -1,6 +1,14 @@
+import os
 import re
+import bz2
+import html
+import mmap
+import queue
 import functools
 import itertools
+import threading
+import collections
+import multiprocessing
 
 ################################ ITERATION TOOLS ###############################
 def compose(f, g): 
@@ -33,26 +41,226 @@ def try_fallbacks(*chains):
     return try_with_fallback_
 
 ################################### pages ####################################
-def raw(max_line_count, filename='enwiktionary-latest-pages-articles.xml'):
-    with open(filename) as wiktionary:
-        line_id = 0
-        entry = ''
-        for line in wiktionary:
-            if line_id > max_line_count:
-                break
-            if '<title>' in line:
-                yield entry
-                entry = ''
-                line_id += 1
-            entry += line
+# yields the (start, end) positions in bytes of every <page> element within `dump`, 
+# which may be bytes, or a memory-mapped file, in which case pages are found without ever reading the dump line by line
+def page_spans(dump):
+    start = dump.find(b'<page>')
+    while start >= 0:
+        end = dump.find(b'</page>', start)
+        if end < 0:
+            return
+        end += len(b'</page>')
+        yield start, end
+        start = dump.find(b'<page>', end)
+
+# returns the title and wikitext of a <page> element given as bytes, both unescaped, and without any of the surrounding xml
+def page_entry(page):
+    title_start = page.find(b'<title>') + len(b'<title>')
+    title = page[title_start:page.find(b'</title>', title_start)]
+    text_tag_start = page.find(b'<text')
+    text_start = page.find(b'>', text_tag_start) + 1
+    text_end = page.find(b'</text>', text_start)
+    if text_tag_start < 0 or text_end < 0 or page[text_start-2:text_start] == b'/>':
+        text = b''
+    else:
+        text = page[text_start:text_end]
+    return html.unescape(title.decode('utf-8')), html.unescape(text.decode('utf-8'))
+
+# yields the title and wikitext of up to `max_page_count` pages of the dump `filename`, as given by `page_entry`
+def raw(max_page_count, filename='enwiktionary-latest-pages-articles.xml'):
+    with open(filename, 'rb') as wiktionary:
+        if os.fstat(wiktionary.fileno()).st_size < 1:
+            return
+        with mmap.mmap(wiktionary.fileno(), 0, access=mmap.ACCESS_READ) as dump:
+            for start, end in itertools.islice(page_spans(dump), int(max_page_count)):
+                yield page_entry(dump[start:end])
 
 def pages(raw):
-    title_matcher = re.compile('<title>(.*)</title>', re.MULTILINE)
-    for entry in raw:
-        title_match = title_matcher.search(entry)
-        if title_match:
-            word = title_match.group(1)
-            yield word, 0, entry
+    for word, text in raw:
+        yield word, 0, text
+
+
+################################# PAGE INDEX ###################################
+# writes an index of every page in the dump `filename` to `index_filename`, as lines of "title\toffset\tlength",
+# where `offset` and `length` are the position in bytes of the page's <page> element within the dump.
+# lines are sorted, so that a title can be found by binary search without reading the index into memory
+def index_pages(filename, index_filename):
+    lines = []
+    with open(filename, 'rb') as wiktionary:
+        if os.fstat(wiktionary.fileno()).st_size > 0:
+            with mmap.mmap(wiktionary.fileno(), 0, access=mmap.ACCESS_READ) as dump:
+                for start, end in page_spans(dump):
+                    title_start = dump.find(b'<title>', start, end) + len(b'<title>')
+                    title_end = dump.find(b'</title>', title_start, end)
+                    title = html.unescape(dump[title_start:title_end].decode('utf-8'))
+                    lines.append(b'%s\t%d\t%d\n' % (title.encode('utf-8'), start, end-start))
+    lines.sort()
+    with open(index_filename+'.tmp', 'wb') as index:
+        index.writelines(lines)
+    os.replace(index_filename+'.tmp', index_filename)
+
+def indexed_page(index, title):
+    key = title.encode('utf-8')
+    low, high = 0, len(index)
+    while low < high:
+        line_start = index.rfind(b'\n', 0, (low+high)//2) + 1
+        line_end = index.find(b'\n', line_start)
+        line_title, offset, length = index[line_start:line_end].split(b'\t')
+        if line_title == key:
+            return int(offset), int(length)
+        elif line_title < key:
+            low = line_end + 1
+        else:
+            high = line_start
+    return None
+
+# yields the title and wikitext of the pages with the given `titles` in the manner of `raw`, 
+# in the order that they are given, skipping those that do not exist, 
+# by seeking directly to each page, rather than reading the dump from its start as `raw` does.
+# the index that this requires is built on first use, and rebuilt whenever the dump is newer than the index
+def pages_for(titles, filename='enwiktionary-latest-pages-articles.xml', index_filename=None):
+    index_filename = index_filename or filename+'.index.tsv'
+    if not os.path.exists(index_filename) or os.path.getmtime(index_filename) < os.path.getmtime(filename):
+        index_pages(filename, index_filename)
+    with open(index_filename, 'rb') as index_file, open(filename, 'rb') as wiktionary:
+        if os.fstat(index_file.fileno()).st_size < 1:
+            return
+        with mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ) as index, \
+             mmap.mmap(wiktionary.fileno(), 0, access=mmap.ACCESS_READ) as dump:
+            for title in titles:
+                location = indexed_page(index, title)
+                if location:
+                    offset, length = location
+                    yield page_entry(dump[offset:offset+length])
+
+
+################################ MULTISTREAM ###################################
+def _multistream_pages(filename, start, end):
+    with open(filename, 'rb') as wiktionary:
+        wiktionary.seek(start)
+        stream = bz2.decompress(wiktionary.read(end-start if end else -1))
+    return [page_entry(stream[page_start:page_end]) for page_start, page_end in page_spans(stream)]
+
+# yields the title and wikitext of up to `max_page_count` pages in the manner of `raw`,
+# reading them from the compressed "pages-articles-multistream.xml.bz2" dump, which never needs to be decompressed to disk.
+# the dump is a series of independent bz2 streams of about 100 pages each, whose offsets are listed by its companion index,
+# so streams are decompressed within `processes` worker processes, and yielded in the order of the dump
+def multistream(max_page_count, filename='enwiktionary-latest-pages-articles-multistream.xml.bz2', index_filename=None, 
+        processes=None, streams_in_flight=4):
+    index_filename = index_filename or filename.replace('multistream.xml.bz2', 'multistream-index.txt.bz2')
+    with bz2.open(index_filename, 'rt', encoding='utf-8') as index:
+        offsets = sorted(set(int(line.split(':', 1)[0]) for line in index))
+    streams = [(filename, start, end) for start, end in zip(offsets, offsets[1:]+[None])]
+    processes = processes or os.cpu_count() or 1
+    def first_pages(entry_lists):
+        return itertools.islice(itertools.chain.from_iterable(entry_lists), int(max_page_count))
+    if processes < 2:
+        yield from first_pages(itertools.starmap(_multistream_pages, streams))
+        return
+    with multiprocessing.get_context('fork').Pool(processes) as pool:
+        yield from first_pages(ordered_map(pool, _multistream_pages, streams, processes*streams_in_flight))
+
+
+################################### FAN OUT ####################################
+def batches(items, batch_size):
+    items = iter(items)
+    batch = list(itertools.islice(items, batch_size))
+    while batch:
+        yield batch
+        batch = list(itertools.islice(items, batch_size))
+
+# writes each of `lines(entries)` to `filename`, 
+# which keeps its previous contents unless every line is written
+def write_lines(filename, lines):
+    def write_lines_(entries):
+        try:
+            with open(filename+'.partial', 'w') as file:
+                for line in lines(entries):
+                    file.write(line+'\n')
+        except BaseException:
+            os.remove(filename+'.partial')
+            raise
+        os.replace(filename+'.partial', filename)
+    return write_lines_
+
+# passes every entry to each of `consumers` while reading `entries` only once, 
+# where a consumer is any function of an iterable of entries, such as a `chain_compose` pipeline ending in `write_lines`.
+# each consumer runs in its own thread, reading batches of entries from a bounded queue, 
+# so memory stays bounded however long the dump is, and a consumer that stops early never blocks the others.
+# the first batch is read before any thread starts, so that a source which forks worker processes, like `multistream`, 
+# does so while this is still the only thread
+def fan_out(entries, *consumers, batch_size=256, queue_size=16):
+    entry_batches = batches(entries, batch_size)
+    first_batches = list(itertools.islice(entry_batches, 1))
+    queues = [queue.Queue(queue_size) for consumer in consumers]
+    errors = []
+    def consume(consumer, queue_):
+        batches_ = iter(queue_.get, None)
+        try:
+            consumer(itertools.chain.from_iterable(batches_))
+        except BaseException as error:
+            errors.append(error)
+        for batch in batches_:
+            pass
+    threads = [threading.Thread(target=consume, args=(consumer, queue_)) 
+        for consumer, queue_ in zip(consumers, queues)]
+    for thread in threads:
+        thread.start()
+    try:
+        for batch in itertools.chain(first_batches, entry_batches):
+            for queue_ in queues:
+                queue_.put(batch)
+    finally:
+        for queue_ in queues:
+            queue_.put(None)
+        for thread in threads:
+            thread.join()
+    if errors:
+        raise errors[0]
+
+
+################################### PARALLEL ###################################
+_parallel_pipelines = {}
+_parallel_pipeline_ids = itertools.count()
+
+def _run_parallel_batch(pipeline_id, batch):
+    return list(_parallel_pipelines[pipeline_id](batch))
+
+# yields `function(*arguments)` for each of `arguments_list` in order, calculating them within `pool`,
+# while holding no more than `in_flight` results at once, unlike `pool.imap`, which reads all of `arguments_list` ahead
+def ordered_map(pool, function, arguments_list, in_flight):
+    pending = collections.deque()
+    for arguments in arguments_list:
+        pending.append(pool.apply_async(function, arguments))
+        if len(pending) >= in_flight:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+# runs the composition of `stages` on batches of entries within a pool of `processes` worker processes,
+# yielding results in the same order as `entries`, so that stages like `unique` that follow are deterministic.
+# stages must treat each entry independently, as every stage above does except `unique`, so those are left outside.
+# workers are forked, so stages may be closures or lambdas that could not otherwise be sent to another process.
+# forking while other threads run is unsafe, so stages run within the calling thread unless it is the main thread,
+# as when pipelines are consumed by the threads of `fan_out`, which already run alongside each other
+def parallel(*stages, processes=None, batch_size=64, batches_in_flight=4):
+    pipeline = chain_compose(*stages)
+    processes = processes or os.cpu_count() or 1
+    def parallel_(entries):
+        if processes < 2 or threading.current_thread() is not threading.main_thread():
+            yield from pipeline(entries)
+            return
+        pipeline_id = next(_parallel_pipeline_ids)
+        _parallel_pipelines[pipeline_id] = pipeline
+        try:
+            with multiprocessing.get_context('fork').Pool(processes) as pool:
+                for results in ordered_map(pool, _run_parallel_batch, 
+                        ((pipeline_id, batch) for batch in batches(entries, batch_size)), 
+                        processes*batches_in_flight):
+                    yield from results
+        finally:
+            del _parallel_pipelines[pipeline_id]
+    return parallel_
 
 
 def pairwise(elements):
@@ -62,14 +270,31 @@ def pairwise(elements):
         last = current
 
 ################################### SECTIONS ###################################
+# matches a header of any level, such as "===Noun===", where the level is given by the number of "=" on each side.
+# headers are found after a newline rather than at "^", since a pattern starting with a literal is searched for much faster
+header_pattern = re.compile('\\n(=+)([^=]+)\\1\\s*$', re.MULTILINE)
+
+# returns the headers of `text` as (level, title, start, end) tuples in the order they appear, 
+# where `start` and `end` are the positions of each header within `text`, scanning `text` only once for headers of every level.
+# results are cached, since the same text is usually passed to several selectors in turn, as by `try_fallbacks`
+@functools.lru_cache(maxsize=256)
+def headers(text):
+    return tuple([(len(match[1]), match[2], match.start(), match.end()-1) 
+        for match in header_pattern.finditer('\n'+text)])
+
+# yields (title, section) for each header of `level` within `text`, 
+# where a section runs from the end of its header to the start of the next header of the same level
+def sections(text, level):
+    headers_ = [header for header in headers(text) if header[0] == level]
+    for (_, title, start, end), next_ in zip(headers_, headers_[1:] + [None]):
+        yield title, text[end:next_[2]] if next_ else text[end:]
+
 def header2(language, allow_if_no_headers_exist=True):
+    language = language.strip().lower()
     def header2_(entries):
-        header_regex = re.compile('^'+'='*2+'([^=]+)'+'='*2+'\\s*$', re.MULTILINE)
         for word, layer, entry in entries:
-            matches = header_regex.finditer(entry)
-            for current, next_ in pairwise(list(itertools.chain(matches, [None]))):
-                section = entry[current.end():next_.start()] if next_ else entry[current.end():]
-                if language.strip().lower() == current.group(1).strip().lower():
+            for title, section in sections(entry, 2):
+                if language == title.strip().lower():
                     yield word, 2, section
     return header2_
 
@@ -78,62 +303,28 @@ def anyheader(title_regex_string):
     def anyheader_(entries):
         for word, layer, entry in entries:
             for next_layer in range(1,6):
-                header_regex = re.compile('^'+'='*next_layer+'([^=]+)'+'='*next_layer+'\\s*$', re.MULTILINE)
-                matches = header_regex.finditer(entry)
-                current = None
-                next_ = None
-                for match in pairwise(list(itertools.chain(matches, [None]))):
-                    current = next_
-                    next_ = match
-                    if current:
-                        header = current.group(1)
-                        if title_regex.fullmatch(header):
-                            section = entry[current.end():next_.start()] if next_ else entry[current.end():]
-                            yield word, next_layer, section
+                for title, section in sections(entry, next_layer):
+                    if title_regex.fullmatch(title):
+                        yield word, next_layer, section
     return anyheader_
 
 def subheader(entries):
     for word, layer, entry in entries:
-        next_layer = layer+1
-        header_regex = re.compile('^'+'='*next_layer+'([^=]+)'+'='*next_layer+'\\s*$', re.MULTILINE)
-        matches = header_regex.finditer(entry)
-        current = None
-        next_ = None
-        for match in itertools.chain(matches, [None]):
-            current = next_
-            next_ = match
-            if current:
-                section = entry[current.end():next_.start()] if next_ else entry[current.end():]
-                yield word, next_layer, section
+        for title, section in sections(entry, layer+1):
+            yield word, layer+1, section
 
 def preheader(entries):
     for word, layer, entry in entries:
-        next_layer = layer+1
-        header_regex = re.compile('^'+'='*next_layer+'([^=]+)'+'='*next_layer+'\\s*$', re.MULTILINE)
-        match = header_regex.search(entry)
-        if match:
-            yield word, next_layer, entry[:match.start()]
-        else:
-            yield word, next_layer, entry
-
+        starts = [start for level, title, start, end in headers(entry) if level == layer+1]
+        yield word, layer+1, entry[:starts[0]] if starts else entry
 def part_of_speech_header(part_of_speech_regex_string):
     part_of_speech_regex = re.compile(part_of_speech_regex_string, re.IGNORECASE)
     def part_of_speech_header_(entries):
         for word, layer, entry in entries:
             for next_layer in range(1,7):
-                header_regex = re.compile('^'+'='*next_layer+'([^=]+)'+'='*next_layer+'\\s*$', re.MULTILINE)
-                matches = header_regex.finditer(entry)
-                current = None
-                next_ = None
-                for match in itertools.chain(matches, [None]):
-                    current = next_
-                    next_ = match
-                    if current:
-                        header = current.group(1)
-                        if part_of_speech_regex.fullmatch(header):
-                            part_of_speech = header
-                            section = entry[current.end():next_.start()] if next_ else entry[current.end():]
-                            yield (word, part_of_speech), next_layer, section
+                for title, section in sections(entry, next_layer):
+                    if part_of_speech_regex.fullmatch(title):
+                        yield (word, title), next_layer, section
     return part_of_speech_header_
 
 ############################ BULLETED LIST ITEMS ###############################
@@ -146,58 +337,131 @@ def bulleted_list_items(sections):
             yield word, layer, list_item
     
 ##################################### TAGS #####################################
+# a template such as "{{IPA|en|/kæt/|a=US}}", where `text` is everything between its braces, 
+# `name` is the text before the first "|", and `arguments` are the remaining parts between "|", 
+# which are split into `positional` arguments and `named` arguments such as "a=US".
+# every field is a string or a tuple, `named` being a tuple of (name, value) pairs that `dict()` accepts, 
+# so that templates are hashable, and a template that is cached by `template()` can never be modified by its callers
+Template = collections.namedtuple('Template', 'text name arguments positional named')
+
+template_brace_pattern = re.compile('{{|}}')
+template_separator_pattern = re.compile('{{|}}|\\[\\[|\\]\\]|\\||=')
+simple_template_pattern = re.compile('{{([^{}]*)}}')
+
+# splits the `text` of a template at every "|" that is outside of any nested template or link, 
+# returning (part, equals) for each part, where `equals` is the position of the first "=" in `part` that is outside of them, or -1
+def template_parts(text):
+    parts = []
+    depth = 0
+    part_start = 0
+    equals = -1
+    for match in template_separator_pattern.finditer(text):
+        separator = match.group()
+        if separator in ('{{', '[['):
+            depth += 1
+        elif separator in ('}}', ']]'):
+            depth = max(depth-1, 0)
+        elif depth > 0:
+            continue
+        elif separator == '=':
+            equals = match.start()-part_start if equals < 0 else equals
+        else:
+            parts.append((text[part_start:match.start()], equals))
+            part_start = match.end()
+            equals = -1
+    parts.append((text[part_start:], equals))
+    return parts
+
+# parses the `text` of a template into a `Template`, the most common of which recur on many pages, so results are cached
+@functools.lru_cache(maxsize=4096)
+def template(text):
+    if '{{' in text or '[[' in text:
+        (name, _), *parts = template_parts(text)
+    elif '=' in text:
+        name, *arguments = text.split('|')
+        parts = [(argument, argument.find('=')) for argument in arguments]
+    else:
+        name, *arguments = text.split('|')
+        return Template(text, name, tuple(arguments), tuple(arguments), ())
+    arguments = tuple([argument for argument, equals in parts])
+    positional = tuple([argument for argument, equals in parts if equals < 0])
+    named = tuple([(argument[:equals], argument[equals+1:]) for argument, equals in parts if equals >= 0])
+    return Template(text, name, arguments, positional, named)
+
+def template_name(text):
+    return template(text).name if '{{' in text or '[[' in text else text.partition('|')[0]
+
+# returns the text of every template within `text`, including those nested within others, 
+# in the order that they open, scanning `text` only once, and ignoring any braces that are left unclosed.
+# results are cached, since the same text is usually passed to several stages in turn, such as `must_*` filters and `tags`,
+# and only the text of each template is kept, since most are discarded by their name without needing to be parsed by `template`
+@functools.lru_cache(maxsize=1024)
+def template_texts(text):
+    if '{{' not in text:
+        return ()
+    contents = simple_template_pattern.findall(text)
+    # most texts contain no nested templates, in which case every pair of braces is matched by the simpler pattern above
+    if (len(contents) == text.count('{{') == text.count('}}') 
+            and '{{{' not in text and '}}}' not in text):
+        return tuple(contents)
+    starts = []
+    spans = []
+    for match in template_brace_pattern.finditer(text):
+        if match.group() == '{{':
+            starts.append(match.end())
+        elif starts:
+            spans.append((starts.pop(), match.start()))
+    return tuple([text[start:end] for start, end in sorted(spans)])
+
+# returns every template within `text` as a `Template`, 
+# where "|" is only treated as a separator outside of nested templates and links, so "{{gloss|a {{m|en|cat}}}}" has one argument
+def templates_in_text(text):
+    return [template(template_text) for template_text in template_texts(text)]
+
 def tags_in_text(text):
-    pattern = re.compile('{{([^}]*)}}', re.MULTILINE | re.DOTALL)
-    matches = pattern.finditer(text)
-    for match in matches:
-        tag = match.group(1)
-        type_ = tag.split('|')[0]
-        yield tag
+    yield from template_texts(text)
 
 def tags_with_types_in_text(*types):
-    pattern = re.compile('{{([^}]*)}}', re.MULTILINE)
     def tags_of_type_(text):
-        matches = pattern.finditer(text)
-        for match in matches:
-            tag = match.group(1)
-            type_ = tag.split('|')[0]
-            if type_ in types:
+        for tag in template_texts(text):
+            if template_name(tag) in types:
                 yield tag
     return tags_of_type_
 
 def annotations_in_text(text):
-    for tag in tags_with_types_in_text('lb')(text):
-        annotations = tag.split('|')
-        if len(annotations) > 2:
-            for annotation in annotations[2:]:
-                yield annotation
+    for tag in template_texts(text):
+        if template_name(tag) == 'lb':
+            yield from template(tag).positional[1:]
+
+def templates(sections):
+    for word, layer, section in sections:
+        for tag in template_texts(section):
+            yield word, layer, template(tag)
+
+def templates_with_names(*names):
+    def templates_with_names_(sections):
+        for word, layer, section in sections:
+            for tag in template_texts(section):
+                if template_name(tag) in names:
+                    yield word, layer, template(tag)
+    return templates_with_names_
 
 def tags(sections):
-    pattern = re.compile('{{([^}]*)}}', re.MULTILINE | re.DOTALL)
     for word, layer, section in sections:
-        matches = pattern.finditer(section)
-        for match in matches:
-            tag = match.group(1)
+        for tag in template_texts(section):
             yield word, layer, tag
 
 def first_tag(sections):
-    tag_pattern = re.compile('{{([^}]*)}}', re.MULTILINE | re.DOTALL)
-    for word,section in sections:
-        tag_match = tag_pattern.search(section)
-        if tag_match:
-            tag = tag_match.group(1)
+    for word, layer, section in sections:
+        for tag in template_texts(section)[:1]:
             yield word, layer, tag
             
 def tags_with_types(*types):
-    pattern = re.compile('{{([^}]*)}}', re.MULTILINE | re.DOTALL)
     def tags_of_type_(sections):
         for word, layer, section in sections:
-            matches = pattern.finditer(section)
-            for match in matches:
-                contents = match.group(1)
-                type_ = contents.split('|')[0]
-                if type_ in types:
-                    yield word, layer, contents
+            for tag in template_texts(section):
+                if template_name(tag) in types:
+                    yield word, layer, tag
     return tags_of_type_
 
 
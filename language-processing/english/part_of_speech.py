@@ -3,10 +3,17 @@ import yaml
 
 from parse_wiktionary import *
 
-for (word, part_of_speech), layer, root in chain_compose(
-        lambda max_line_count: raw(max_line_count, filename='../enwiktionary-latest-pages-articles.xml'), 
-        pages, 
-        header2('English'),
-        part_of_speech_header('Adjective|Adverb|Noun|Verb|Interjection|Numeral|Conjunction|Determiner|Preposition|Particle|Pronoun|Phrase'),
-    )(1e9):
-    print(f'{word.lower()}\t{part_of_speech.lower()}')
+def lines(entries):
+    for (word, part_of_speech), layer, root in chain_compose(
+            header2('English'),
+            part_of_speech_header('Adjective|Adverb|Noun|Verb|Interjection|Numeral|Conjunction|Determiner|Preposition|Particle|Pronoun|Phrase'),
+        )(entries):
+        yield f'{word.lower()}\t{part_of_speech.lower()}'
+
+if __name__ == '__main__':
+    for line in chain_compose(
+            lambda max_line_count: raw(max_line_count, filename='../enwiktionary-latest-pages-articles.xml'), 
+            pages, 
+            lines,
+        )(1e9):
+        print(line)
@@ -97,6 +97,7 @@ def narrow(pronunciations):
     ai_regex = re.compile('[aɑɒɔɐ][iɪ]')
     ei_regex = re.compile('[eʌɛəɜ][iɪ]')
     for word, layer, pronunciation in sound_law(pronunciations, True):
+        simplification = pronunciation
         for old, new in replacements:
             simplification = simplification.replace(old, new)
         simplification = au_regex.sub('au', simplification)
@@ -27,24 +27,21 @@ def bulleted_list_items_with_text(text):
 def bulleted_list_items_without_text(*text):
     return chain_compose(bulleted_list_items, must_not_include_any_of_text(*text))
 
-def ipa_pronunciation(pronunciation_tags):
-    for word, layer, tag in pronunciation_tags:
-        split = tag.split('|')
-        if len(split) >= 3:
-            type_, language, *pronunciations = split
-            if language == 'en':
-                if type_ == 'IPA':
-                    pronunciations = [pronunciation.strip('/').strip('[').strip(']') 
-                        for pronunciation in pronunciations 
-                        if '=' not in pronunciation]
-                    if pronunciations:
-                        yield word, layer, pronunciations[0]
-                if type_ == 'audio-IPA':
-                    pronunciations = [pronunciation.strip('/').strip('[').strip(']') 
-                        for pronunciation in pronunciations
-                        if not any(excluded in pronunciation for excluded in ['.ogg', '.wav', '='])]
-                    if pronunciations:
-                        yield word, layer, pronunciations[0]
+def ipa_pronunciation(pronunciation_templates):
+    for word, layer, template in pronunciation_templates:
+        language, *pronunciations = template.positional or ['']
+        if language == 'en':
+            if template.name == 'IPA':
+                pronunciations = [pronunciation.strip('/').strip('[').strip(']') 
+                    for pronunciation in pronunciations]
+                if pronunciations:
+                    yield word, layer, pronunciations[0]
+            if template.name == 'audio-IPA':
+                pronunciations = [pronunciation.strip('/').strip('[').strip(']') 
+                    for pronunciation in pronunciations
+                    if not any(excluded in pronunciation for excluded in ['.ogg', '.wav'])]
+                if pronunciations:
+                    yield word, layer, pronunciations[0]
 
 nonstandard_pronunciations = ['Maine', 'Appalachian', 'Philadelphia', 'New York City',
     'Southern US', 'Southern American English', 
@@ -53,45 +50,53 @@ nonstandard_pronunciations = ['Maine', 'Appalachian', 'Philadelphia', 'New York
     'UK', 'Ireland', 'West Country', 'Northern England', 'Northern UK', 
     'non-rhotic', 'near-square', 'obsolete', 'colloquial', 'nonstandard', 'unstressed', 'archaic']
 
-for word, layer, pronunciation in chain_compose( 
-        lambda max_line_count: raw(max_line_count, filename='../../enwiktionary-latest-pages-articles.xml'), 
-        pages, 
-        try_fallbacks(
-            header2('English'),
-            preheader,
-        ),
-        must_not_include_any_of_text('{{initialism of|'),
-        anyheader('Pronunciation'),
-        try_fallbacks(
-            accent_header('|GenAm'),
-            accent_header('|GA'),
-            accent_header('|US'),
-            accent_header('|Northern US'),
-            accent_header('|Canada'),
-            accent_header('|CA'),
-            accent_header('|rhotic'),
-            accent_without_header(*nonstandard_pronunciations),
-            identity,
-        ),
-        try_fallbacks(
-            bulleted_list_items_with_text('|GenAm'), 
-            bulleted_list_items_with_text('|GA'), 
-            bulleted_list_items_with_text('|US'), 
-            bulleted_list_items_with_text('|Northern US'), 
-            bulleted_list_items_with_text('|Canada'), 
-            bulleted_list_items_with_text('|CA'), 
-            bulleted_list_items_with_text('|rhotic'), 
-            bulleted_list_items_without_text(*nonstandard_pronunciations), 
-        ),
-        tags, 
-        ipa_pronunciation,
-        ipa_hash.sound_law,
-        unique,
-    )(1e9):
-    tweaked = pronunciation.replace(' ', '')
-    tweaked = pronunciation.replace('ʔ', 't')
-    tweaked = pronunciation.replace('nʒ', 'ndʒ')
-    tweaked = pronunciation.replace('nʃ', 'ntʃ')
-    print(f'{tweaked}\t{word.lower()}')
-    # print(f'{word.upper():<15} {pronunciation}')
-    
+def lines(entries):
+    for word, layer, pronunciation in chain_compose(
+            parallel(
+                try_fallbacks(
+                    header2('English'),
+                    preheader,
+                ),
+                must_not_include_any_of_text('{{initialism of|'),
+                anyheader('Pronunciation'),
+                try_fallbacks(
+                    accent_header('|GenAm'),
+                    accent_header('|GA'),
+                    accent_header('|US'),
+                    accent_header('|Northern US'),
+                    accent_header('|Canada'),
+                    accent_header('|CA'),
+                    accent_header('|rhotic'),
+                    accent_without_header(*nonstandard_pronunciations),
+                    identity,
+                ),
+                try_fallbacks(
+                    bulleted_list_items_with_text('|GenAm'), 
+                    bulleted_list_items_with_text('|GA'), 
+                    bulleted_list_items_with_text('|US'), 
+                    bulleted_list_items_with_text('|Northern US'), 
+                    bulleted_list_items_with_text('|Canada'), 
+                    bulleted_list_items_with_text('|CA'), 
+                    bulleted_list_items_with_text('|rhotic'), 
+                    bulleted_list_items_without_text(*nonstandard_pronunciations), 
+                ),
+                templates_with_names('IPA', 'audio-IPA'), 
+                ipa_pronunciation,
+                ipa_hash.sound_law,
+            ),
+            unique,
+        )(entries):
+        tweaked = pronunciation.replace(' ', '')
+        tweaked = pronunciation.replace('ʔ', 't')
+        tweaked = pronunciation.replace('nʒ', 'ndʒ')
+        tweaked = pronunciation.replace('nʃ', 'ntʃ')
+        yield f'{tweaked}\t{word.lower()}'
+        # yield f'{word.upper():<15} {pronunciation}'
+
+if __name__ == '__main__':
+    for line in chain_compose(
+            lambda max_line_count: raw(max_line_count, filename='../../enwiktionary-latest-pages-articles.xml'), 
+            pages, 
+            lines,
+        )(1e9):
+        print(line)
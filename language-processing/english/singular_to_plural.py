@@ -8,17 +8,21 @@ def plurals(plural_tags):
             if language == 'en' and type_ == 'plural of':
                 yield word, layer, singular
 
-for plural, layer, singular in chain_compose( 
-        raw, pages, 
-        header2('English'),
-        anyheader('Noun'), 
-        # preheader, 
-        bulleted_list_items, 
-        must_not_include_any_of_annotations(*ignored_annotations), 
-        must_not_include_abbreviations,
-        tags,
-        plurals
-    )(1e9):
-    print(f'{singular.lower()}\t{plural}')
-    # print(f'{plural.upper():<15} {singular}')
+def lines(entries):
+    for plural, layer, singular in chain_compose( 
+            header2('English'),
+            anyheader('Noun'), 
+            # preheader, 
+            bulleted_list_items, 
+            must_not_include_any_of_annotations(*ignored_annotations), 
+            must_not_include_abbreviations,
+            tags,
+            plurals
+        )(entries):
+        yield f'{singular.lower()}\t{plural}'
+        # yield f'{plural.upper():<15} {singular}'
+
+if __name__ == '__main__':
+    for line in chain_compose(raw, pages, lines)(1e9):
+        print(line)
 
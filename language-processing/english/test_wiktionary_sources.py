@@ -0,0 +1,101 @@
+import functools
+
+import pytest
+
+import wiktionary_sources
+from parse_wiktionary import pages
+
+# a few pages in the manner of the dump, with the sections that each of the registered sources reads
+sample_pages = [
+    ('cat', '''==English==
+
+===Etymology===
+From {{inh|en|enm|cat}}, from {{inh|en|ang|catt}}, from {{der|en|la|cattus}}.
+
+===Pronunciation===
+* {{a|UK}} {{IPA|en|/kæt/}}
+* {{a|GenAm}} {{IPA|en|/kæt/|[kʰæʔ]}}
+* {{audio|en|En-us-cat.ogg|Audio (US)}}
+
+===Noun===
+{{en-noun}}
+
+# A small domesticated [[carnivorous]] [[mammal]].
+
+====Translations====
+{{trans-top|mammal}}
+* French: {{t+|fr|chat|m}}, {{t+|fr|chatte|f}}
+* Spanish: {{t+|es|gato|m}}
+* Latin: {{t|la|fēlēs|f}}
+{{trans-bottom}}
+
+===Verb===
+{{en-verb|cats|catting|catted}}
+
+# To [[hoist]] an anchor.
+'''),
+    ('cats', '''==English==
+
+===Pronunciation===
+* {{a|GenAm}} {{IPA|en|/kæts/}}
+
+===Noun===
+{{head|en|noun form}}
+
+# {{plural of|en|cat}}
+
+===Verb===
+{{head|en|verb form}}
+
+# {{inflection of|en|cat||3|s|pres|ind}}
+'''),
+    ('ran', '''==English==
+
+===Pronunciation===
+* {{IPA|en|/ɹæn/}}
+
+===Verb===
+{{head|en|verb form}}
+
+# {{past of|en|run}}
+'''),
+    ('chat', '''==French==
+
+===Etymology===
+From {{inh|fr|frm|chat}}.
+
+===Noun===
+{{fr-noun|m}}
+
+# [[cat]]
+
+===Verb===
+{{head|fr|verb form}}
+
+# {{fr-verb form of|chatter}}
+'''),
+    ('gatos', '''==Spanish==
+
+===Noun===
+{{head|es|noun form|g=m-p}}
+
+# {{plural of|es|gato}}
+'''),
+    ('cat/translations', '''==English==
+
+===Noun===
+{{trans-see|cat}}
+
+====Translations====
+{{trans-top|mammal}}
+* German: {{t+|de|Katze|f}}
+{{trans-bottom}}
+'''),
+]
+
+@pytest.mark.parametrize('name', sorted(wiktionary_sources.sources))
+def test_source_lines(name):
+    script, output, directory, arguments = wiktionary_sources.sources[name]
+    lines = functools.partial(wiktionary_sources.load(script, directory).lines, **arguments)
+    for line in lines(pages(sample_pages)):
+        assert isinstance(line, str)
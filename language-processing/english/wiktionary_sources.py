@@ -0,0 +1,124 @@
+'''
+"wiktionary_sources.py" regenerates every source that is derived from the wiktionary dump in a single pass over the dump,
+rather than one pass for each of the scripts below, which may still be run individually as before.
+This includes the english extractors in this directory, the pronunciations in "pronunciation/",
+the peg words in "mneumonic-pegs/", and the vocabulary sources of each language in "language-learning/data/vocabulary/".
+A source that fails is reported and keeps its previous output, while the remaining sources are still written.
+
+Usage:
+    python3 wiktionary_sources.py                                              # regenerate every source
+    python3 wiktionary_sources.py ../enwiktionary-latest-pages-articles.xml part_of_speech plural_to_singular
+    python3 wiktionary_sources.py ../enwiktionary-latest-pages-articles.xml french/translation ipa_strict_us_pronunciation_to_word
+    python3 wiktionary_sources.py ../enwiktionary-latest-pages-articles-multistream.xml.bz2   # read the compressed dump
+'''
+
+import os
+import re
+import sys
+import glob
+import yaml
+import functools
+import traceback
+import importlib.util
+
+from parse_wiktionary import *
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+# a source is the script whose `lines` it is written from, the file it is written to,
+# the directory from which the script imports its own copy of "parse_wiktionary.py",
+# and any other arguments to `lines`, where paths are relative to this directory
+def source(script, output, directory=None, **arguments):
+    directory = os.path.normpath(os.path.join(here, directory or os.path.dirname(script)))
+    return os.path.normpath(os.path.join(here, script)), os.path.normpath(os.path.join(here, output)), directory, arguments
+
+sources = {
+    'inflection_to_root':            source('inflection_to_root.py', 'inflection_to_root.tsv'),
+    'inflection_to_root_tag':        source('inflection_to_root_tag.py', 'inflection_to_root_tag.txt'),
+    'inflection_to_source_language': source('inflection_to_source_language.py', 'inflection_to_source_language.tsv'),
+    'part_of_speech':                source('part_of_speech.py', 'part_of_speech.tsv'),
+    'plural_to_singular':            source('plural_to_singular.py', 'plural_to_singular.tsv'),
+    'root_to_inflection':            source('root_to_inflection.py', 'root_to_inflection.tsv'),
+    'singular_to_plural':            source('singular_to_plural.py', 'singular_to_plural.tsv'),
+    'ipa_broad_pronunciation_to_word':     source('pronunciation/ipa_broad_pronunciation_to_word.py',
+                                               'pronunciation/ipa_broad_pronunciation_to_word.txt'),
+    'ipa_mispronunciation_to_word':        source('pronunciation/ipa_mispronunciation_to_word.py',
+                                               'pronunciation/ipa_mispronunciation_to_word.txt'),
+    'ipa_narrow_us_pronunciation_to_word': source('pronunciation/ipa_narrow_us_pronunciation_to_word.py',
+                                               'pronunciation/ipa_narrow_us_pronunciation_to_word.tsv'),
+    'ipa_strict_us_pronunciation_to_word': source('pronunciation/ipa_strict_us_pronunciation_to_word.py',
+                                               'pronunciation/ipa_strict_us_pronunciation_tow_word.tsv'),
+    'number_to_peg_word':                  source('../../mneumonic-pegs/number_to_peg_word.py',
+                                               '../../mneumonic-pegs/number_to_peg_word.txt', 'pronunciation'),
+}
+
+# the vocabulary sources of each language are named after the language's directory, e.g. "french/translation",
+# and are written to the files named by the language's "language.yaml"
+vocabulary = '../../language-learning/data/vocabulary'
+vocabulary_scripts = {
+    'standardize':    'standardize.py',
+    'part_of_speech': 'part_of_speech.py',
+    'definition':     'vocabulary_definition_source.py',
+    'translation':    'vocabulary_translation_source.py',
+}
+for config_filename in sorted(glob.glob(os.path.join(here, vocabulary, '*', 'language.yaml'))):
+    language = os.path.relpath(os.path.dirname(config_filename), here)
+    with open(config_filename, 'r') as config_file:
+        foreign_language = yaml.safe_load(config_file)
+    for key, script in vocabulary_scripts.items():
+        if key in foreign_language:
+            sources[f'{os.path.basename(language)}/{key}'] = source(os.path.join(vocabulary, script),
+                os.path.join(language, foreign_language[key]), foreign_language=foreign_language)
+
+# imports `script` while `directory` provides its "parse_wiktionary.py" and any other modules it imports,
+# since each directory keeps its own copy of "parse_wiktionary.py", which must not be confused with the copy that is used here
+@functools.lru_cache(maxsize=None)
+def load(script, directory):
+    shadowed = sys.modules.pop('parse_wiktionary', None)
+    sys.path.insert(0, directory)
+    try:
+        name = re.sub('\\W', '_', os.path.splitext(os.path.relpath(script, here))[0])
+        specification = importlib.util.spec_from_file_location(name, script)
+        module = importlib.util.module_from_spec(specification)
+        specification.loader.exec_module(module)
+        return module
+    finally:
+        sys.path.remove(directory)
+        if shadowed is not None:
+            sys.modules['parse_wiktionary'] = shadowed
+
+# runs `consumer`, recording the traceback of any error within `failures`
+# so that one source that fails does not prevent the others from being written
+def reported(name, consumer, failures):
+    def reported_(entries):
+        try:
+            consumer(entries)
+        except Exception:
+            failures[name] = traceback.format_exc()
+    return reported_
+
+if __name__ == '__main__':
+    filename = sys.argv[1] if len(sys.argv) > 1 else '../enwiktionary-latest-pages-articles.xml'
+    selected = sys.argv[2:] if len(sys.argv) > 2 else list(sources)
+    unknown = [name for name in selected if name not in sources]
+    if unknown:
+        sys.exit(f'unknown sources: {" ".join(unknown)}')
+    reader = multistream if filename.endswith('.bz2') else raw
+    consumers = []
+    failures = {}
+    for name in selected:
+        script, output, directory, arguments = sources[name]
+        try:
+            lines = functools.partial(load(script, directory).lines, **arguments)
+        except Exception:
+            failures[name] = traceback.format_exc()
+            continue
+        consumers.append(reported(name, write_lines(output, lines), failures))
+    fan_out(pages(reader(1e9, filename=filename)), *consumers)
+    for name in selected:
+        if name in failures:
+            print(f'{name} failed:')
+            print(failures[name])
+    print(f'{len(selected)-len(failures)} sources written, {len(failures)} failed')
+    if failures:
+        sys.exit(1)
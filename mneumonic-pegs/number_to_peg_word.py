@@ -1,17 +1,15 @@
 from parse_wiktionary import *
 from ipa_hash import *
 
-def ipa_pronunciation(pronunciation_tags):
-    for word, layer, tag in pronunciation_tags:
-        split = tag.split('|')
-        if len(split) >= 3:
-            type_, language, *pronunciations = split
-            if language == 'en' and type_ == 'IPA':
-                for pronunciation in pronunciations:
-                    yield word, layer, pronunciation.strip('/').strip('[').strip(']')
+def ipa_pronunciation(pronunciation_templates):
+    for word, layer, template in pronunciation_templates:
+        language, *pronunciations = template.positional or ['']
+        if language == 'en':
+            for pronunciation in pronunciations:
+                yield word, layer, pronunciation.strip('/').strip('[').strip(']')
 
 def ipa_peg_hash(pronunciations):
-    for word, layer, pronunciation in ipa_narrow_hash(pronunciations):
+    for word, layer, pronunciation in narrow(pronunciations):
         simplification = pronunciation
         simplification = re.compile('[aeiouæɑɒʌɛɪɔʊəɜhjwy ]+').sub('', simplification)
         simplification = re.compile('[td]?[ʃʒ]').sub('6', simplification)
@@ -27,20 +25,29 @@ def ipa_peg_hash(pronunciations):
         if len(simplification) > 0 and not re.compile('\\D').search(simplification):
             yield word, layer, simplification
 
-for word, layer, number in chain_compose( 
-        lambda: raw(filename='../enwiktionary-latest-pages-articles.xml'), pages, 
-        header2('English'),
-        anyheader('Pronunciation'), 
-        bulleted_list_items, 
-        must_not_include_any_of_text('|RP', '|NZ', '|AU', '|UK', 
-            '|Australia', '|New Zealand', '|Tasmanian', 
-            '|non-rhotic', '|near-square'), 
-        tags, 
-        ipa_pronunciation,
-        ipa_peg_hash,
-        unique,
-        lambda pegs:  sorted(pegs, key=lambda peg: int(peg[2]))
-    )(1e9):
-    print(f'{number}\t{word}')
-    # print(f'{word.upper():<15} {pronunciation}')
-    
+def lines(entries):
+    for word, layer, number in chain_compose(
+            parallel(
+                header2('English'),
+                anyheader('Pronunciation'), 
+                bulleted_list_items, 
+                must_not_include_any_of_text('|RP', '|NZ', '|AU', '|UK', 
+                    '|Australia', '|New Zealand', '|Tasmanian', 
+                    '|non-rhotic', '|near-square'), 
+                templates_with_names('IPA'), 
+                ipa_pronunciation,
+                ipa_peg_hash,
+            ),
+            unique,
+            lambda pegs:  sorted(pegs, key=lambda peg: int(peg[2]))
+        )(entries):
+        yield f'{number}\t{word}'
+        # yield f'{word.upper():<15} {pronunciation}'
+
+if __name__ == '__main__':
+    for line in chain_compose(
+            lambda max_line_count: raw(max_line_count, filename='../enwiktionary-latest-pages-articles.xml'), 
+            pages, 
+            lines,
+        )(1e9):
+        print(line)